@@ -19,38 +19,139 @@ AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY
 TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
-from .networks import *
-from .session import *
-from .layouts import *
-from .network_selection import *
-from .tables import *
-from .commands import *
-from .cytoscape_system import *
-from .apps import *
-from .collections import *
-from .filters import *
-from .groups import *
-from .tools import *
-from .user_interface import *
-from .network_views import *
-from .styles import *
-from .style_mappings import *
-from .style_auto_mappings import *
-from .style_defaults import *
-from .style_values import *
-from .style_dependencies import *
-from .style_bypasses import *
-from .py4cytoscape_utils import *
-from .cy_ndex import *
-from .decorators import *
-from .py4cytoscape_notebook import get_browser_client_js, get_browser_client_channel, get_jupyter_bridge_url, get_notebook_is_running, set_notebook_is_running
-from .py4cytoscape_logger import set_summary_logger
-from .sandbox import *
-from .py4cytoscape_sandbox import *
-from .py4cytoscape_tuning import set_catchup_filter_secs, set_catchup_network_secs, set_model_propagation_secs
+# The package exposes every public function of its modules as py4cytoscape.xxx, but imports a module only when one of
+# its names is first used. This keeps "import py4cytoscape" cheap for programs that use only a few functions, as
+# the modules together pull in pandas, numpy, requests and others.
+
+import importlib
+import importlib.util
+import os
+import re
+import types
+
 from ._version import __version__
-from .notebook import *
-from .annotations import *
+
+# Modules whose public names are all exported by the package, in the order of the star imports this replaces ... a
+# name found in a later module hides the same name in an earlier module
+_EXPORTED_MODULES = ['networks', 'session', 'layouts', 'network_selection', 'tables', 'commands', 'cytoscape_system',
+                     'apps', 'collections', 'filters', 'groups', 'tools', 'user_interface', 'network_views', 'styles',
+                     'style_mappings', 'style_auto_mappings', 'style_defaults', 'style_values', 'style_dependencies',
+                     'style_bypasses', 'py4cytoscape_utils', 'cy_ndex', 'decorators', 'sandbox',
+                     'py4cytoscape_sandbox', 'notebook', 'annotations']
+
+# Individual names exported from modules whose other names are internal
+_EXPORTED_NAMES = {name: module
+                   for module, names in {
+                       'py4cytoscape_notebook': ['get_browser_client_js', 'get_browser_client_channel',
+                                                 'get_jupyter_bridge_url', 'get_notebook_is_running',
+                                                 'set_notebook_is_running', 'set_jupyter_bridge_request_mode',
+                                                 'get_jupyter_bridge_request_mode'],
+                       'py4cytoscape_logger': ['set_summary_logger'],
+                       'py4cytoscape_tuning': ['set_catchup_filter_secs', 'set_catchup_network_secs',
+                                               'set_model_propagation_secs', 'set_vocabulary_cache_dir',
+                                               'set_view_image_cache_size', 'set_table_cache_dir',
+                                               'set_file_transport_element_count'],
+                       'py4cytoscape_cache': ['clear_caches'],
+                   }.items()
+                   for name in names}
+
+# Names that the star imports exported although the exported modules import them from elsewhere. Other imported names
+# (e.g., cache helpers and standard library modules used internally) aren't exported. Names defined at the top level of
+# the modules in _REEXPORTED_MODULES are exported, too, as py4cytoscape_utils star-imports them.
+_REEXPORTED_NAMES = {'CATCHUP_FILTER_SECS', 'CATCHUP_NETWORK_MERGE_SECS', 'CATCHUP_NETWORK_SECS',
+                     'CATCHUP_NETWORK_TIMEOUT_SECS', 'MODEL_PROPAGATION_SECS', 'Color', 'CyError', 'ExecutionEnvironment',
+                     'HTTPStatus', 'backoff', 'base64', 'check_execution_environment', 'colorbrewer', 'cy_log',
+                     'decorator', 'df', 'do_request_jupyter_bridge', 'do_requests_jupyter_bridge',
+                     'execution_environment', 'functools', 'json', 'log_http_request', 'log_http_result', 'narrate',
+                     'np', 'os', 'pd', 'random', 're', 'requests', 'show_error', 'sys', 'time', 'urllib', 'warnings',
+                     'webbrowser'}
+_REEXPORTED_MODULES = ['style_visual_props']
+
+# Third-party modules that were exported under these names because networks imported them at its top level. They're
+# now imported only when first used.
+_EXPORTED_LIBRARIES = {'nx': 'networkx', 'ig': 'igraph'}
+
+_DEFINITION_PATTERN = re.compile(r'^(?:def|class)\s+([A-Za-z]\w*)|^([A-Za-z]\w*)\s*=(?!=)', re.MULTILINE)
+_module_definitions = {}
+_defining_module = None
+
+def _find_definitions(module):
+    # Return the names defined at the top level of a module, by scanning its source so the module itself needn't be
+    # imported, or None if its source isn't available (e.g., frozen package)
+    if module not in _module_definitions:
+        try:
+            with open(os.path.join(os.path.dirname(__file__), module + '.py'), encoding='utf-8') as file:
+                source = file.read()
+        except OSError:
+            _module_definitions[module] = None
+        else:
+            _module_definitions[module] = {match.group(1) or match.group(2)
+                                           for match in _DEFINITION_PATTERN.finditer(source)}
+    return _module_definitions[module]
+
+def _find_defining_module(name):
+    # Return the module that exports a name. Return None if the name isn't defined at the top level of any exported
+    # module (or the module's source isn't available, in which case the name will be found by importing).
+    global _defining_module
+    if _defining_module is None:
+        _defining_module = {}
+        for module in _EXPORTED_MODULES:
+            _defining_module.update(dict.fromkeys(_find_definitions(module) or [], module))
+        _defining_module.update(_EXPORTED_NAMES)
+    return _defining_module.get(name)
+
+def _import_all():
+    # Import every exported module, and return all exported names with their values, as the star imports would have:
+    # each module's own definitions, the names in _REEXPORTED_NAMES, and the package's submodules
+    reexported = set(_REEXPORTED_NAMES)
+    for module in _REEXPORTED_MODULES:
+        reexported.update(_find_definitions(module) or [])
+    exported = {}
+    for module_name in _EXPORTED_MODULES:
+        module = importlib.import_module('.' + module_name, __name__)
+        definitions = _find_definitions(module_name)
+        exported.update({name: value for name, value in vars(module).items()
+                         if not name.startswith('_') and (definitions is None or name in definitions or
+                                                          name in reexported or _is_submodule(name, value))})
+    for name, module in _EXPORTED_NAMES.items():
+        exported[name] = getattr(importlib.import_module('.' + module, __name__), name)
+    exported.update({name: value for name, value in globals().items()
+                     if not name.startswith('_') and _is_submodule(name, value)})
+    exported.update({name: importlib.import_module(library) for name, library in _EXPORTED_LIBRARIES.items()
+                     if importlib.util.find_spec(library) is not None})
+    return exported
+
+def _is_submodule(name, value):
+    # Return whether value is the py4cytoscape submodule having the name (e.g., py4cytoscape.commands)
+    return isinstance(value, types.ModuleType) and value.__name__ == f'{__name__}.{name}'
+
+def __getattr__(name):
+    if name == '__all__':
+        exported = _import_all()
+        globals().update(exported)
+        return sorted(exported)
+    if name.startswith('__'):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = _find_defining_module(name)
+    if module is not None:
+        value = getattr(importlib.import_module('.' + module, __name__), name)
+    elif name in _EXPORTED_LIBRARIES:
+        value = importlib.import_module(_EXPORTED_LIBRARIES[name])
+    elif importlib.util.find_spec('.' + name, __name__) is not None:
+        value = importlib.import_module('.' + name, __name__) # A submodule, e.g., py4cytoscape.commands
+    else:
+        # Names that modules import from elsewhere (e.g., CyError) were exported by the star imports, too
+        exported = _import_all()
+        if name not in exported:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = exported[name]
+
+    globals()[name] = value # Later lookups needn't come back here
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__getattr__('__all__')))
 
 # Note that we have tried to enforce documentation standards for modules and private functions per:
 # https://www.python.org/dev/peps/pep-0257/ and https://www.python.org/dev/peps/pep-0008/#comments
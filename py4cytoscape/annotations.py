@@ -23,6 +23,9 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 
 # External library imports
 import re
+import sys
+import numpy as np
+import pandas as pd
 
 # Internal module imports
 from . import commands
@@ -498,7 +501,7 @@ def ungroup_annotation(names=None, network=None, base_url=DEFAULT_BASE_URL):
         >>> ungroup_annotation('016a4af1-69bc-4b99-8183-d6f118847f96', network=59945)
     """
 
-    cmd_string, net_suid = _build_base_cmd_string('annotation ungroup', network, base_url)  # a good start
+    batch = _AnnotationBatch(network, base_url)
 
     if names is None:
         raise CyError(f'Must provide the UUID (or list of UUIDs) to ungroup')
@@ -506,8 +509,7 @@ def ungroup_annotation(names=None, network=None, base_url=DEFAULT_BASE_URL):
     if isinstance(names, str):  # If it's a string, force it into a list
         names = [names]
 
-    for ann in names:
-        commands.commands_get(f'{cmd_string} uuidOrName="{ann}"', base_url=base_url)
+    commands._do_commands_post_batch([batch.ungroup_cmd(ann) for ann in names], base_url=base_url)
 
 
 @cy_log
@@ -907,6 +909,127 @@ def update_group_annotation(name=None, annotation_name=None, x_pos=None, y_pos=N
 
     return res
 
+
+@cy_log
+def add_annotations(annotations, network=None, base_url=DEFAULT_BASE_URL, *, annotation_type=None):
+    """Add Many Annotations
+
+    Adds a text, bounded text, image or shape annotation to a Cytoscape network view for each row of a dataframe.
+    This is equivalent to calling ``add_annotation_text()``, ``add_annotation_bounded_text()``,
+    ``add_annotation_image()`` or ``add_annotation_shape()`` once per row, except that all rows are validated before
+    any annotation is added, the view's annotations are fetched once (instead of once per named annotation) to check
+    name uniqueness, and the annotations are sent to Cytoscape together.
+
+    Args:
+        annotations (dataframe): One row per annotation. Columns have the same names and values as the parameters of
+            the corresponding ``add_annotation_*()`` function (e.g., ``text``, ``x_pos``, ``y_pos``, ``fill_color``),
+            plus an optional ``annotation_type`` column. A missing value (None or NaN) is the same as omitting
+            the parameter.
+        network (SUID or str or None): Name or SUID of the network. Default is the "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://localhost:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        annotation_type (str): Kind of annotation for rows that have no ``annotation_type`` value: 'text',
+            'bounded_text', 'image' or 'shape'
+
+    Returns:
+        list: A named list of annotation properties, including UUID, for each row in ``annotations``
+
+    Raises:
+        CyError: if network name doesn't exist, a name isn't unique, or error in a column name or value
+        requests.exceptions.HTTPError: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> add_annotations(pd.DataFrame({'text': ['ann1', 'ann2'], 'x_pos': [100, 200], 'y_pos': [100, 200]}), annotation_type='text')
+        [{'canvas': 'foreground', 'color': '#000000', 'rotation': '0.0', 'type': 'org.cytoscape.view.presentation.annotations.TextAnnotation', 'fontStyle': 'plain', 'uuid': '7e1c8e5e-1ec9-4a2b-93c6-22ac1d7e3e0f', 'fontFamily': 'Arial', 'name': 'Text', 'x': '100.0', 'y': '100.0', 'z': '0', 'fontSize': '12', 'text': 'ann1'}, ...]
+        >>> add_annotations(pd.DataFrame({'annotation_type': ['shape', 'text'], 'type': ['ELLIPSE', None], 'text': [None, 'label'], 'name': ['circle', 'label']}))
+        [{'edgeThickness': '1.0', 'canvas': 'foreground', 'fillOpacity': '100.0', 'rotation': '0.0', 'type': 'org.cytoscape.view.presentation.annotations.ShapeAnnotation', 'uuid': 'c2c5b2e6-2f1b-4b2e-a0b4-6a3d0b5a35b8', 'shapeType': 'ELLIPSE', ...}, ...]
+
+    See Also:
+        :meth:`update_annotations`, :meth:`delete_annotations`
+    """
+    batch = _AnnotationBatch(network, base_url)
+    cmds = [batch.add_cmd(ann, annotation_type) for ann in _annotation_rows(annotations)]
+    return commands._do_commands_post_batch(cmds, base_url=base_url)
+
+
+@cy_log
+def update_annotations(annotations, network=None, base_url=DEFAULT_BASE_URL):
+    """Update Many Annotations
+
+    Updates an existing annotation in a Cytoscape network view for each row of a dataframe. This is equivalent to
+    calling ``update_annotation_text()``, ``update_annotation_bounded_text()``, ``update_annotation_image()``,
+    ``update_annotation_shape()`` or ``update_group_annotation()`` once per row, except that the kind of each
+    annotation is looked up instead of being given, all rows are validated before any annotation is updated, the
+    view's annotations are fetched only once, and the updates are sent to Cytoscape together.
+
+    Args:
+        annotations (dataframe): One row per annotation, with an ``annotation_name`` column containing the UUID or
+            name of the annotation to update. The remaining columns have the same names and values as the parameters
+            of the corresponding ``update_annotation_*()`` function. A missing value (None or NaN) is the same as
+            omitting the parameter.
+        network (SUID or str or None): Name or SUID of the network. Default is the "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://localhost:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        list: A named list of annotation properties, including UUID, for each row in ``annotations``
+
+    Raises:
+        CyError: if network name doesn't exist, an annotation doesn't exist, or error in a column name or value
+        requests.exceptions.HTTPError: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> update_annotations(pd.DataFrame({'annotation_name': ['ann1', 'ann2'], 'angle': [45, 90], 'x_pos': [100, 200], 'y_pos': [100, 200]}))
+        [{'canvas': 'foreground', 'color': '#000000', 'rotation': '45.0', 'type': 'org.cytoscape.view.presentation.annotations.TextAnnotation', 'fontStyle': 'plain', 'uuid': '7e1c8e5e-1ec9-4a2b-93c6-22ac1d7e3e0f', 'fontFamily': 'Arial', 'name': 'ann1', 'x': '100.0', 'y': '100.0', 'z': '0', 'fontSize': '12', 'text': 'ann1'}, ...]
+
+    See Also:
+        :meth:`add_annotations`, :meth:`delete_annotations`
+    """
+    batch = _AnnotationBatch(network, base_url)
+    cmds = [batch.update_cmd(ann) for ann in _annotation_rows(annotations)]
+    return commands._do_commands_post_batch(cmds, base_url=base_url)
+
+
+@cy_log
+def delete_annotations(names=None, base_url=DEFAULT_BASE_URL):
+    """Delete Many Annotations
+
+    Remove annotations from the current network view in Cytoscape. Unlike ``delete_annotation()``, all names are
+    checked against the view's annotations before any annotation is deleted, and the deletions are sent to Cytoscape
+    together.
+
+    Args:
+        names (UUID or str or list): Single UUID or str, or list of UUIDs or str
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://localhost:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        None
+
+    Raises:
+        CyError: if invalid name list or an annotation doesn't exist
+        requests.exceptions.HTTPError: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> delete_annotations(['ann1', 'ann2'])
+        >>> delete_annotations(['016a4af1-69bc-4b99-8183-d6f118847f96', '016a4af1-69bc-4b99-8183-d6f118847f97'])
+
+    See Also:
+        :meth:`add_annotations`, :meth:`update_annotations`
+    """
+    if names is None:
+        raise CyError('Must provide the UUID (or list of UUIDs) to delete')
+
+    if isinstance(names, str):  # If it's a string, force it into a list
+        names = [names]
+
+    batch = _AnnotationBatch(None, base_url)
+    cmds = [batch.delete_cmd(ann) for ann in names]
+    commands._do_commands_post_batch(cmds, base_url=base_url)
+
 # -------------------------------------------------------------------
 
 def _build_base_cmd_string(base_command, network, base_url):
@@ -919,145 +1042,182 @@ def _build_base_cmd_string(base_command, network, base_url):
     return base_command, net_suid
 
 
+def _args_cmd_string(args):
+    # Turn (name, value) command arguments into the text of a command string
+    return ''.join(f' {name}="{value}"' for name, value in args)
+
+
 def _get_x_y_pos_cmd_string(x_pos, y_pos, net_suid, base_url):
-    if x_pos is None:
-        x_pos = style_values.get_network_center(net_suid, base_url=base_url)['x']
-    if y_pos is None:
-        y_pos = style_values.get_network_center(net_suid, base_url=base_url)['y']
-    return f' x="{x_pos}" y="{y_pos}"'
+    return _args_cmd_string(_get_x_y_pos_args(x_pos, y_pos, net_suid, base_url))
 
 
-def _get_type_cmd_string(type, base_url):
+def _get_x_y_pos_args(x_pos, y_pos, net_suid, base_url, center=None):
+    if x_pos is None or y_pos is None:
+        if center is None:
+            center = style_values.get_network_center(net_suid, base_url=base_url)
+        if x_pos is None: x_pos = center['x']
+        if y_pos is None: y_pos = center['y']
+    return [('x', x_pos), ('y', y_pos)]
+
+
+def _get_type_cmd_string(type, base_url, node_shapes=None):
+    return _args_cmd_string(_get_type_args(type, base_url, node_shapes))
+
+
+def _get_type_args(type, base_url, node_shapes=None):
     if type is None:
-        return ''
+        return []
     else:
         type = type.upper()
-        if type not in styles.get_node_shapes(base_url=base_url):
+        if node_shapes is None:
+            node_shapes = styles.get_node_shapes(base_url=base_url)
+        if type not in node_shapes:
             raise CyError(f'{type} is invalid. Choose a shape from get_node_shapes()')
         if type == 'ROUND_RECTANGLE':
             type = 'Rounded Rectangle'
         elif type == 'VEE':
             type = 'V'
-        return f' type="{type}"'
+        return [('type', type)]
 
 
 def _get_z_order_cmd_string(z_order):
+    return _args_cmd_string(_get_z_order_args(z_order))
+
+
+def _get_z_order_args(z_order):
     if z_order is None:
-        return ''
+        return []
     else:
         if not (isinstance(z_order, float) or isinstance(z_order, int)):
             raise CyError(f'{z_order} is invalid. Z order must be a number.')
-        return f' z="{z_order}"'
+        return [('z', z_order)]
 
 
 def _get_canvas_cmd_string(canvas):
+    return _args_cmd_string(_get_canvas_args(canvas))
+
+
+def _get_canvas_args(canvas):
     if canvas is None:
-        return ''
+        return []
     else:
         verify_canvas(canvas)
-        return f' canvas="{canvas}"'
+        return [('canvas', canvas)]
 
 
 def _get_name_cmd_string(name, network, base_url):
+    return _args_cmd_string(_get_name_args(name, network, base_url))
+
+
+def _get_name_args(name, network, base_url, all_names=None):
     if name is None:
-        return ''
+        return []
     else:
-        all_annotations = get_annotation_list(network, base_url=base_url)
-        all_names = [x['name'] for x in all_annotations]
+        if all_names is None:
+            all_names = [x['name'] for x in get_annotation_list(network, base_url=base_url)]
         verify_unique(name, all_names)
-        return f' newName="{name}"'
+        return [('newName', name)]
 
 
 def _get_height_width_cmd_string(height, width):
-    if height is None:
-        height_cmd = ''
-    else:
-        verify_positive(height)
-        height_cmd = f' height="{height}"'
+    return _args_cmd_string(_get_height_width_args(height, width))
 
-    if width is None:
-        width_cmd = ''
-    else:
-        verify_positive(width)
-        width_cmd = f' width="{width}"'
 
-    return height_cmd + width_cmd
+def _get_height_width_args(height, width):
+    args = []
+    if height is not None:
+        verify_positive(height)
+        args.append(('height', height))
+    if width is not None:
+        verify_positive(width)
+        args.append(('width', width))
+    return args
 
 
 def _get_border_cmd_string(border_thickness, border_color, border_opacity):
-    if border_thickness is None:
-        border_thickness_cmd = ''
-    else:
-        verify_non_negative(border_thickness)
-        border_thickness_cmd = f' borderThickness="{border_thickness}"'
+    return _args_cmd_string(_get_border_args(border_thickness, border_color, border_opacity))
 
-    if border_color is None:
-        border_color_cmd = ''
-    else:
-        border_color = verify_hex_color(border_color)
-        border_color_cmd = f' borderColor="{border_color}"'
 
-    if border_opacity is None:
-        border_opacity_cmd = ''
-    else:
+def _get_border_args(border_thickness, border_color, border_opacity):
+    args = []
+    if border_thickness is not None:
+        verify_non_negative(border_thickness)
+        args.append(('borderThickness', border_thickness))
+    if border_color is not None:
+        args.append(('borderColor', verify_hex_color(border_color)))
+    if border_opacity is not None:
         verify_opacity(border_opacity)
-        border_opacity_cmd = f' borderOpacity="{border_opacity}"'
-
-    return border_thickness_cmd + border_color_cmd + border_opacity_cmd
+        args.append(('borderOpacity', border_opacity))
+    return args
 
 
 def _get_opacity_cmd_string(opacity):
+    return _args_cmd_string(_get_opacity_args(opacity))
+
+
+def _get_opacity_args(opacity):
     if opacity is None:
-        return ''
+        return []
     else:
         verify_opacity(opacity)
-        return f' opacity="{opacity}"'
+        return [('opacity', opacity)]
 
 
 def _get_fill_color_cmd_string(fill_color):
+    return _args_cmd_string(_get_fill_color_args(fill_color))
+
+
+def _get_fill_color_args(fill_color):
     if fill_color is None:
-        return ''
+        return []
     else:
-        fill_color = verify_hex_color(fill_color)
-        return f' fillColor="{fill_color}"'
+        return [('fillColor', verify_hex_color(fill_color))]
 
 
 def _get_angle_cmd_string(angle):
+    return _args_cmd_string(_get_angle_args(angle))
+
+
+def _get_angle_args(angle):
     if angle is None:
-        return ''
+        return []
     else:
-        rotation = normalize_rotation(angle)
-        return f' angle="{rotation}"'
+        return [('angle', normalize_rotation(angle))]
 
 
 def _get_custom_shape_cmd_string(custom_shape):
-    if custom_shape is None:
-        return ''
-    else:
-        return f' customShape="{custom_shape}"'
+    return _args_cmd_string(_get_custom_shape_args(custom_shape))
+
+
+def _get_custom_shape_args(custom_shape):
+    return [] if custom_shape is None else [('customShape', custom_shape)]
 
 
 def _get_brightness_contrast_cmd_string(brightness, contrast):
-    if brightness is None:
-        brightness_cmd = ''
-    else:
-        verify_brightness_contrast(brightness)
-        brightness_cmd = f' brightness="{brightness}"'
+    return _args_cmd_string(_get_brightness_contrast_args(brightness, contrast))
 
-    if contrast is None:
-        contrast_cmd = ''
-    else:
+
+def _get_brightness_contrast_args(brightness, contrast):
+    args = []
+    if brightness is not None:
+        verify_brightness_contrast(brightness)
+        args.append(('brightness', brightness))
+    if contrast is not None:
         verify_brightness_contrast(contrast)
-        contrast_cmd = f' contrast="{contrast}"'
+        args.append(('contrast', contrast))
+    return args
 
-    return brightness_cmd + contrast_cmd
 
 def _get_url_cmd_string(url, optional=False):
+    return _args_cmd_string(_get_url_args(url, optional))
+
+
+def _get_url_args(url, optional=False):
     if url is None:
         if optional:
-            return ''
+            return []
         else:
-            raise CyError(f'URL or path to image file must be provided.')
+            raise CyError('URL or path to image file must be provided.')
 
     if url.startswith('file:'):
         pass # use file URL as provided
@@ -1068,45 +1228,191 @@ def _get_url_cmd_string(url, optional=False):
         else:
             url = 'file:' + url # set up a Linux path
 
-    return f' url="{url}"'
+    return [('url', url)]
 
 
 def _get_font_cmd_string(font_size, font_family, font_style):
-    if font_size is None:
-        font_size_cmd = ''
-    else:
-        verify_positive(font_size)
-        font_size_cmd = f' fontSize="{font_size}"'
+    return _args_cmd_string(_get_font_args(font_size, font_family, font_style))
 
-    if font_family is None:
-        font_family_cmd = ''
-    else:
-        font_family_cmd = f' fontFamily="{font_family}"'
 
-    if font_style is None:
-        font_style_cmd = ''
-    else:
+def _get_font_args(font_size, font_family, font_style):
+    args = []
+    if font_size is not None:
+        verify_positive(font_size)
+        args.append(('fontSize', font_size))
+    if font_family is not None:
+        args.append(('fontFamily', font_family))
+    if font_style is not None:
         verify_font_style(font_style)
-        font_style_cmd = f' fontStyle="{font_style}"'
-
-    return font_size_cmd + font_family_cmd + font_style_cmd
+        args.append(('fontStyle', font_style))
+    return args
 
 
 def _get_color_cmd_string(color):
+    return _args_cmd_string(_get_color_args(color))
+
+
+def _get_color_args(color):
     if color is None:
-        return ''
+        return []
     else:
-        color = verify_hex_color(color)
-        return f' color="{color}"'
+        return [('color', verify_hex_color(color))]
 
 
 def _get_text_cmd_string(text, optional=False):
+    return _args_cmd_string(_get_text_args(text, optional))
+
+
+def _get_text_args(text, optional=False):
     if text is None and not optional:
         raise CyError("Must provide the text string to add.")
-    return '' if text is None else f' text="{text}"'
+    return [] if text is None else [('text', text)]
 
 
 def _get_annotation_name_cmd_string(annotation_name, error_text='Must provide the UUID or name'):
+    return _args_cmd_string(_get_annotation_name_args(annotation_name, error_text))
+
+
+def _get_annotation_name_args(annotation_name, error_text='Must provide the UUID or name'):
     if annotation_name is None:
         raise CyError(error_text)
-    return f' uuidOrName="{annotation_name}"'
\ No newline at end of file
+    return [('uuidOrName', annotation_name)]
+
+# Kinds of annotations that can be added or updated in bulk: the noun in the Cytoscape command, the name of the
+# annotation's Java class (as reported by get_annotation_list()) and the columns allowed for that kind of annotation
+_ANNOTATION_KINDS = {
+    'text': ('text', 'TextAnnotation',
+             {'text', 'x_pos', 'y_pos', 'font_size', 'font_family', 'font_style', 'color', 'angle', 'name', 'canvas',
+              'z_order'}),
+    'bounded_text': ('bounded text', 'BoundedTextAnnotation',
+                     {'text', 'x_pos', 'y_pos', 'font_size', 'font_family', 'font_style', 'color', 'angle', 'type',
+                      'custom_shape', 'fill_color', 'opacity', 'border_thickness', 'border_color', 'border_opacity',
+                      'height', 'width', 'name', 'canvas', 'z_order'}),
+    'image': ('image', 'ImageAnnotation',
+              {'url', 'x_pos', 'y_pos', 'angle', 'opacity', 'brightness', 'contrast', 'border_thickness',
+               'border_color', 'border_opacity', 'height', 'width', 'name', 'canvas', 'z_order'}),
+    'shape': ('shape', 'ShapeAnnotation',
+              {'type', 'custom_shape', 'x_pos', 'y_pos', 'angle', 'fill_color', 'opacity', 'border_thickness',
+               'border_color', 'border_opacity', 'height', 'width', 'name', 'canvas', 'z_order'}),
+    'group': ('group', 'GroupAnnotation', {'x_pos', 'y_pos', 'angle', 'name', 'canvas', 'z_order'}),
+}
+
+
+class _AnnotationBatch:
+    # Builds the commands for a batch of annotation adds, updates or deletes on one network view. Each command is a
+    # (namespace, verb, arguments) tuple for commands._do_commands_post_batch(), so argument values are passed as given
+    # instead of being quoted into a command string. Everything a command depends on besides its own row (the view,
+    # the existing annotations, the view center and the valid shapes) is fetched at most once per batch, and only if
+    # some row needs it.
+
+    def __init__(self, network, base_url):
+        self.caller = sys._getframe(1).f_code.co_name  # report errors as coming from the public function
+        self.network = network
+        self.base_url = base_url
+        self.net_suid = networks.get_network_suid(network, base_url=base_url)
+        self.view_suid = network_views.get_network_view_suid(self.net_suid, base_url=base_url)
+        self._annotations = None
+        self._names = None
+        self._center = None
+        self._node_shapes = None
+
+    @property
+    def annotations(self):
+        # Existing annotations, keyed by both UUID and name
+        if self._annotations is None:
+            annotation_list = get_annotation_list(self.network, base_url=self.base_url)
+            self._annotations = {ann['name']: ann for ann in annotation_list}
+            self._annotations.update({ann['uuid']: ann for ann in annotation_list})
+            self._names = {ann['name'] for ann in annotation_list}
+        return self._annotations
+
+    def find(self, annotation_name):
+        # Return the existing annotation having the UUID or name
+        if annotation_name not in self.annotations:
+            raise CyError(f'Annotation "{annotation_name}" does not exist', caller=self.caller)
+        return self.annotations[annotation_name]
+
+    def add_cmd(self, ann, annotation_type=None):
+        kind = ann.pop('annotation_type', annotation_type)
+        if kind not in _ANNOTATION_KINDS or kind == 'group':
+            raise CyError(f'Annotation type "{kind}" is invalid. Choose text, bounded_text, image or shape.',
+                          caller=self.caller)
+        return self._cmd('add', kind, ann)
+
+    def update_cmd(self, ann):
+        annotation_name = ann.pop('annotation_name', None)
+        if annotation_name is None:
+            raise CyError('Must provide the UUID or name of each annotation to update', caller=self.caller)
+        existing = self.find(annotation_name)
+        ann_class = existing['type'].split('.')[-1]
+        kind = next((kind for kind, (noun, kind_class, params) in _ANNOTATION_KINDS.items() if kind_class == ann_class),
+                    None)
+        if kind is None:
+            raise CyError(f'Annotation "{annotation_name}" is a {ann_class}, which cannot be updated',
+                          caller=self.caller)
+        if 'name' in ann: self._names.discard(existing['name']) # a renamed annotation frees its old name
+        return self._cmd('update', kind, ann, annotation_name)
+
+    def delete_cmd(self, annotation_name):
+        self.find(annotation_name)
+        return 'annotation', 'delete', {'uuidOrName': annotation_name}
+
+    def ungroup_cmd(self, annotation_name):
+        return 'annotation', 'ungroup', {'view': f'SUID:{self.view_suid}', 'uuidOrName': annotation_name}
+
+    def _cmd(self, verb, kind, ann, annotation_name=None):
+        noun, ann_class, params = _ANNOTATION_KINDS[kind]
+        unknown = set(ann) - params
+        if unknown:
+            raise CyError(f'{", ".join(sorted(unknown))} cannot be set on a {kind} annotation', caller=self.caller)
+
+        args = [('view', f'SUID:{self.view_suid}')]
+        if kind in ('text', 'image'):
+            args.append(('type', f'org.cytoscape.view.presentation.annotations.{ann_class}'))
+        if 'text' in params:
+            args += _get_text_args(ann.get('text'), optional=verb == 'update')
+        if 'url' in params:
+            args += _get_url_args(ann.get('url'), optional=verb == 'update')
+        if annotation_name is not None:
+            args += _get_annotation_name_args(annotation_name)
+
+        # x and y position ... the view center is fetched only if a row doesn't give a position
+        x_pos, y_pos = ann.get('x_pos'), ann.get('y_pos')
+        if (x_pos is None or y_pos is None) and self._center is None:
+            self._center = style_values.get_network_center(self.net_suid, base_url=self.base_url)
+        args += _get_x_y_pos_args(x_pos, y_pos, self.net_suid, self.base_url, center=self._center)
+
+        # optional params ... the columns were checked against the kind of annotation above
+        args += _get_font_args(ann.get('font_size'), ann.get('font_family'), ann.get('font_style'))
+        args += _get_color_args(ann.get('color'))
+        args += _get_angle_args(ann.get('angle'))
+        if ann.get('type') is not None and self._node_shapes is None:
+            self._node_shapes = styles.get_node_shapes(base_url=self.base_url)
+        args += _get_type_args(ann.get('type'), self.base_url, node_shapes=self._node_shapes)
+        args += _get_custom_shape_args(ann.get('custom_shape'))
+        args += _get_fill_color_args(ann.get('fill_color'))
+        args += _get_opacity_args(ann.get('opacity'))
+        args += _get_brightness_contrast_args(ann.get('brightness'), ann.get('contrast'))
+        args += _get_border_args(ann.get('border_thickness'), ann.get('border_color'), ann.get('border_opacity'))
+        args += _get_height_width_args(ann.get('height'), ann.get('width'))
+
+        # name must be unique among the view's annotations, including the ones earlier in this batch
+        name = ann.get('name')
+        if name is not None:
+            self.annotations # make sure existing names are known
+            args += _get_name_args(name, self.network, self.base_url, all_names=self._names)
+            self._names.add(name)
+
+        args += _get_canvas_args(ann.get('canvas'))
+        args += _get_z_order_args(ann.get('z_order'))
+
+        return 'annotation', f'{verb} {noun}', dict(args)
+
+
+def _annotation_rows(annotations):
+    # Return each row of an annotations dataframe as a dict of its non-missing values, as Python scalars
+    if not isinstance(annotations, pd.DataFrame):
+        raise CyError('Annotations must be provided as a dataframe', caller=sys._getframe(1).f_code.co_name)
+    return [{col: value.item() if isinstance(value, np.generic) else value
+             for col, value in row.items() if not (pd.api.types.is_scalar(value) and pd.isna(value))}
+            for row in annotations.to_dict('records')]
@@ -29,6 +29,7 @@ from . import commands
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
+from .py4cytoscape_cache import clear_layout_metadata, clear_vocabulary
 
 
 @cy_log
@@ -55,6 +56,8 @@ def disable_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps disable app="{app}"', base_url=base_url)
+    clear_layout_metadata(base_url) # the app may provide layouts
+    clear_vocabulary(base_url) # ... or visual property values
     return narrate(res)
 
 
@@ -82,6 +85,8 @@ def enable_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps enable app="{app}"', base_url=base_url)
+    clear_layout_metadata(base_url) # the app may provide layouts
+    clear_vocabulary(base_url) # ... or visual property values
     return narrate(res)
 
 
@@ -133,6 +138,8 @@ def install_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps install app="{app}"', base_url=base_url)
+    clear_layout_metadata(base_url) # the app may provide layouts
+    clear_vocabulary(base_url) # ... or visual property values
     return narrate(res)
 
 
@@ -333,6 +340,8 @@ def uninstall_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps uninstall app="{app}"', base_url=base_url)
+    clear_layout_metadata(base_url) # the app may provide layouts
+    clear_vocabulary(base_url) # ... or visual property values
     return narrate(res)
 
 
@@ -358,4 +367,6 @@ def update_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps update app="{app}"', base_url=base_url)
+    clear_layout_metadata(base_url) # the app may provide layouts
+    clear_vocabulary(base_url) # ... or visual property values
     return narrate(res)
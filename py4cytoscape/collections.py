@@ -21,6 +21,7 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 
 # External library imports
 import sys
+import pandas as pd
 
 # Internal module imports
 from . import commands
@@ -30,6 +31,7 @@ from . import networks
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
+from .py4cytoscape_cache import get_collection_names, set_collection_names
 
 
 @cy_log
@@ -54,8 +56,8 @@ def get_collection_list(base_url=DEFAULT_BASE_URL):
         ['galFiltered.sif', 'BINDyeast.sif']
     """
     res = commands.cyrest_get('collections', base_url=base_url)
-    col_names = [get_collection_name(suid, base_url=base_url) for suid in res]
-    return col_names
+    col_names = _get_collection_names(res, base_url)
+    return [col_names[suid] for suid in res]
 
 
 # TODO: It's hard to load a network into its own collection, so this is all hard to test.
@@ -117,8 +119,7 @@ def get_collection_name(collection_suid=None, base_url=DEFAULT_BASE_URL):
         'galFiltered.sif'
     """
     if collection_suid is None: collection_suid = get_collection_suid(base_url=base_url)
-    res = commands.cyrest_get(f'collections/{collection_suid}/tables/default', base_url=base_url)
-    return res['rows'][0]['name'] if 'name' in res['rows'][0] else None
+    return _get_collection_names([collection_suid], base_url)[collection_suid]
 
 
 @cy_log
@@ -145,3 +146,48 @@ def get_collection_networks(collection_suid=None, base_url=DEFAULT_BASE_URL):
     if collection_suid is None: collection_suid = get_collection_suid(base_url=base_url)
     res = commands.cyrest_get(f'collections/{collection_suid}/subnetworks', base_url=base_url)
     return res
+
+
+@cy_log
+def get_collections_summary(base_url=DEFAULT_BASE_URL):
+    """Get Collections Summary.
+
+    Returns the name and member networks of every collection in the session. This takes far fewer round trips than
+    calling ``get_collection_name`` and ``get_collection_networks`` for each collection, as the per-collection queries
+    are issued together and collection names are remembered from earlier calls.
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://localhost:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        dataframe: one row per collection, indexed by collection SUID, with columns 'SUID', 'name' (None if the
+            collection is unnamed) and 'networks' (list of SUIDs for networks within the collection)
+
+    Raises:
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> get_collections_summary()
+                  SUID              name      networks
+        851296  851296   galFiltered.sif      [52, 152]
+        851412  851412     BINDyeast.sif         [338]
+    """
+    res = commands.cyrest_get('collections', base_url=base_url)
+    col_names = _get_collection_names(res, base_url)
+    col_networks = commands.cyrest_get_batch([f'collections/{suid}/subnetworks' for suid in res], base_url=base_url)
+    return pd.DataFrame({'SUID': res, 'name': [col_names[suid] for suid in res], 'networks': col_networks},
+                        index=res, columns=['SUID', 'name', 'networks'])
+
+
+def _get_collection_names(collection_suids, base_url):
+    # Return {SUID: name} for the collections, fetching all names not already cached at once
+    col_names = get_collection_names(base_url, collection_suids)
+    missing_suids = [suid for suid in collection_suids if suid not in col_names]
+    if missing_suids:
+        res = commands.cyrest_get_batch([f'collections/{suid}/tables/default' for suid in missing_suids],
+                                        base_url=base_url)
+        col_names.update(set_collection_names(base_url, {suid: table['rows'][0].get('name')
+                                                         for suid, table in zip(missing_suids, res)}))
+    return col_names
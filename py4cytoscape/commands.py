@@ -33,16 +33,22 @@ import requests
 from http import HTTPStatus
 import urllib.parse
 import json
+import functools
 import webbrowser
 import sys
 import os
 import backoff
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 
 # Internal module convenience imports
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log, log_http_result, log_http_request, show_error
-from .py4cytoscape_notebook import execution_environment, do_request_jupyter_bridge, check_execution_environment, get_notebook_is_running, ExecutionEnvironment
+from .py4cytoscape_notebook import execution_environment, do_request_jupyter_bridge, do_requests_jupyter_bridge, check_execution_environment, get_notebook_is_running, ExecutionEnvironment
 from .py4cytoscape_sandbox import *
+from .py4cytoscape_cache import get_client_state, set_client_state
+from .py4cytoscape_cache import start_request_memo, end_request_memo, get_request_memo, set_request_memo, clear_request_memo
+from .py4cytoscape_cache import clear_table_cache_session, clear_table_key_index, clear_collection_names
 from .exceptions import CyError
 
 def __init__(self):
@@ -160,6 +166,65 @@ def cyrest_get(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, requi
         _handle_error(e)
 
 
+@cy_log
+def cyrest_get_batch(operations, parameters=None, base_url=DEFAULT_BASE_URL, require_json=True):
+    """Make a GET call for each of several queries and process the results.
+
+    The GETs are independent of each other. When Cytoscape is reached via Jupyter-Bridge, they are sent to the bridge
+    together (batched or pipelined, depending on what the bridge supports) instead of one round trip at a time.
+    Otherwise, several of them are run concurrently.
+
+    Args:
+        operations (list): Strings to be converted to REST query namespaces
+        parameters (dict): A named list of values to be converted to REST query parameters for every query
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        require_json (bool): True if only JSON is accepted as a response; otherwise, return non-JSON if response is non-JSON
+
+    Returns:
+        list: a dict (if result was JSON) or a string for each operation, in the same order as ``operations``
+
+    Raises:
+        ValueError: if JSON is expected and response is not JSON
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> cyrest_get_batch(['version', 'networks/count'])
+        [{'apiVersion': 'v1', 'cytoscapeVersion': '3.8.0'}, {'count': 1}]
+    """
+    return _cyrest_batch('GET', operations, parameters=parameters, base_url=base_url, require_json=require_json)
+
+
+@cy_log
+def cyrest_delete_batch(operations, parameters=None, base_url=DEFAULT_BASE_URL, require_json=True):
+    """Make a DELETE call for each of several queries and process the results.
+
+    The DELETEs are independent of each other. When Cytoscape is reached via Jupyter-Bridge, they are sent to the
+    bridge together (batched or pipelined, depending on what the bridge supports) instead of one round trip at a time.
+
+    Args:
+        operations (list): Strings to be converted to REST query namespaces
+        parameters (dict): A named list of values to be converted to REST query parameters for every query
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        require_json (bool): True if only JSON is accepted as a response; otherwise, return non-JSON if response is non-JSON
+
+    Returns:
+        list: a dict (if result was JSON) or a string for each operation, in the same order as ``operations``
+
+    Raises:
+        ValueError: if JSON is expected and response is not JSON
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> cyrest_delete_batch(['networks/51/views', 'networks/52/views'], require_json=False)
+        ['', '']
+    """
+    return _cyrest_batch('DELETE', operations, parameters=parameters, base_url=base_url, require_json=require_json)
+
+
 @cy_log
 def cyrest_post(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE_URL, require_json=True):
     """Construct a query and body, make POST call and process the result.
@@ -240,6 +305,41 @@ def cyrest_put(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE
         _handle_error(e)
 
 
+@contextlib.contextmanager
+def coalesce():
+    """Answer repeated CyREST GETs from memory for the duration of a ``with`` block.
+
+    A single high-level call (e.g., ``create_network_from_data_frames()``) often issues the same GET several times,
+    such as fetching a table's column list before and after each step. Within a ``coalesce()`` block, the reply to
+    each GET is remembered, and a repeat of the same GET (same URL, parameters and Accept header) gets the remembered
+    reply instead of a new round trip. A PUT, POST or DELETE forgets remembered replies for the resource it writes to
+    (e.g., ``networks``, ``styles``) and for resources that depend on it, and a Commands API call or a GET that acts
+    (e.g., ``apply/layouts``) forgets all of them. Everything is forgotten when the block ends, so nothing remembered
+    can go stale after it.
+
+    Blocks may be nested, in which case replies are kept until the outermost block ends. Only requests made by the
+    thread that opened the block are coalesced.
+
+    Note:
+        Changes made by other clients or in the Cytoscape GUI while the block runs aren't noticed, so keep blocks
+        short and don't wrap waits for such changes in them.
+
+    Yields:
+        None
+
+    Examples:
+        >>> with coalesce():
+        ...     create_network_from_data_frames(nodes, edges, title='My Network')
+        ...     set_node_color_mapping(**gen_node_color_map('score'))
+    """
+    start_request_memo()
+    try:
+        yield
+    finally:
+        end_request_memo()
+
+
+
 # ==============================================================================
 # II. Commands API functions
 # ------------------------------------------------------------------------------
@@ -395,18 +495,46 @@ def commands_post(cmd, base_url=DEFAULT_BASE_URL):
          {'appName': 'AgilentLiteratureSearch', 'description': 'Mines scientific literature to ... ', 'details': ''} ...]
     """
 
-    try:
-        post_url = _command_2_post_query_url(cmd, base_url=base_url)
-        post_body = _command_2_post_query_body(cmd)
-        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
-        r = _do_request('POST', post_url, json=post_body, headers=headers, base_url=base_url)
-        r.raise_for_status()
-        res = json.loads(r.text)
-        if len(res['errors']):
-            raise CyError(str(res['errors'][0]))
-        return res['data']
-    except requests.exceptions.RequestException as e:
-        _handle_error(e)
+    cmd_path, cmd_args = _parse_command(cmd)
+    return _do_commands_post(base_url + cmd_path, base_url=base_url, json=dict(cmd_args))
+
+
+@cy_log
+def commands_post_args(namespace, verb, /, base_url=DEFAULT_BASE_URL, **args):
+    """Commands POST with arguments passed as Python values.
+
+    Executes the same Cytoscape command as ``commands_post()``, but takes the command's namespace, verb and arguments
+    separately instead of as a single command string. No command string is built or parsed, so argument values are
+    passed to Cytoscape exactly as given, even if they contain quotes, blanks or ``name=value`` text.
+
+    Args:
+        namespace (str): command namespace (e.g., 'network')
+        verb (str): command within the namespace, possibly with multiple words (e.g., 'get attribute')
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        **args: command arguments ... each value is passed as ``str(value)``, and arguments whose value is None
+            are omitted. Arguments may be named ``namespace`` or ``verb``, as those parameters are positional.
+
+    Returns:
+        dict or list: a structured command reply
+
+    Raises:
+        CyError: if command has an error
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> commands_post_args('apps', 'status', app='Network Merge')
+        {'appName': 'Network Merge', 'status': 'Installed'}
+        >>> commands_post_args('network', 'rename', name='My "best" network', sourceNetwork='SUID:52')
+        {'network': 52, 'name': 'My "best" network'}
+
+    See Also:
+        :meth:`commands_post`
+    """
+    post_url = base_url + urllib.parse.quote(f'/commands/{namespace}/{verb}')
+    post_body = {name: str(value) for name, value in args.items() if value is not None}
+    return _do_commands_post(post_url, base_url=base_url, json=post_body)
 
 
 @cy_log
@@ -604,76 +732,40 @@ def command_sleep(duration=None, base_url=DEFAULT_BASE_URL):
     return commands_post(f'command sleep{dur_str}', base_url=base_url)
 
 
-def _command_2_get_query(cmd_string, base_url=DEFAULT_BASE_URL):
-    # Wipe out parameters so we can focus just on the Cytoscape command
-    # For example, 'network get attribute network="test" namespace="default" columnList="SUID"'
-    # becomes 'network get attributeXXXXXXnetwork="test"XXXXXXnamespace="default"XXXXXXcolumnList="SUID"'
-    cmd_mark_params = re.sub(r' ([A-Za-z0-9_-]*=)', 'XXXXXX\\1', cmd_string)
-
-    # Separate Cytoscape command and parameters. Using the above:
-    # 'network get attribute', 'network="test"', 'namespace="default"', 'columnList="SUID"'
-    split_cmd = cmd_mark_params.split('XXXXXX')
-
-    # Assemble just the cy_cmd as a CyREST command URL
-    cy_cmd = split_cmd[0] or ''
-    url = base_url + urllib.parse.quote('/commands/' + re.sub(' ', '/', cy_cmd, count=1))
-
-    # Create a dict of parameter names/values
-    args = ' '.join(split_cmd[1:])
-    if args:
-        args = re.sub(r'"', '', args)  # Get rid of all " (presumably surrounding command argument values)
-        name_list = re.findall('[A-Za-z0-9_-]+=', args)  # Find all parameter names (e.g., 'abc=')
-        name_list = [re.sub(r'=', '', name) for name in name_list]  # Get rid of all '=' at the end of parameter names
-        val_list = re.split(' *[A-Za-z0-9_-]+=', args)[
-                   1:]  # Find all parameter values (.e.g., the '123' part of 'abc=123')
-        arg_dict = {key: val for key, val in
-                    zip(name_list, val_list)}  # Create dictionary out of param names and values
-    else:
-        arg_dict = None
-
-    return url, arg_dict
-
-
-def _command_2_post_query_url(cmd, base_url=DEFAULT_BASE_URL):
-    """ Construct complete command URL from base URL and Cytoscape command """
+# Parsed command strings are remembered, as high-level functions issue the same commands over and over. Very long
+# commands (e.g., ones that carry whole node lists) are rarely repeated, so they're parsed without being remembered.
+_COMMAND_CACHE_SIZE = 512
+_COMMAND_CACHE_MAX_LEN = 2048
+_COMMAND_PARAM_PATTERN = re.compile(r' ([A-Za-z0-9_-]*=)')
 
-    # Wipe out parameters so we can focus just on the Cytoscape command
-    # For example, 'network get attribute network="test" namespace="default" columnList="SUID"'
-    # becomes 'network get attributeXXXXXXnetwork="test"XXXXXXnamespace="default"XXXXXXcolumnList="SUID"'
-    cmd_mark_params = re.sub(r' ([A-Za-z0-9_-]*=)', 'XXXXXX\\1', cmd)
+def _parse_command(cmd):
+    # Split a command string into its CyREST path and a tuple of (name, value) arguments. For example,
+    # 'network get attribute network="test" namespace="default" columnList="SUID"' becomes
+    # '/commands/network/get%20attribute', (('network', 'test'), ('namespace', 'default'), ('columnList', 'SUID'))
+    if len(cmd) > _COMMAND_CACHE_MAX_LEN:
+        return _parse_command_uncached(cmd)
+    return _parse_command_cached(cmd)
 
-    # Separate Cytoscape command and parameters. Using the above:
-    # 'network get attribute', 'network="test"', 'namespace="default"', 'columnList="SUID"'
-    split_cmd = cmd_mark_params.split('XXXXXX')
+def _parse_command_uncached(cmd):
+    # Mark each parameter so we can see where it starts, and then separate Cytoscape command and parameters. Using the
+    # above: 'network get attribute', 'network="test"', 'namespace="default"', 'columnList="SUID"'
+    split_cmd = _COMMAND_PARAM_PATTERN.sub('XXXXXX\\1', cmd).split('XXXXXX')
 
-    # Assemble just the cy_cmd as a CyREST command URL
+    # Assemble just the cy_cmd as a CyREST command path
     cy_cmd = split_cmd[0] or ''
-    url = base_url + urllib.parse.quote('/commands/' + re.sub(' ', '/', cy_cmd, count=1))
+    path = urllib.parse.quote('/commands/' + cy_cmd.replace(' ', '/', 1))
 
-    return url
+    # Create a list of parameter names/values, squeezing out quotes (presumably surrounding command argument values)
+    args = tuple(tuple(param.replace('"', '').split('=', 1)) for param in split_cmd[1:])
 
+    return path, args
 
-def _command_2_post_query_body(cmd):
-    """ Construct body of POST as JSON representing inline parameters """
+_parse_command_cached = functools.lru_cache(maxsize=_COMMAND_CACHE_SIZE)(_parse_command_uncached)
 
-    # Set markers 'XXXXXX" on each parameter so we can see where they are.
-    # For example, 'network get attribute network="test" namespace="default" columnList="SUID"'
-    # becomes 'network get attributeXXXXXXnetwork="test"XXXXXXnetwork="default"XXXXXXcolumnList="SUID"'
-    cmd_mark_params = re.sub(r' ([A-Za-z0-9_-]*=)', 'XXXXXX\\1', cmd)
-    split_cmd = cmd_mark_params.split("XXXXXX")
-
-    # Extract just the parameters ... if there are none, invent one
-    params = split_cmd[1:]
-    if params is None: params = ['atLeastOneArg=required']
-
-    # Create a dictionary containing params as key-value, squeezing out quotes
-    param_dict = {}
-    for x in params:
-        p = re.sub('"', '', x).split('=', 1)
-        if p[0] is None: raise CyError('Missing parameter name in "{x}"')
-        param_dict[p[0]] = p[1]
-
-    return param_dict
+def _command_2_get_query(cmd_string, base_url=DEFAULT_BASE_URL):
+    # Construct complete command URL and a dict of query parameters (or None if there are none)
+    path, args = _parse_command(cmd_string)
+    return base_url + path, dict(args) or None
 
 def sub_versions(base_url=DEFAULT_BASE_URL, **kwargs):
     # If we're running through Jupyter-Bridge, get the versions of components along the way
@@ -682,6 +774,87 @@ def sub_versions(base_url=DEFAULT_BASE_URL, **kwargs):
     else:
         return {}
 
+def _cyrest_batch(method, operations, parameters=None, base_url=DEFAULT_BASE_URL, require_json=True):
+    # Issue the same kind of call for each operation, and return each call's processed result
+    try:
+        request_list = [(method, build_url(base_url, operation), {'params': parameters}) for operation in operations]
+        res = []
+        for r in _do_requests(request_list, base_url=base_url):
+            r.raise_for_status()
+            try:
+                res.append(r.json())
+            except ValueError as e:
+                if require_json:
+                    raise
+                else:
+                    res.append(r.text)
+        return res
+    except requests.exceptions.RequestException as e:
+        _handle_error(e)
+
+def _do_commands_post(post_url, base_url=DEFAULT_BASE_URL, **kwargs):
+    # POST a command whose body is passed as json= or data= (e.g., a generator that streams a large body), and
+    # return the command's 'data' result
+    try:
+        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+        r = _do_request('POST', post_url, headers=headers, base_url=base_url, **kwargs)
+        r.raise_for_status()
+        res = json.loads(r.text)
+        if len(res['errors']):
+            raise CyError(str(res['errors'][0]), caller=sys._getframe(1).f_code.co_name)
+        return res['data']
+    except requests.exceptions.RequestException as e:
+        _handle_error(e)
+
+def _do_commands_post_batch(cmds, base_url=DEFAULT_BASE_URL):
+    # POST several independent commands, each a (namespace, verb, arguments dict) tuple as for commands_post_args(),
+    # and return each command's 'data' result in order. When Cytoscape is reached via Jupyter-Bridge, the commands
+    # travel to the bridge together.
+    try:
+        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+        request_list = []
+        for namespace, verb, args in cmds:
+            post_url = base_url + urllib.parse.quote(f'/commands/{namespace}/{verb}')
+            post_body = {name: str(value) for name, value in args.items() if value is not None}
+            request_list.append(('POST', post_url, {'headers': headers, 'json': post_body}))
+        res_list = []
+        for r in _do_requests(request_list, base_url=base_url):
+            r.raise_for_status()
+            res = json.loads(r.text)
+            if len(res['errors']):
+                raise CyError(str(res['errors'][0]), caller=sys._getframe(1).f_code.co_name)
+            res_list.append(res['data'])
+        return res_list
+    except requests.exceptions.RequestException as e:
+        _handle_error(e)
+
+def _cyrest_get_contents(operations, parameters=None, base_url=DEFAULT_BASE_URL):
+    # GET several CyREST resources and return the content of each as bytes, without decoding it (e.g., for an image)
+    try:
+        request_list = [('GET', build_url(base_url, operation), {'params': parameters}) for operation in operations]
+        res = []
+        for r in _do_requests(request_list, base_url=base_url):
+            r.raise_for_status()
+            res.append(r.content)
+        return res
+    except requests.exceptions.RequestException as e:
+        _handle_error(e)
+
+def _do_commands_post_stream(post_url, base_url=DEFAULT_BASE_URL, **kwargs):
+    # POST a command and return the response without reading its content, so the caller can process a large reply
+    # a block at a time
+    try:
+        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+        r = _do_request('POST', post_url, headers=headers, base_url=base_url, stream=True, **kwargs)
+        r.raise_for_status()
+        return r
+    except requests.exceptions.RequestException as e:
+        _handle_error(e)
+
+def _is_jupyter_bridge(base_url=DEFAULT_BASE_URL):
+    # True if CyREST is reached via Jupyter-Bridge, which can't stream request or reply content
+    return _find_execution_environment(base_url) == ExecutionEnvironment.REMOTE_JUPYTER_BRIDGE
+
 def _handle_error(e, force_cy_error=False):
     # An exception occurred ... figure out the most sensible thing to return as the exception text
     caller = sys._getframe(1).f_code.co_name
@@ -707,7 +880,7 @@ def _do_request_local(method, url, **kwargs):
     # Call CyREST via a local URL
     log_http_request(method, url, **kwargs)
     r = requests.request(method, url, **kwargs)
-    log_http_result(r)
+    log_http_result(r, streamed=kwargs.get('stream', False))
     return r
 
 def _do_request(method, url, base_url=DEFAULT_BASE_URL, raw_request=False, **kwargs):
@@ -717,7 +890,127 @@ def _do_request(method, url, base_url=DEFAULT_BASE_URL, raw_request=False, **kwa
     if not raw_request:
         do_initialize_sandbox(requester, base_url=base_url) # make sure there's a sandbox before executing a command
 
-    return requester(method, url, **kwargs)
+    # Within a coalesce() block, a repeated GET gets the reply remembered from the first time
+    memo_key = _request_memo_key(method, url, base_url, kwargs)
+    r = get_request_memo(memo_key) if memo_key else None
+    if r is None:
+        r = requester(method, url, **kwargs)
+        _remember_request(memo_key, method, url, base_url, r)
+    return r
+
+_LOCAL_GET_WORKERS = 8 # most GETs that a local Cytoscape will run at once for a batch
+
+def _do_requests(request_list, base_url=DEFAULT_BASE_URL):
+    # Execute a list of independent (method, url, kwargs) requests, letting Jupyter-Bridge overlap them if it can
+    requester, default_sandbox = _get_requester(base_url)
+    do_initialize_sandbox(requester, base_url=base_url) # make sure there's a sandbox before executing a command
+
+    # Within a coalesce() block, only GETs whose replies aren't remembered need to be sent
+    memo_keys = [_request_memo_key(method, url, base_url, kwargs) for method, url, kwargs in request_list]
+    replies = [get_request_memo(memo_key) if memo_key else None for memo_key in memo_keys]
+    unsent = [i for i, reply in enumerate(replies) if reply is None]
+    unsent_list = [request_list[i] for i in unsent]
+
+    if not unsent_list:
+        sent_replies = []
+    elif requester is do_request_jupyter_bridge:
+        sent_replies = do_requests_jupyter_bridge(unsent_list)
+    elif len(unsent_list) > 1 and all(method == 'GET' for method, url, kwargs in unsent_list):
+        # GETs don't change anything, so they can be overlapped without changing their outcome
+        with ThreadPoolExecutor(max_workers=min(_LOCAL_GET_WORKERS, len(unsent_list))) as pool:
+            sent_replies = list(pool.map(lambda request: requester(request[0], request[1], **request[2]), unsent_list))
+    else:
+        sent_replies = [requester(method, url, **kwargs) for method, url, kwargs in unsent_list]
+
+    for i, r in zip(unsent, sent_replies):
+        method, url, kwargs = request_list[i]
+        replies[i] = _remember_request(memo_keys[i], method, url, base_url, r)
+    return replies
+
+_ACTING_GET_RESOURCES = {'apply', 'commands', 'gc'} # GETs on these change Cytoscape state, so they count as writes
+_DEPENDENT_RESOURCES = {'networks': {'networks', 'collections'},
+                        'collections': {'networks', 'collections'},
+                        'styles': {'networks', 'styles'}} # resources whose replies a write to a resource can change
+
+def _request_resource(url, base_url):
+    # Return the first segment of a CyREST URL's path (e.g., 'networks' for .../v1/networks/52/nodes)
+    path = url[len(base_url):] if url.startswith(base_url) else urllib.parse.urlsplit(url).path
+    return path.lstrip('/').split('/', 1)[0].split('?', 1)[0]
+
+def _request_memo_key(method, url, base_url, kwargs):
+    # Return the request memo key for a GET whose reply can be reused within a coalesce() block, or None if the
+    # request's reply can't be reused
+    if method != 'GET' or kwargs.get('stream'):
+        return None
+    resource = _request_resource(url, base_url)
+    if resource in _ACTING_GET_RESOURCES:
+        return None
+    params = json.dumps(kwargs.get('params'), sort_keys=True, default=str)
+    return base_url, resource, url, params, (kwargs.get('headers') or {}).get('Accept')
+
+def _remember_request(memo_key, method, url, base_url, r):
+    # Remember a successful GET's reply for reuse, or forget the replies and table columns that a write may have made
+    # stale. A GET that isn't remembered (e.g., a streamed download) doesn't change anything, so nothing is forgotten.
+    if memo_key:
+        if r.status_code < HTTPStatus.BAD_REQUEST:
+            set_request_memo(memo_key, r)
+    elif method != 'GET' or _request_resource(url, base_url) in _ACTING_GET_RESOURCES:
+        clear_request_memo(base_url, _DEPENDENT_RESOURCES.get(_request_resource(url, base_url)))
+        changes_tables, changes_rows = _table_write_scope(url, base_url)
+        if changes_rows:
+            # Rows may have been added or removed without the table's row count changing (e.g., one node deleted and
+            # another added), so the row count can't be trusted to catch it
+            clear_table_key_index(base_url)
+        if changes_tables:
+            # The session's tables may no longer match its file, so stop using the table cache until it's saved again
+            clear_table_cache_session(base_url)
+        if _replaces_session(url, base_url):
+            # The new session's collections may have the SUIDs of collections remembered from the old one
+            clear_collection_names(base_url)
+    return r
+
+_TABLELESS_RESOURCES = {'apply', 'gc', 'session', 'styles', 'ui'} # writes to these don't change existing tables
+_TABLELESS_NETWORK_PATHS = {'', 'currentNetwork', 'views'} # nor do these writes to networks/..., or to a network view
+_READ_ONLY_COMMAND_NAMESPACES = {'command', 'filetransfer'}
+_READ_ONLY_COMMAND_VERBS = ('get', 'list') # Commands whose verbs start with these don't change anything
+_SESSION_REPLACING_VERBS = {'new', 'open'} # session commands that replace the whole session
+
+def _request_segments(url, base_url):
+    # Return the unquoted segments of a CyREST URL's path, padded with empty segments so at least four are present
+    # (e.g., ['networks', '52', 'tables', 'defaultnode', ...] for .../v1/networks/52/tables/defaultnode)
+    path = url[len(base_url):] if url.startswith(base_url) else urllib.parse.urlsplit(url).path
+    return [urllib.parse.unquote(segment) for segment in path.lstrip('/').split('?', 1)[0].split('/')] + ['', '', '']
+
+def _replaces_session(url, base_url):
+    # Return whether a request that isn't a plain GET may replace the session (e.g., by "session open" or by deleting
+    # the session resource), so that none of the old session's networks or collections remain
+    segments = _request_segments(url, base_url)
+    if segments[0] == 'commands':
+        return segments[1] == 'session' and segments[2] in _SESSION_REPLACING_VERBS
+    return segments[0] == 'session'
+
+def _table_write_scope(url, base_url):
+    # Return (changes_tables, changes_rows) for a request that isn't a plain GET: whether it may change any table, and
+    # whether it may add or remove table rows. Writes to a network's tables (e.g., by load_table_data()) and to its
+    # selection change cell values but not rows, and callers that write key columns forget them themselves.
+    segments = _request_segments(url, base_url)
+    resource = segments[0]
+    if resource == 'commands':
+        if segments[1] in _READ_ONLY_COMMAND_NAMESPACES or segments[2].startswith(_READ_ONLY_COMMAND_VERBS):
+            return False, False
+        return True, True
+    elif resource == 'networks':
+        if segments[1].isdigit():
+            if segments[2] == 'views':
+                return False, False
+            return True, segments[2] != 'tables' and segments[3] != 'selected'
+        elif segments[1] in _TABLELESS_NETWORK_PATHS:
+            # ... though a new network added to a collection adds rows to the collection's shared tables
+            return False, segments[1] == ''
+        return True, True
+    elif resource in _TABLELESS_RESOURCES:
+        return False, False
+    return True, True
 
 def do_initialize_sandbox(requester=None, base_url=DEFAULT_BASE_URL):
     # If re-initialize has been requested, reset sandbox to environment's default (i.e., None or default_sandbox)
@@ -795,17 +1088,28 @@ def do_set_sandbox(sandbox_to_set, requester=None, base_url=DEFAULT_BASE_URL):
     return new_sandbox
 
 def _get_requester(base_url):
-    # Figure out whether CyREST available only via Jupyter-Bridge and what the default sandbox should be
+    # Figure out whether CyREST available only via Jupyter-Bridge and what the default sandbox should be. The decision
+    # is remembered per base_url and reused until the environment changes or the default sandbox is reset.
+    state = get_client_state(base_url)
+    if state:
+        environment, requester, default_sandbox, sandbox_generation = state
+        if environment == execution_environment() and sandbox_generation == get_sandbox_generation():
+            if get_default_sandbox() != default_sandbox:
+                set_default_sandbox(**default_sandbox) # a request to another base_url may have replaced it
+            return requester, default_sandbox
+
     environment = _find_execution_environment(base_url)
     if environment == ExecutionEnvironment.REMOTE_JUPYTER_BRIDGE:
+        requester = do_request_jupyter_bridge
         default_sandbox = set_default_sandbox(**sandbox_initializer(sandboxName=PREDEFINED_SANDBOX_NAME))
-        return do_request_jupyter_bridge, default_sandbox
     elif environment == ExecutionEnvironment.REMOTE_DIRECT_URL:
+        requester = _do_request_local
         default_sandbox = set_default_sandbox(**sandbox_initializer(sandboxName=PREDEFINED_SANDBOX_NAME))
-        return _do_request_local, default_sandbox
     else: # for execution on shared Cytoscape workstation
+        requester = _do_request_local
         default_sandbox = set_default_sandbox(**sandbox_initializer(sandboxName=None))
-        return _do_request_local, default_sandbox
+    set_client_state(base_url, environment, requester, default_sandbox, get_sandbox_generation())
+    return requester, default_sandbox
 
 def _do_browser_open(url, base_url, **kwargs):
     # Figure out whether CyREST is local or remote ... if remote, issue a browser command through Jupyter-Bridge
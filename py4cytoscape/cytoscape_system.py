@@ -24,12 +24,15 @@ import sys
 
 # Internal module imports
 from . import commands
+from . import py4cytoscape_tuning
 
 # Internal module convenience imports
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log, narrate
 from ._version import __version__, _automation_api_version
+from .py4cytoscape_cache import get_vocabulary, set_vocabulary, load_vocabulary_file, clear_vocabulary
+from .py4cytoscape_cache import clear_layout_metadata, clear_collection_names
 
 
 @cy_log
@@ -37,6 +40,8 @@ def cytoscape_ping(base_url=DEFAULT_BASE_URL):
     """Ping Cytoscape
 
     Tests the connection to Cytoscape via CyREST and verifies that supported versions of Cytoscape and CyREST API are loaded.
+    Versions and other values remembered from an earlier connection are discarded, so pinging after restarting or
+    upgrading Cytoscape ensures that py4cytoscape sees the new Cytoscape.
 
     Args:
         base_url (str): Ignore unless you need to specify a custom domain,
@@ -55,6 +60,9 @@ def cytoscape_ping(base_url=DEFAULT_BASE_URL):
         You are connected to Cytoscape!
     """
     from .py4cytoscape_utils import verify_supported_versions
+    clear_vocabulary(base_url)
+    clear_layout_metadata(base_url)
+    clear_collection_names(base_url)
     verify_supported_versions(1, 3.6, base_url=base_url)
     return narrate('You are connected to Cytoscape!')
 
@@ -62,6 +70,9 @@ def cytoscape_ping(base_url=DEFAULT_BASE_URL):
 def cytoscape_version_info(base_url=DEFAULT_BASE_URL):
     """Return the versions of the current Cytoscape and CyREST API.
 
+    The versions are fetched once per connection to Cytoscape. Call ``cytoscape_ping()`` to fetch them again (e.g.,
+    after restarting Cytoscape).
+
     Args:
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://localhost:1234
@@ -78,13 +89,19 @@ def cytoscape_version_info(base_url=DEFAULT_BASE_URL):
         >>> cytoscape_version_info()
         {'apiVersion': 'v1', 'cytoscapeVersion': '3.8.1', 'automationAPIVersion': '0.0.0', 'py4cytoscapeVersion': '0.0.2'}
     """
-    versions = commands.cyrest_get('version', base_url=base_url)
-    if len(versions) == 0:
-        raise CyError('CyREST connection problem. py4cytoscape cannot continue!')
-    versions.update({'automationAPIVersion': _automation_api_version, 'py4cytoscapeVersion': __version__})
-    versions.update(commands.sub_versions(base_url=base_url))
+    versions = get_vocabulary(base_url, 'version')
+    if versions is None:
+        versions = commands.cyrest_get('version', base_url=base_url)
+        if len(versions) == 0:
+            raise CyError('CyREST connection problem. py4cytoscape cannot continue!')
+        versions.update({'automationAPIVersion': _automation_api_version, 'py4cytoscapeVersion': __version__})
+        versions.update(commands.sub_versions(base_url=base_url))
+        set_vocabulary(base_url, 'version', versions)
+    if py4cytoscape_tuning.VOCABULARY_CACHE_DIR and get_vocabulary(base_url, 'apps') is None:
+        set_vocabulary(base_url, 'apps', _get_installed_apps(base_url))
+        load_vocabulary_file(base_url) # now that the Cytoscape version and apps are known
 
-    return versions
+    return dict(versions)
 
 
 @cy_log
@@ -186,3 +203,22 @@ def cytoscape_free_memory(base_url=DEFAULT_BASE_URL):
     except:
         raise CyError('CyREST connection problem. py4cytoscape cannot continue!')
 
+
+def _get_installed_apps(base_url):
+    # Return a sorted list of the installed apps and their versions, or '' if they can't be listed (e.g., before
+    # Cytoscape 3.7), in which case vocabulary isn't persisted
+    try:
+        apps = commands.commands_post('apps list installed', base_url=base_url)
+    except CyError:
+        return ''
+    return sorted(f'{app.get("appName")} {app.get("version")}' for app in apps)
+
+def _get_vocabulary(item, fetch, base_url=DEFAULT_BASE_URL):
+    # Return a copy of the vocabulary item's value, calling fetch() to get the value from Cytoscape if it isn't known
+    value = get_vocabulary(base_url, item)
+    if value is None and py4cytoscape_tuning.VOCABULARY_CACHE_DIR:
+        cytoscape_version_info(base_url=base_url) # value may be persisted for this Cytoscape version
+        value = get_vocabulary(base_url, item)
+    if value is None:
+        value = set_vocabulary(base_url, item, fetch())
+    return list(value)
@@ -25,15 +25,17 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 import time
 import json
 import warnings
+import operator
 import numpy as np
+import pandas as pd
 
 # Internal module imports
 from . import commands
 from . import networks
 from . import network_selection
 from . import tables
-from . import style_bypasses
 from . import sandbox
+from . import network_views
 
 # External library imports
 from .exceptions import CyError
@@ -41,9 +43,10 @@ from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log, show_error
 from .py4cytoscape_tuning import CATCHUP_FILTER_SECS
 from .py4cytoscape_sandbox import get_abs_sandbox_path
+from .py4cytoscape_cache import get_vocabulary, set_vocabulary
 
 @cy_log
-def apply_filter(filter_name='Default filter', hide=False, network=None, base_url=DEFAULT_BASE_URL):
+def apply_filter(filter_name='Default filter', hide=False, network=None, base_url=DEFAULT_BASE_URL, *, get_suids=False):
     """Run an existing filter by supplying the filter name.
 
     Args:
@@ -54,6 +57,7 @@ def apply_filter(filter_name='Default filter', hide=False, network=None, base_ur
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://localhost:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        get_suids (bool): True to return node and edge SUIDs; False (the default) to return node and edge names
 
     Returns:
         dict: {'nodes': <node list>, 'edges': <edge list>} returns list of nodes and edges selected after filter executes
@@ -67,6 +71,8 @@ def apply_filter(filter_name='Default filter', hide=False, network=None, base_ur
         {'nodes': ['YDR395W', 'YLR362W', 'YPL248C', 'YGL035C'], 'edges': None}
         >>> apply_filter('degree filter 1x', hide=True, network='My Network')
         {'nodes': ['YDR395W', 'YLR362W', 'YPL248C', 'YGL035C'], 'edges': None}
+        >>> apply_filter('degree filter 1x', get_suids=True)
+        {'nodes': [107514, 107504, 107500, 107454], 'edges': None}
 
     See Also:
         :meth:`unhide_all`
@@ -80,12 +86,12 @@ def apply_filter(filter_name='Default filter', hide=False, network=None, base_ur
     # TODO: It looks like R can't properly use filter_name with blank embedded, and doesn't wait for filter to be applied
     res = commands.commands_post(f'filter apply container="filter" name="{filter_name}" network=SUID:"{net_suid}"',
                                  base_url=base_url)
-    return _check_selected(hide, net_suid, base_url)
+    return _check_selected(hide, net_suid, base_url, get_suids=get_suids)
 
 
 @cy_log
 def create_column_filter(filter_name, column, criterion, predicate, caseSensitive=False, anyMatch=True, type='nodes',
-                         hide=False, network=None, base_url=DEFAULT_BASE_URL, *, apply=True):
+                         hide=False, network=None, base_url=DEFAULT_BASE_URL, *, apply=True, get_suids=False):
     """Create Column Filter.
 
     Create a filter to control node or edge selection. Works on columns of boolean, string, numeric
@@ -114,6 +120,7 @@ def create_column_filter(filter_name, column, criterion, predicate, caseSensitiv
             port or version to connect to the CyREST API. Default is http://localhost:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
         apply (bool): True to execute filter immediately; False to define filter but not execute it
+        get_suids (bool): True to return node and edge SUIDs; False (the default) to return node and edge names
 
     Returns:
         dict: {'nodes': <node list>, 'edges': <edge list>} returns list of nodes and edges selected after filter executes; None if filter wasn't applied
@@ -145,7 +152,7 @@ def create_column_filter(filter_name, column, criterion, predicate, caseSensitiv
     if column not in tables.get_table_column_names(type[:4], base_url=base_url):
         raise CyError('Column "%s" does not exist in the "%s" table' % (column, type[:4]))
 
-    if predicate == "REGEX" and check_supported_versions(cytoscape='3.9', base_url=base_url):
+    if predicate == "REGEX" and _is_pre_3_9(base_url):
         show_error('Warning -- Cytoscape version pre-3.9 in use ... REGEX filter may hang forever')
     elif predicate in ['BETWEEN', 'IS_NOT_BETWEEN']:
         if not isinstance(criterion, list) or len(criterion) != 2:
@@ -185,12 +192,13 @@ def create_column_filter(filter_name, column, criterion, predicate, caseSensitiv
                 'parameters': {'criterion': criterion, 'columnName': column, 'predicate': predicate,
                                'caseSensitive': caseSensitive, 'anyMatch': anyMatch, 'type': type}}
     cmd_body = {'name': filter_name, 'json': json.dumps(cmd_json)}
-    return _create_filter_and_finish('commands/filter/create', cmd_body, hide, apply, network, base_url)
+    return _create_filter_and_finish('commands/filter/create', cmd_body, hide, apply, network, base_url,
+                                     get_suids=get_suids)
 
 
 @cy_log
 def create_degree_filter(filter_name, criterion, predicate='BETWEEN', edge_type='ANY', hide=False, network=None,
-                         base_url=DEFAULT_BASE_URL, *, apply=True):
+                         base_url=DEFAULT_BASE_URL, *, apply=True, get_suids=False):
     """Create Degree Filter.
 
     Creates a filter to control node selection base on in/out degree.
@@ -207,6 +215,7 @@ def create_degree_filter(filter_name, criterion, predicate='BETWEEN', edge_type=
             port or version to connect to the CyREST API. Default is http://localhost:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
         apply (bool): True to execute filter immediately; False to define filter but not execute it
+        get_suids (bool): True to return node and edge SUIDs; False (the default) to return node and edge names
 
     Returns:
         dict: {'nodes': <node list>, 'edges': <edge list>} returns list of nodes and edges selected after filter executes; None if filter wasn't applied
@@ -235,11 +244,13 @@ def create_degree_filter(filter_name, criterion, predicate='BETWEEN', edge_type=
     cmd_json = {'id': 'DegreeFilter',
                 'parameters': {'criterion': criterion, 'predicate': predicate, 'edgeType': edge_type}}
     cmd_body = {'name': filter_name, 'json': json.dumps(cmd_json)}
-    return _create_filter_and_finish('commands/filter/create', cmd_body, hide, apply, network, base_url)
+    return _create_filter_and_finish('commands/filter/create', cmd_body, hide, apply, network, base_url,
+                                     get_suids=get_suids)
 
 
 @cy_log
-def create_composite_filter(filter_name, filter_list, type='ALL', hide=False, network=None, base_url=DEFAULT_BASE_URL, *, apply=True):
+def create_composite_filter(filter_name, filter_list, type='ALL', hide=False, network=None, base_url=DEFAULT_BASE_URL, *,
+                            apply=True, get_suids=False):
     """Combine filters to control node and edge selection based on previously created filters.
 
     Args:
@@ -253,6 +264,7 @@ def create_composite_filter(filter_name, filter_list, type='ALL', hide=False, ne
             port or version to connect to the CyREST API. Default is http://localhost:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
         apply (bool): True to execute filter immediately; False to define filter but not execute it
+        get_suids (bool): True to return node and edge SUIDs; False (the default) to return node and edge names
 
     Returns:
         dict: {'nodes': <node list>, 'edges': <edge list>} returns list of nodes and edges selected after filter executes; None if filter wasn't applied
@@ -289,7 +301,8 @@ def create_composite_filter(filter_name, filter_list, type='ALL', hide=False, ne
 
     cmd_json = {'id': 'CompositeFilter', 'parameters': {'type': type}, 'transformers': trans_list}
     cmd_body = {'name': filter_name, 'json': json.dumps(cmd_json)}
-    return _create_filter_and_finish('commands/filter/create', cmd_body, hide, apply, network, base_url)
+    return _create_filter_and_finish('commands/filter/create', cmd_body, hide, apply, network, base_url,
+                                     get_suids=get_suids)
 
 
 @cy_log
@@ -394,9 +407,211 @@ def import_filters(filename, base_url=DEFAULT_BASE_URL):
     return res
 
 
-def _create_filter_and_finish(cmd, cmd_body, hide, apply, network, base_url):
+@cy_log
+def evaluate_column_filter(snapshot, column, criterion, predicate, caseSensitive=False, anyMatch=True, type='nodes'):
+    """Evaluate a column filter on the client, without creating a filter in Cytoscape.
+
+    The filter is evaluated against the node or edge table in a :class:`NetworkSnapshot`, so no request is made
+    to Cytoscape. This makes it practical to try many criteria (e.g., to score thousands of thresholds) and to
+    send only the chosen result to Cytoscape, via :meth:`select_filter_result`. Criteria and predicates mean the same
+    as for :meth:`create_column_filter`. Null values never pass.
+
+    Args:
+        snapshot (NetworkSnapshot): Client-side copy of the network, containing ``column``
+        column (str): Table column to base filter upon.
+        criterion (list, bool, str, int or float): For boolean columns: True or False. For string columns: a
+            string value, e.g., "hello". If the predicate is REGEX then this can be a regular expression as
+            accepted by the Python re module, and it must match the whole value.
+            For numeric columns: If the predicate is BETWEEN or IS_NOT_BETWEEN then this is a two-element list of
+            numbers, example: [1,5], otherwise a single number.
+        predicate (str):  For boolean columns: IS, IS_NOT. For string columns: IS, IS_NOT, CONTAINS, DOES_NOT_CONTAIN,
+            REGEX. For numeric columns: IS, IS_NOT, GREATER_THAN, GREATER_THAN_OR_EQUAL, LESS_THAN, LESS_THAN_OR_EQUAL,
+            BETWEEN, IS_NOT_BETWEEN.
+        caseSensitive (bool): If string matching should be case sensitive. Default is FALSE.
+        anyMatch (bool): Only applies to List columns. If true then at least one element in the list must pass the
+            filter, if false then all the elements in the list must pass the filter. Default is TRUE.
+        type (str): Evaluate filter on "nodes" (default) or "edges".
+
+    Returns:
+        Series: True for each node or edge that passes the filter, indexed by SUID and named by ``type``
+
+    Raises:
+        CyError: if column doesn't exist in the snapshot's table, or predicate or criterion is invalid
+
+    Examples:
+        >>> snap = NetworkSnapshot()
+        >>> evaluate_column_filter(snap, 'gal1RGexp', [-1, 1], 'IS_NOT_BETWEEN')
+        SUID
+        107508    False
+        107507     True
+        ...
+        Name: nodes, Length: 330, dtype: bool
+        >>> {t: evaluate_column_filter(snap, 'gal1RGexp', t, 'GREATER_THAN').sum() for t in np.arange(0, 2, 0.01)}
+        {0.0: 152, 0.01: 150, ...}
+        >>> evaluate_column_filter(snap, 'name', 'YLR044C', 'CONTAINS', type='edges')
+    """
+    table = _snapshot_table(snapshot, type)
+    if column not in table.columns:
+        raise CyError(f'Column "{column}" does not exist in the "{type[:4]}" table')
+
+    values = table[column]
+    first_value = values.dropna().head(1)
+    if len(first_value) and isinstance(first_value.iloc[0], list):
+        # Evaluate each element of a list column, and then see whether any (or all) of a row's elements passed
+        passed = _column_predicate(values.explode(), criterion, predicate, caseSensitive)
+        passed = passed.groupby(level=0, sort=False).any() if anyMatch else passed.groupby(level=0, sort=False).all()
+        passed = passed.reindex(values.index, fill_value=False)
+    else:
+        passed = _column_predicate(values, criterion, predicate, caseSensitive)
+    return passed.rename(type)
+
+
+@cy_log
+def evaluate_degree_filter(snapshot, criterion, predicate='BETWEEN', edge_type='ANY'):
+    """Evaluate a degree filter on the client, without creating a filter in Cytoscape.
+
+    Degrees are counted from the topology in a :class:`NetworkSnapshot`, so no request is made to Cytoscape. Criteria
+    and predicates mean the same as for :meth:`create_degree_filter`.
+
+    Args:
+        snapshot (NetworkSnapshot): Client-side copy of the network
+        criterion (list): A two-element vector of numbers, example: [1,5].
+        predicate (str):  BETWEEN (default) or IS_NOT_BETWEEN
+        edge_type (str): Type of edges to consider in degree count: ANY (default), INCOMING or OUTGOING. Snapshots don't
+            record whether edges are directed, so UNDIRECTED and DIRECTED aren't available.
+
+    Returns:
+        Series: True for each node that passes the filter, indexed by SUID and named 'nodes'
+
+    Raises:
+        CyError: if criterion is not list of two values, or predicate or edge type is invalid
+
+    Examples:
+        >>> snap = NetworkSnapshot()
+        >>> evaluate_degree_filter(snap, [2, 5]) # any nodes having between 2 and 5 edges
+        SUID
+        107508    False
+        107507     True
+        ...
+        Name: nodes, Length: 330, dtype: bool
+        >>> evaluate_degree_filter(snap, [2, 5], edge_type='INCOMING') # between 2 and 5 incoming edges
+    """
+    if not isinstance(criterion, list) or len(criterion) != 2:
+        raise CyError(f'Criterion "{criterion}" must be a list of two numeric values, e.g., [0.5, 2.0]')
+
+    node_count = len(snapshot.node_suids)
+    degrees = {'OUTGOING': lambda: np.bincount(snapshot.edge_source, minlength=node_count),
+               'INCOMING': lambda: np.bincount(snapshot.edge_target, minlength=node_count)}
+    degrees['ANY'] = lambda: degrees['OUTGOING']() + degrees['INCOMING']()
+    if edge_type not in degrees:
+        raise CyError(f'Edge type "{edge_type}" is invalid; options include {list(degrees)}')
+    degree = degrees[edge_type]()
+
+    passed = (degree >= criterion[0]) & (degree <= criterion[1])
+    if predicate == 'IS_NOT_BETWEEN':
+        passed = ~passed
+    elif predicate != 'BETWEEN':
+        raise CyError(f'Predicate "{predicate}" is invalid; options include BETWEEN and IS_NOT_BETWEEN')
+    return pd.Series(passed, index=snapshot.nodes.index, name='nodes')
+
+
+@cy_log
+def evaluate_composite_filter(filter_results, type='ALL'):
+    """Combine filter results evaluated on the client, as :meth:`create_composite_filter` combines filters.
+
+    Args:
+        filter_results (list): List of results returned by :meth:`evaluate_column_filter`,
+            :meth:`evaluate_degree_filter` or this function, all for nodes or all for edges
+        type (str): Type of composition, requiring ALL (default) or ANY results to pass for a node or edge to pass.
+
+    Returns:
+        Series: True for each node or edge that passes the combined filter, indexed by SUID and named 'nodes' or
+        'edges'
+
+    Raises:
+        CyError: if filter list contains less than two results or mixes node and edge results, or type is invalid
+
+    Examples:
+        >>> high = evaluate_column_filter(snap, 'gal1RGexp', 1, 'GREATER_THAN')
+        >>> hubs = evaluate_degree_filter(snap, [10, 100])
+        >>> evaluate_composite_filter([high, hubs]) # nodes that are both
+        >>> evaluate_composite_filter([high, hubs], type='ANY') # nodes that are either ... same as high | hubs
+    """
+    if len(filter_results) < 2:
+        raise CyError('Filter list is invalid. Must provide a list of two or more filter results')
+    result_type = {result.name for result in filter_results}
+    if len(result_type) != 1:
+        raise CyError(f'Filter results must all be for nodes or all be for edges, not {sorted(map(str, result_type))}')
+    if type not in ['ALL', 'ANY']:
+        raise CyError(f'Composition type "{type}" is invalid; options include ALL and ANY')
+
+    passed = pd.concat(filter_results, axis=1).fillna(False).astype(bool)
+    passed = passed.all(axis=1) if type == 'ALL' else passed.any(axis=1)
+    return passed.rename(result_type.pop())
+
+
+@cy_log
+def select_filter_result(snapshot, filter_result, hide=False, *, get_suids=False):
+    """Select the nodes or edges that passed a filter evaluated on the client.
+
+    As with a filter applied in Cytoscape, the nodes (or edges) that passed are selected and everything else is
+    deselected. The selection is sent to Cytoscape in a few bulk requests, and the names returned come from the
+    snapshot.
+
+    Args:
+        snapshot (NetworkSnapshot): Client-side copy of the network the filter was evaluated on
+        filter_result (Series): Result returned by :meth:`evaluate_column_filter`, :meth:`evaluate_degree_filter` or
+            :meth:`evaluate_composite_filter`
+        hide (bool): Whether to hide filtered out nodes and edges. Default is FALSE.
+            Ignored if all nodes or edges are filtered out. This is an alternative to filtering for node and edge selection.
+        get_suids (bool): True to return node and edge SUIDs; False (the default) to return node and edge names
+
+    Returns:
+        dict: {'nodes': <node list>, 'edges': <edge list>} returns list of nodes and edges selected
+
+    Raises:
+        CyError: if filter result isn't for nodes or edges
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> select_filter_result(snap, evaluate_degree_filter(snap, [8, 10]))
+        {'nodes': ['YDR395W', 'YLR362W', 'YPL248C', 'YGL035C'], 'edges': None}
+        >>> select_filter_result(snap, evaluate_degree_filter(snap, [8, 10]), hide=True, get_suids=True)
+        {'nodes': [107514, 107504, 107500, 107454], 'edges': None}
+    """
+    table = _snapshot_table(snapshot, filter_result.name)
+    net_suid, base_url = snapshot.network_suid, snapshot.base_url
+    passed = filter_result.reindex(table.index, fill_value=False).to_numpy(dtype=bool)
+    sel_suids = table.index[passed].tolist()
+
+    # Deselect everything, and then select what passed
+    network_selection.clear_selection(type='both', network=net_suid, base_url=base_url)
+    if sel_suids:
+        commands.cyrest_put(f'networks/{net_suid}/tables/default{filter_result.name[:4]}',
+                            body={'key': 'SUID', 'dataKey': 'SUID',
+                                  'data': [{'SUID': suid, 'selected': True} for suid in sel_suids]},
+                            require_json=False, base_url=base_url)
+
+    sel_nodes, sel_edges = (sel_suids, []) if filter_result.name == 'nodes' else ([], sel_suids)
+    if hide:
+        _show_only_selected(net_suid, sel_nodes, sel_edges, base_url,
+                            all_nodes=snapshot.node_suids.tolist(), all_edges=snapshot.edge_suids.tolist())
+
+    if not sel_suids:
+        sel_suids = None
+    elif not get_suids:
+        if 'name' in table.columns:
+            sel_suids = table['name'].to_numpy(dtype=object)[passed].tolist()
+        else:
+            sel_suids = edge_suid_to_edge_name(sel_suids, net_suid, base_url=base_url)
+    return {'nodes': sel_suids, 'edges': None} if filter_result.name == 'nodes' else {'nodes': None, 'edges': sel_suids}
+
+
+def _create_filter_and_finish(cmd, cmd_body, hide, apply, network, base_url, get_suids=False):
     AUTO_APPLY_THRESHOLD = 100000
-    if check_supported_versions(cytoscape='3.9', base_url=base_url) is None:
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+    pre_3_9 = _is_pre_3_9(base_url)
+    if not pre_3_9:
         cmd_body['apply'] = apply
         res = commands.cyrest_post(cmd, body=cmd_body, base_url=base_url)
     else:
@@ -404,38 +619,110 @@ def _create_filter_and_finish(cmd, cmd_body, hide, apply, network, base_url):
         # the total of nodes and edges was 100,000 or more. So, we create the filter and then
         # consider applying it if it wasn't automatically applied already.
         res = commands.cyrest_post(cmd, body=cmd_body, base_url=base_url)
-        if networks.get_node_count(network=network, base_url=base_url) \
-           + networks.get_edge_count(network=network, base_url=base_url) > AUTO_APPLY_THRESHOLD:
+        node_count, edge_count = commands.cyrest_get_batch([f'networks/{net_suid}/nodes/count',
+                                                            f'networks/{net_suid}/edges/count'], base_url=base_url)
+        if node_count['count'] + edge_count['count'] > AUTO_APPLY_THRESHOLD:
             if apply:
                 show_error('Warning -- Cytoscape version pre-3.9 in use ... explicitly applying filter')
                 res = commands.commands_post(
-                    f'filter apply container="filter" name="{cmd_body["name"]}" network="{network}"',
+                    f'filter apply container="filter" name="{cmd_body["name"]}" network=SUID:"{net_suid}"',
                     base_url=base_url)
         elif not apply:
             raise CyError('Attempt to create but not apply filter in Cytoscape version pre-3.9 is not supported')
 
-    return _check_selected(hide, network, base_url)
+    return _check_selected(hide, net_suid, base_url, get_suids=get_suids, pre_3_9=pre_3_9)
 
 
-def _check_selected(hide, network, base_url):
-    if check_supported_versions(cytoscape='3.9', base_url=base_url):
+def _check_selected(hide, net_suid, base_url, get_suids=False, pre_3_9=None):
+    if pre_3_9 is None: pre_3_9 = _is_pre_3_9(base_url)
+    if pre_3_9:
     # This delay became unnecessary in Cytoscape 3.9
         show_error('Warning -- Cytoscape version pre-3.9 in use ... settling delay inserted after filter execution')
         time.sleep(CATCHUP_FILTER_SECS)  # Yikes! Have to wait a second for selection to settle!
 
-    sel_nodes = network_selection.get_selected_nodes(network=network, base_url=base_url)
-    sel_edges = network_selection.get_selected_edges(network=network, base_url=base_url)
+    # Fetch the selected nodes and edges together, as SUIDs
+    sel_nodes, sel_edges = commands.cyrest_get_batch([f'networks/{net_suid}/nodes', f'networks/{net_suid}/edges'],
+                                                     parameters={'column': 'selected', 'query': 'true'},
+                                                     base_url=base_url)
 
     if hide:
-        res = style_bypasses.unhide_all(network=network, base_url=base_url)
-        # TODO: Ignore return result res??
-        if sel_nodes is not None and len(sel_nodes) != 0:
-            res= style_bypasses.hide_nodes(network_selection.invert_node_selection(network=network, base_url=base_url)['nodes'])
-        if sel_edges is not None and len(sel_edges) != 0:
-            res = style_bypasses.hide_edges(network_selection.invert_edge_selection(network=network, base_url=base_url)['edges'])
+        _show_only_selected(net_suid, sel_nodes, sel_edges, base_url)
+
+    # Translate SUIDs to names only if the caller wants names
+    sel_nodes = sel_nodes or None
+    sel_edges = sel_edges or None
+    if not get_suids:
+        if sel_nodes: sel_nodes = node_suid_to_node_name(sel_nodes, net_suid, base_url=base_url)
+        if sel_edges: sel_edges = edge_suid_to_edge_name(sel_edges, net_suid, base_url=base_url)
 
     return {'nodes': sel_nodes, 'edges': sel_edges}
 
+
+def _show_only_selected(net_suid, sel_nodes, sel_edges, base_url, all_nodes=None, all_edges=None):
+    # Hide whatever isn't selected by setting the visibility bypass of every node and every edge at once. If no nodes
+    # (or edges) are selected, all of them are shown. Unlike inverting the selection and hiding it, this leaves the
+    # selection as the filter made it.
+    view_suid = network_views.get_network_views(net_suid, base_url=base_url)[0]
+    if all_nodes is None or all_edges is None:
+        all_nodes, all_edges = commands.cyrest_get_batch([f'networks/{net_suid}/nodes', f'networks/{net_suid}/edges'],
+                                                         base_url=base_url)
+    for table, visual_property, all_suids, sel_suids in [('nodes', 'NODE_VISIBLE', all_nodes, sel_nodes),
+                                                         ('edges', 'EDGE_VISIBLE', all_edges, sel_edges)]:
+        if not all_suids: continue
+        sel_suids = set(sel_suids)
+        body_list = [{'SUID': str(suid),
+                      'view': [{'visualProperty': visual_property,
+                                'value': 'true' if not sel_suids or suid in sel_suids else 'false'}]}
+                     for suid in all_suids]
+        commands.cyrest_put(f'networks/{net_suid}/views/{view_suid}/{table}', parameters={'bypass': True},
+                            body=body_list, base_url=base_url, require_json=False)
+
+
+def _is_pre_3_9(base_url):
+    # Cytoscape 3.9 changed how filters are created and applied ... remember whether this Cytoscape predates it
+    pre_3_9 = get_vocabulary(base_url, 'filters pre-3.9')
+    if pre_3_9 is None:
+        pre_3_9 = set_vocabulary(base_url, 'filters pre-3.9',
+                                 check_supported_versions(cytoscape='3.9', base_url=base_url) is not None)
+    return pre_3_9
+
+_NUMERIC_COMPARISONS = {'GREATER_THAN': operator.gt, 'GREATER_THAN_OR_EQUAL': operator.ge,
+                        'LESS_THAN': operator.lt, 'LESS_THAN_OR_EQUAL': operator.le}
+
+def _snapshot_table(snapshot, type):
+    # Return the snapshot's node or edge table, as named by a filter type
+    if type not in ['nodes', 'edges']:
+        raise CyError(f'Filter type "{type}" is invalid; options include nodes and edges')
+    return snapshot.nodes if type == 'nodes' else snapshot.edges
+
+def _column_predicate(values, criterion, predicate, case_sensitive):
+    # Evaluate a column filter predicate on each value, vectorized ... null values never pass
+    present = values.notna()
+    if predicate in ['BETWEEN', 'IS_NOT_BETWEEN']:
+        if not isinstance(criterion, list) or len(criterion) != 2:
+            raise CyError(f'Criterion "{criterion}" must be a list of two numeric values, e.g., [0.5, 2.0]')
+        numbers = pd.to_numeric(values, errors='coerce')
+        passed = (numbers >= criterion[0]) & (numbers <= criterion[1])
+        if predicate == 'IS_NOT_BETWEEN': passed = ~passed & numbers.notna()
+    elif predicate in _NUMERIC_COMPARISONS:
+        passed = _NUMERIC_COMPARISONS[predicate](pd.to_numeric(values, errors='coerce'), criterion)
+    elif predicate in ['IS', 'IS_NOT']:
+        if isinstance(criterion, str) and not case_sensitive:
+            passed = values.astype('string').str.lower() == criterion.lower()
+        else:
+            passed = values == criterion
+        passed = passed.fillna(False).astype(bool)
+        if predicate == 'IS_NOT': passed = ~passed & present
+    elif predicate in ['CONTAINS', 'DOES_NOT_CONTAIN']:
+        passed = values.astype('string').str.contains(str(criterion), case=case_sensitive, regex=False)
+        passed = passed.fillna(False).astype(bool)
+        if predicate == 'DOES_NOT_CONTAIN': passed = ~passed & present
+    elif predicate == 'REGEX':
+        passed = values.astype('string').str.fullmatch(str(criterion), case=case_sensitive)
+    else:
+        raise CyError(f'Predicate "{predicate}" is invalid')
+    return passed.fillna(False).astype(bool)
+
 # TODO: Need to add Topological filter, too.
 # TODO: Need to add rename/remove filter
 # TODO: Need to add filter chaining
@@ -37,11 +37,13 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 # Internal module imports
 from . import commands
 from . import networks
+from . import cytoscape_system
 
 # Internal module convenience imports
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
+from .py4cytoscape_cache import get_layout_metadata, set_layout_metadata
 
 
 # ==============================================================================
@@ -220,8 +222,7 @@ def get_layout_names(base_url=DEFAULT_BASE_URL):
         >>> get_layout_names()
         ['attribute-circle', 'stacked-node-layout', 'degree-circle', 'circular', 'attributes-layout', 'kamada-kawai', 'force-directed', 'cose', 'grid', 'hierarchical', 'fruchterman-rheingold', 'isom']
     """
-    res = commands.cyrest_get('apply/layouts', base_url=base_url)
-    return res
+    return list(_get_layout_metadata(base_url)['names'])
 
 
 @cy_log
@@ -248,15 +249,17 @@ def get_layout_name_mapping(base_url=DEFAULT_BASE_URL):
         >>> get_layout_name_mapping()
         {'Attribute Circle Layout': 'attribute-circle', 'Stacked Node Layout': 'stacked-node-layout' ...}
     """
-    layout_names = get_layout_names(base_url=base_url)
-    layout_mapping = {}
+    layout_metadata = _get_layout_metadata(base_url)
+    long_names = layout_metadata['long_names']
 
-    # get the full name of a layout and create {fullname:layoutname} in dictionary
-    for layout_name in layout_names:
-        res = commands.cyrest_get(f'apply/layouts/{layout_name}', base_url=base_url)
-        layout_mapping.update({res['longName']: layout_name})
+    # get the full names of layouts not seen before, all at once, and create {fullname:layoutname} in dictionary
+    missing_names = [layout_name for layout_name in layout_metadata['names'] if layout_name not in long_names]
+    if missing_names:
+        res = commands.cyrest_get_batch([f'apply/layouts/{layout_name}' for layout_name in missing_names],
+                                        base_url=base_url)
+        long_names.update({layout_name: layout['longName'] for layout_name, layout in zip(missing_names, res)})
 
-    return layout_mapping
+    return {long_names[layout_name]: layout_name for layout_name in layout_metadata['names']}
 
 
 @cy_log
@@ -281,9 +284,7 @@ def get_layout_property_names(layout_name, base_url=DEFAULT_BASE_URL):
         >>> get_layout_property_names('force-directed')
         ['numIterations', 'defaultSpringCoefficient', 'defaultSpringLength', 'defaultNodeMass', 'isDeterministic', 'singlePartition']
     """
-    res = commands.cyrest_get(f'apply/layouts/{layout_name}/parameters', base_url=base_url)
-    param_names = [param_def['name'] for param_def in res]
-    return param_names
+    return list(_get_layout_parameters(layout_name, base_url))
 
 
 @cy_log
@@ -310,9 +311,7 @@ def get_layout_property_type(layout_name, property_name, base_url=DEFAULT_BASE_U
         >>> get_layout_property_names('force-directed','defaultSpringLength')
         "double"
     """
-    res = commands.cyrest_get(f'apply/layouts/{layout_name}/parameters', base_url=base_url)
-    param_types = {param['name']: param['type'] for param in res}
-    return param_types[property_name]
+    return _get_layout_parameters(layout_name, base_url)[property_name]['type']
 
 
 @cy_log
@@ -339,9 +338,8 @@ def get_layout_property_value(layout_name, property_name, base_url=DEFAULT_BASE_
         >>> get_layout_property_value('force-directed','defaultSpringLength')
         50
     """
-    res = commands.cyrest_get(f'apply/layouts/{layout_name}/parameters', base_url=base_url)
-    param_values = {param['name']: param['value'] for param in res}
-    return param_values[property_name]
+    # Values can be changed in the Cytoscape GUI, so they're always read from Cytoscape
+    return _fetch_layout_parameters(layout_name, base_url)[property_name]
 
 
 # ==============================================================================
@@ -352,6 +350,8 @@ def get_layout_property_value(layout_name, property_name, base_url=DEFAULT_BASE_
 def set_layout_properties(layout_name, properties_dict, base_url=DEFAULT_BASE_URL):
     """Sets the specified properties for the specified layout.
 
+    All of the properties are checked before any are set, and then they are sent to Cytoscape together.
+
     Args:
         layout_name (str): Name of the layout
         properties_dict (dict): List of one or more ``property=value`` pairs
@@ -363,22 +363,24 @@ def set_layout_properties(layout_name, properties_dict, base_url=DEFAULT_BASE_UR
         str: ''
 
     Raises:
+        CyError: if a property is not a property of the layout
         requests.exceptions.RequestException: if layout_name is invalid or can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
         >>> set_layout_properties('force-directed', {'defaultSpringLength': 50, 'defaultSpringCoefficient': 6E-01})
         ''
     """
-    all_possible_properties = get_layout_property_names(layout_name)
+    all_possible_properties = _get_layout_parameters(layout_name, base_url)
 
-    res = ''
-    for prop, value in properties_dict.items():
+    for prop in properties_dict:
         if not prop in all_possible_properties:
             raise CyError(f'"{prop}" is not a property in layout "{layout_name}"')
-        else:
-            each_property = [{'name': prop, 'value': value}]
-            res = commands.cyrest_put(f'apply/layouts/{layout_name}/parameters', body=each_property,
-                                      base_url=base_url, require_json=False)
+
+    res = ''
+    if properties_dict:
+        all_properties = [{'name': prop, 'value': value} for prop, value in properties_dict.items()]
+        res = commands.cyrest_put(f'apply/layouts/{layout_name}/parameters', body=all_properties,
+                                  base_url=base_url, require_json=False)
     return res
 
 # ==============================================================================
@@ -444,3 +446,35 @@ def scale_layout(axis, scale_factor, selected_only=False, network=None, base_url
     res = commands.commands_post('layout scale axis='+ axis + ' scaleFactor=' + str(scale_factor) + ' network="SUID:' + str(suid) + '"' + ' selectedOnly=' + str(selected_only),
                              base_url=base_url)
     return res
+
+
+# ==============================================================================
+# V. Internal layout functions
+# ------------------------------------------------------------------------------------------------------------------------
+
+def _get_layout_metadata(base_url):
+    # Return the cached layout metadata, fetching the layout names again if they were read from a different Cytoscape
+    # version than the one now at base_url
+    version = cytoscape_system.cytoscape_version_info(base_url=base_url)['cytoscapeVersion']
+    layout_metadata = get_layout_metadata(base_url)
+    if layout_metadata is None or layout_metadata['version'] != version:
+        layout_names = commands.cyrest_get('apply/layouts', base_url=base_url)
+        layout_metadata = set_layout_metadata(base_url, version, layout_names)
+    return layout_metadata
+
+
+def _get_layout_parameters(layout_name, base_url):
+    # Return the cached {name: parameter definition} for a layout, fetching its definitions if needed. Definitions
+    # hold each parameter's type and description, but not its value, which can change.
+    parameters = _get_layout_metadata(base_url)['parameters']
+    if layout_name not in parameters:
+        _fetch_layout_parameters(layout_name, base_url)
+    return parameters[layout_name]
+
+
+def _fetch_layout_parameters(layout_name, base_url):
+    # Return the current {name: value} of a layout's parameters, caching their definitions along the way
+    res = commands.cyrest_get(f'apply/layouts/{layout_name}/parameters', base_url=base_url)
+    _get_layout_metadata(base_url)['parameters'][layout_name] = \
+        {param['name']: {key: value for key, value in param.items() if key != 'value'} for param in res}
+    return {param['name']: param['value'] for param in res}
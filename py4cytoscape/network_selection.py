@@ -25,10 +25,12 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 """
 
 # External library imports
+import pandas as pd
 
 # Internal module imports
 from . import commands
 from . import networks
+from . import tables
 
 # Internal module convenience imports
 from .py4cytoscape_utils import *
@@ -197,18 +199,9 @@ def select_nodes(nodes, by_col='SUID', preserve_current_selection=True, network=
 
     if not preserve_current_selection: clear_selection(type='nodes', network=suid, base_url=base_url)
 
-    # TODO: See why R version works with empty nodes list (which should mean "all") or a node list (which is missing a close ")
-    if not nodes or nodes == '':  # take care of case where nodes is empty
-        node_list_str = ''
-    else:
-        nodes = normalize_list(nodes)
-
-        # create list of COL:VALUE that includes all requested nodes
-        node_list_str = f'{by_col}:{nodes[0]}' # Allow leading or trailing blanks
-        for n in range(1, len(nodes)):
-            node_list_str += f',{by_col}:{nodes[n]}'
-    res = commands.commands_post(f'network select network=SUID:"{suid}" nodeList="{node_list_str}"', base_url=base_url)
-    return res
+    selected = _select_by_suid('node', _find_suids('node', nodes, by_col, suid, base_url=base_url),
+                               preserve_current_selection, suid, base_url=base_url)
+    return {'nodes': selected, 'edges': []} if selected else {}
 
 
 @cy_log
@@ -481,20 +474,9 @@ def select_edges(edges, by_col='SUID', preserve_current_selection=True, network=
 
     if not preserve_current_selection: clear_selection(type='edges', network=suid, base_url=base_url)
 
-    # TODO: See why R version works with empty nodes list (which should mean "all") or a node list (which is missing a close ")
-    # TODO: Should edges default to None?
-    if not edges or edges == '':
-        edge_list_str = ''
-    else:
-        edges = normalize_list(edges)
-
-        # create list of COL:VALUE that includes all requested nodes
-        edge_list_str = f'{by_col}:{edges[0]}'
-        for n in range(1, len(edges)):
-            edge_list_str += f',{by_col}:{edges[n]}'
-    res = commands.commands_post(f'network select network=SUID:"{suid}" edgeList="{edge_list_str}"',
-                                 base_url=base_url)
-    return res
+    selected = _select_by_suid('edge', _find_suids('edge', edges, by_col, suid, base_url=base_url),
+                               preserve_current_selection, suid, base_url=base_url)
+    return {'nodes': [], 'edges': selected} if selected else {}
 
 
 @cy_log
@@ -946,3 +928,48 @@ def delete_self_loops(network=None, base_url=DEFAULT_BASE_URL):
     delete_selected_edges(net_suid, base_url=base_url)  # TODO: Would be better to return this value instead
 
     return clear_selection('both', network=net_suid, base_url=base_url)  # shouldn't be necessary
+
+
+# ==============================================================================
+# III. Internal selection functions
+# ------------------------------------------------------------------------------
+
+def _find_suids(table, values, by_col, net_suid, base_url=DEFAULT_BASE_URL):
+    # Return the SUIDs of the nodes or edges identified by values in column by_col. Values are resolved here, from a
+    # single fetch of the column, so they needn't be sent to Cytoscape as a (possibly huge) command string.
+    if values is None or (isinstance(values, str) and values.strip() == ''):
+        return []
+    if isinstance(values, str): # Split a comma-separated list, but not at backslash-escaped commas
+        values = [value.strip() for value in re.split(r'(?<!\\),', values)]
+    elif not isinstance(values, (list, tuple, set, pd.Series, pd.Index)):
+        values = [values]
+    values = pd.Series(list(values), dtype=object)
+
+    if by_col == 'SUID': # Cytoscape rejects SUIDs that aren't in the network when they're selected
+        return [int(suid) for suid in pd.to_numeric(values, errors='coerce').dropna().astype('int64').unique()]
+
+    df = tables.get_table_columns(table, [by_col], 'default', net_suid, base_url=base_url)
+    if by_col not in df.columns:
+        raise CyError(f'Invalid {table} column "{by_col}"', caller=f'select_{table}s')
+    column = df[by_col]
+    wanted = values.astype(str).str.replace('\\,', ',', regex=False)
+    if pd.api.types.is_bool_dtype(column):
+        matches = column.astype(str).str.lower().isin(set(wanted.str.lower()))
+    else:
+        matches = column.astype(str).isin(set(wanted))
+        if pd.api.types.is_numeric_dtype(column):
+            matches |= column.isin(set(pd.to_numeric(wanted, errors='coerce').dropna()))
+    return [int(suid) for suid in df.index[matches]]
+
+def _select_by_suid(table, suids, preserve_current_selection, net_suid, base_url=DEFAULT_BASE_URL):
+    # Select nodes or edges by SUID with a single JSON request, keeping the current selection if requested. Cytoscape
+    # sets the selection to exactly the SUIDs sent, so the current selection is merged in first. Returns suids.
+    if suids:
+        selection = list(suids)
+        if preserve_current_selection:
+            current = commands.cyrest_get(f'networks/{net_suid}/{table}s',
+                                          parameters={'column': 'selected', 'query': 'true'}, base_url=base_url)
+            selection = list(dict.fromkeys(current + selection))
+        commands.cyrest_put(f'networks/{net_suid}/{table}s/selected', body=selection, base_url=base_url,
+                            require_json=False)
+    return suids
@@ -26,6 +26,13 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 # External library imports
 import sys
 import os
+import time
+import base64
+import hashlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
 
 # Internal module imports
 from . import commands
@@ -38,6 +45,7 @@ from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
 from .py4cytoscape_utils import verify_supported_versions
 from .py4cytoscape_sandbox import get_abs_sandbox_path
+from .py4cytoscape_cache import get_view_image, set_view_image
 
 @cy_log
 def create_view(layout=True, network=None, base_url=DEFAULT_BASE_URL):
@@ -345,59 +353,17 @@ def export_image(filename=None, type='PNG', resolution=None, units=None, height=
 
     # Determine which set of parameters are valid or invalid or deprecated based on Cytoscape version,
     # and then verify that the caller's parameters fit with the Cytoscape version
-    has_v10_params = all_graphics_details is not None \
-                     or hide_labels is not None \
-                     or transparent_background is not None \
-                     or export_text_as_font is not None \
-                     or orientation is not None \
-                     or page_size is not None
-    has_pre_v10_params = resolution is not None \
-                         or units is not None \
-                         or height is not None \
-                         or width is not None
-
-    if check_supported_versions(1, "3.10", base_url=base_url):
-        # Cytoscape appears to be pre-3.10
-        if has_v10_params:
-            raise CyError('Cannot use Cytoscape v3.10 parameters with pre-v3.10 Cytoscape')
-        use_v10_calls = False
-    else:
-        # Cytoscape is 3.10 or later
-        if has_v10_params:
-            # Caller specified one or more 3.10 parameters
-            if has_pre_v10_params:
-                raise CyError('Cannot use both Cytoscape v3.10 parameters and pre-v3.10 parameters')
-            if force_pre_3_10:
-                raise CyError('Cannot force call to Cytoscape pre-3.10 if v3.10 parameters are used')
-            use_v10_calls = True
-        else:
-            # Caller didn't specify any 3.10 parameters, but may have specified some pre-3.10 parameters
-            if force_pre_3_10:
-                use_v10_calls = False
-            else:
-                use_v10_calls = not has_pre_v10_params
-                if not use_v10_calls:
-                    narrate('Warning: use of resolution=, units=, height= and width= parameters for export_image() is deprecated')
-        # if use_v10_calls: # For debugging
-        #     narrate('Until 3.10 works properly, we will pretend we are using 3.9')
-        #     use_v10_calls = False
-
-    if zoom is None:
-        zoom = 100
+    use_v10_calls = _use_v10_export(resolution, units, height, width, force_pre_3_10, all_graphics_details,
+                                    hide_labels, transparent_background, export_text_as_font, orientation, page_size,
+                                    base_url=base_url)
 
     # Determine which type of file image will be generated
-    type = type.lower()
-    if type in _TYPE_MAP:
-        type_suffix, cy_type = _TYPE_MAP[type]
-        if type_suffix == _SUPPLIED_TYPE:
-            type_suffix = type
-    else:
-        raise CyError(f'Type {type} is unknown; options include {_TYPE_MAP.keys()}')
+    type_suffix, cy_type = _export_image_type(type)
 
     # If the caller didn't supply a file name, deduce it from the network title, and
     # if the file name doesn't have a file suffix appropriate for the image file, add the right suffix
     if not filename: filename = networks.get_network_name(network, base_url=base_url)
-    if re.search('\.' + type_suffix + '$', filename.lower()) is None: filename += '.' + type_suffix
+    filename = _export_image_file_name(filename, type_suffix)
 
     # Figure out whether the file already exists, and delete it if the caller asked for an overwrite
     # Either way, end up with a file name appropriate for Cytoscape's file system
@@ -412,30 +378,230 @@ def export_image(filename=None, type='PNG', resolution=None, units=None, height=
                 narrate('This file already exists. A Cytoscape popup will be generated to confirm overwrite.')
     full_filename = file_info['filePath']
 
-    # Generate the parameters appropriate for the Cytoscape function being used
-    if use_v10_calls:
-        cmd_string = 'view export ' + cy_type
+    # Generate the parameters appropriate for the Cytoscape function being used, and call the actual Cytoscape
+    # export image function
+    cmd_string = _export_image_cmd_string(use_v10_calls, cy_type, resolution, units, height, width, zoom,
+                                          all_graphics_details, hide_labels, transparent_background,
+                                          export_text_as_font, orientation, page_size)
+    res = commands.commands_post(f'{cmd_string} outputFile="{full_filename}" view="SUID:{view_SUID}"',
+                                 base_url=base_url)
+    return res
 
-        # optional args
-        if all_graphics_details is not None: cmd_string += f' allGraphicsDetails="{all_graphics_details}"'
-        if hide_labels is not None: cmd_string += f' hideLabels="{hide_labels}"'
-        if transparent_background is not None: cmd_string += f' transparentBackground="{transparent_background}"'
-        if export_text_as_font is not None: cmd_string += f' exportTextAsFont="{export_text_as_font}"'
-        if orientation is not None: cmd_string += f' orientation="{orientation}"'
-        if page_size is not None: cmd_string += f' pageSize="{page_size}"'
-    else:
-        cmd_string = f'view export options="{cy_type.upper()}"'  # a good start
 
-        # optional args
-        if resolution is not None: cmd_string += ' Resolution="' + str(resolution) + '"'
-        if units is not None: cmd_string += ' Units="' + str(units) + '"'
-        if height is not None: cmd_string += ' Height="' + str(height) + '"'
-        if width is not None: cmd_string += ' Width="' + str(width) + '"'
+@cy_log
+def export_images(specs, base_url=DEFAULT_BASE_URL, *, max_workers=4, overwrite_file=True, fetch_to=None):
+    """ Save many network views as image files, with several exports running at once.
 
-    # Call the actual Cytoscape export image function
-    res = commands.commands_post(f'{cmd_string} Zoom="{zoom}" outputFile="{full_filename}" view="SUID:{view_SUID}"',
-                                 base_url=base_url)
-    return res
+    Each export is described by a spec, which is a dict of :meth:`export_image` arguments (i.e., ``filename``,
+    ``type``, ``zoom``, ``network``, ``force_pre_3_10`` and the v3.10 or pre-v3.10 image parameters). A spec can also
+    contain a ``base_url``, which lets one call spread exports across several Cytoscape instances. All specs are
+    checked, and all views and file names are resolved, before any image is exported. The Cytoscape version of each
+    instance is checked once, and each view is looked up once no matter how many specs name it.
+
+    Args:
+        specs (list): list of dicts, each describing one image as a set of :meth:`export_image` arguments and
+            optionally a ``base_url``
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape. Used for specs
+            that don't contain a ``base_url``.
+        max_workers (int): maximum number of exports running at once on each Cytoscape instance. Exports through
+            Jupyter-Bridge always run one at a time.
+        overwrite_file (bool): True replaces existing files; False records an error for each image whose file
+            already exists.
+        fetch_to (str): directory in the Python workflow's file system to copy each image into (via
+            :meth:`sandbox_get_from`) as soon as it's exported. None (the default) leaves images in the sandbox.
+
+    Returns:
+        dataframe: a manifest with one row per spec, in spec order, with columns 'file' (the image's path in
+        Cytoscape's file system), 'view' (the view's SUID), 'base_url', 'seconds' (time taken to export and fetch the
+        image), 'fetched' (the copy's path, or None) and 'error' (None, or why the image wasn't exported)
+
+    Raises:
+        CyError: if a spec is invalid, a network or view doesn't exist, or two specs name the same file
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> export_images([{'filename': 'output/small', 'zoom': 50}, {'filename': 'output/large', 'zoom': 400}])
+                                 file    view                   base_url  seconds fetched error
+        0  C:\\...\\output\\small.png  131407  http://127.0.0.1:1234/v1     0.21    None  None
+        1  C:\\...\\output\\large.png  131407  http://127.0.0.1:1234/v1     0.95    None  None
+        >>> export_images([{'network': suid, 'type': 'SVG'} for suid in get_network_list()], fetch_to='images')
+        >>> export_images([{'network': 'yeast', 'base_url': url} for url in instance_urls], max_workers=2)
+    """
+    # Check each spec and work out everything about its export that doesn't need Cytoscape
+    jobs = []
+    for spec in specs:
+        unknown_args = set(spec) - _EXPORT_SPEC_ARGS
+        if unknown_args:
+            raise CyError(f'Image spec has unknown arguments {sorted(unknown_args)}; options include {sorted(_EXPORT_SPEC_ARGS)}')
+        spec = dict(spec)
+        job = {'base_url': spec.pop('base_url', base_url), 'network': spec.pop('network', None),
+               'filename': spec.pop('filename', None)}
+        job['type_suffix'], job['cy_type'] = _export_image_type(spec.pop('type', 'PNG'))
+        job['args'] = spec
+        jobs.append(job)
+
+    # Check each Cytoscape's version once, and decide which export function each spec calls
+    for job in jobs:
+        args = job['args']
+        job['use_v10_calls'] = _use_v10_export(args.get('resolution'), args.get('units'), args.get('height'),
+                                               args.get('width'), args.get('force_pre_3_10', False),
+                                               args.get('all_graphics_details'), args.get('hide_labels'),
+                                               args.get('transparent_background'), args.get('export_text_as_font'),
+                                               args.get('orientation'), args.get('page_size'),
+                                               base_url=job['base_url'])
+
+    # Allow each Cytoscape its own number of exports at once
+    instance_workers = {url: 1 if commands._is_jupyter_bridge(url) else max(1, max_workers)
+                        for url in {job['base_url'] for job in jobs}}
+    instance_slots = {url: threading.BoundedSemaphore(workers) for url, workers in instance_workers.items()}
+
+    def run(url, func):
+        with instance_slots[url]:
+            return func()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(len(jobs), sum(instance_workers.values())))) as executor:
+        # Look up each distinct view once, along with its network name if it's needed for a file name
+        def resolve(url, network, need_name):
+            view_suid = get_network_view_suid(network, base_url=url)
+            return view_suid, networks.get_network_name(network, base_url=url) if need_name else None
+
+        views = {}
+        for job in jobs:
+            key = (job['base_url'], job['network'])
+            views[key] = views.get(key, False) or not job['filename']
+        views = {key: executor.submit(run, key[0], functools.partial(resolve, key[0], key[1], need_name))
+                 for key, need_name in views.items()}
+        views = {key: future.result() for key, future in views.items()}
+
+        # Settle each file name, and make sure no two exports write the same file
+        file_names = set()
+        for job in jobs:
+            view_suid, network_name = views[(job['base_url'], job['network'])]
+            job['view'] = view_suid
+            job['filename'] = _export_image_file_name(job['filename'] or network_name, job['type_suffix'])
+            if (job['base_url'], job['filename']) in file_names:
+                raise CyError(f'More than one image spec writes file {job["filename"]}')
+            file_names.add((job['base_url'], job['filename']))
+
+        def export(job):
+            # Make room for the file and export the image, copying it to the Python workflow if asked
+            url, filename, start_time = job['base_url'], job['filename'], time.perf_counter()
+            entry = {'file': None, 'view': job['view'], 'base_url': url, 'seconds': None, 'fetched': None,
+                     'error': None}
+            try:
+                if overwrite_file:
+                    file_info = sandbox.sandbox_remove_file(filename, base_url=url)
+                else:
+                    file_info = sandbox.sandbox_get_file_info(filename, base_url=url)
+                    if len(file_info['modifiedTime']) and file_info['isFile']:
+                        raise CyError(f'This file already exists and will not be overwritten: {filename}')
+                args = job['args']
+                cmd_string = _export_image_cmd_string(job['use_v10_calls'], job['cy_type'], args.get('resolution'),
+                                                      args.get('units'), args.get('height'), args.get('width'),
+                                                      args.get('zoom'), args.get('all_graphics_details'),
+                                                      args.get('hide_labels'), args.get('transparent_background'),
+                                                      args.get('export_text_as_font'), args.get('orientation'),
+                                                      args.get('page_size'))
+                res = commands.commands_post(f'{cmd_string} outputFile="{file_info["filePath"]}" view="SUID:{job["view"]}"',
+                                             base_url=url)
+                entry['file'] = res.get('file', file_info['filePath']) if isinstance(res, dict) else file_info['filePath']
+                if fetch_to is not None:
+                    dest_file = os.path.join(fetch_to, filename if not os.path.isabs(filename) else os.path.basename(filename))
+                    os.makedirs(os.path.dirname(dest_file) or '.', exist_ok=True)
+                    sandbox.sandbox_get_from(filename, dest_file, base_url=url)
+                    entry['fetched'] = dest_file
+            except Exception as e:
+                entry['error'] = str(e)
+            entry['seconds'] = time.perf_counter() - start_time
+            return entry
+
+        manifest = [executor.submit(run, job['base_url'], functools.partial(export, job)) for job in jobs]
+        manifest = [future.result() for future in manifest]
+
+    narrate(f'Exported {sum(entry["error"] is None for entry in manifest)} of {len(manifest)} images')
+    return pd.DataFrame(manifest, columns=['file', 'view', 'base_url', 'seconds', 'fetched', 'error'])
+
+
+@cy_log
+def get_network_view_image(type='PNG', height=None, network=None, base_url=DEFAULT_BASE_URL, *, use_cache=False):
+    """ Return an image of a network view as bytes, without writing a file.
+
+    The image is rendered by Cytoscape and returned directly in the CyREST reply, so it needn't pass through the
+    sandbox or either file system. When Cytoscape is reached via Jupyter-Bridge, which can't carry binary replies,
+    the image is exported to a temporary sandbox file that is read back into memory and removed.
+
+    If ``use_cache`` is True, images are remembered on the client, keyed by a digest of the view's node, edge and
+    network visual properties. Fetching an image of a view that hasn't changed then costs only the fetch of those
+    properties, not a rendering and transfer of the image. Annotations aren't part of the digest, so call
+    :meth:`clear_caches` after changing them. The number of images remembered is set by
+    :meth:`set_view_image_cache_size`.
+
+    Args:
+        type (str): Type of image, i.e., PNG (default), SVG or PDF
+        height (int): The height of a PNG image, in pixels. Default is the height chosen by Cytoscape.
+        network (str or SUID or None): Name or SUID of the network. Default is the "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        use_cache (bool): True to remember images and reuse them while the view is unchanged; False (the default)
+            always renders a new image
+
+    Returns:
+        bytes: the image file's content
+
+    Raises:
+        CyError: if network or view doesn't exist, or type is unknown
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> get_network_view_image()
+        b'\\x89PNG\\r\\n\\x1a\\n\\x00\\x00\\x00\\rIHDR\\x00\\x00\\x02X...'
+        >>> get_network_view_image(type='SVG', network='My Network')
+        b'<?xml version="1.0" encoding="UTF-8"?>...'
+        >>> get_network_view_image(height=200, use_cache=True) # a thumbnail, reused until the view changes
+        b'\\x89PNG\\r\\n\\x1a\\n\\x00\\x00\\x00\\rIHDR\\x00\\x00\\x00\\xc8...'
+    """
+    image_type = type.lower()
+    if image_type not in _VIEW_IMAGE_TYPES:
+        raise CyError(f'Type {type} is unknown; options include {list(_VIEW_IMAGE_TYPES)}')
+    if image_type != _PNG_TYPE: height = None # only PNG images can be sized
+
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+    view_suid = get_network_view_suid(net_suid, base_url=base_url)
+
+    # Digest the view's visual properties, which determine what the image looks like
+    digest = None
+    if use_cache:
+        hasher = hashlib.sha256()
+        for content in commands._cyrest_get_contents([f'networks/{net_suid}/views/{view_suid}/{part}'
+                                                      for part in ('nodes', 'edges', 'network')], base_url=base_url):
+            hasher.update(content)
+        digest = hasher.hexdigest()
+        image = get_view_image(base_url, view_suid, image_type, height, digest)
+        if image is not None:
+            return image
+
+    if commands._is_jupyter_bridge(base_url):
+        # Export into the sandbox and read the file back into memory, leaving nothing behind
+        filename = f'{_VIEW_IMAGE_FILE_NAME}.{image_type}'
+        pixel_params = {'height': height, 'units': 'pixels'} if height else {}
+        export_image(filename, type=image_type, network=view_suid, base_url=base_url, overwrite_file=True,
+                     **pixel_params)
+        try:
+            res = sandbox._sandbox_op('fromSandbox', None, file_name=filename, base_url=base_url)
+        finally:
+            sandbox.sandbox_remove_file(filename, base_url=base_url)
+        image = base64.b64decode(res['fileBase64'], validate=True)
+    else:
+        parameters = {'h': height} if height else None
+        image = commands._cyrest_get_contents([f'networks/{net_suid}/views/{view_suid}.{image_type}'],
+                                              parameters=parameters, base_url=base_url)[0]
+
+    if use_cache:
+        set_view_image(base_url, view_suid, image_type, height, digest, image)
+    return image
 
 
 @cy_log
@@ -467,3 +633,93 @@ def toggle_graphics_details(base_url=DEFAULT_BASE_URL):
     """
     res = commands.cyrest_put('ui/lod', base_url=base_url)
     return res
+
+
+# ------------------------------------------------------------------------------
+# Internal image export functions
+
+_VIEW_IMAGE_TYPES = [_PNG_TYPE, _SVG_TYPE, _PDF_TYPE] # types CyREST can render directly
+_VIEW_IMAGE_FILE_NAME = 'py4cytoscape view image' # temporary sandbox file, for when images can't be read directly
+
+_EXPORT_SPEC_ARGS = {'filename', 'type', 'resolution', 'units', 'height', 'width', 'zoom', 'network', 'base_url',
+                     'force_pre_3_10', 'all_graphics_details', 'hide_labels', 'transparent_background',
+                     'export_text_as_font', 'orientation', 'page_size'}
+
+def _use_v10_export(resolution, units, height, width, force_pre_3_10, all_graphics_details, hide_labels,
+                    transparent_background, export_text_as_font, orientation, page_size, base_url=DEFAULT_BASE_URL):
+    # Decide whether an export uses the Cytoscape v3.10 functions, and verify that the caller's parameters fit with
+    # the Cytoscape version
+    has_v10_params = all_graphics_details is not None \
+                     or hide_labels is not None \
+                     or transparent_background is not None \
+                     or export_text_as_font is not None \
+                     or orientation is not None \
+                     or page_size is not None
+    has_pre_v10_params = resolution is not None \
+                         or units is not None \
+                         or height is not None \
+                         or width is not None
+
+    if check_supported_versions(1, "3.10", base_url=base_url):
+        # Cytoscape appears to be pre-3.10
+        if has_v10_params:
+            raise CyError('Cannot use Cytoscape v3.10 parameters with pre-v3.10 Cytoscape')
+        return False
+
+    # Cytoscape is 3.10 or later
+    if has_v10_params:
+        # Caller specified one or more 3.10 parameters
+        if has_pre_v10_params:
+            raise CyError('Cannot use both Cytoscape v3.10 parameters and pre-v3.10 parameters')
+        if force_pre_3_10:
+            raise CyError('Cannot force call to Cytoscape pre-3.10 if v3.10 parameters are used')
+        return True
+
+    # Caller didn't specify any 3.10 parameters, but may have specified some pre-3.10 parameters
+    if force_pre_3_10:
+        return False
+    if has_pre_v10_params:
+        narrate('Warning: use of resolution=, units=, height= and width= parameters for export_image() is deprecated')
+    return not has_pre_v10_params
+
+def _export_image_type(type):
+    # Return the file suffix and Cytoscape image type for an image type
+    type = type.lower()
+    if type not in _TYPE_MAP:
+        raise CyError(f'Type {type} is unknown; options include {_TYPE_MAP.keys()}')
+    type_suffix, cy_type = _TYPE_MAP[type]
+    if type_suffix == _SUPPLIED_TYPE:
+        type_suffix = type
+    return type_suffix, cy_type
+
+def _export_image_file_name(filename, type_suffix):
+    # If the file name doesn't have a file suffix appropriate for the image file, add the right suffix
+    if re.search('\\.' + type_suffix + '$', filename.lower()) is None: filename += '.' + type_suffix
+    return filename
+
+def _export_image_cmd_string(use_v10_calls, cy_type, resolution, units, height, width, zoom, all_graphics_details,
+                             hide_labels, transparent_background, export_text_as_font, orientation, page_size):
+    # Generate the export command and the parameters appropriate for the Cytoscape function being used ... the
+    # caller adds the output file and view
+    if use_v10_calls:
+        cmd_string = 'view export ' + cy_type
+
+        # optional args
+        if all_graphics_details is not None: cmd_string += f' allGraphicsDetails="{all_graphics_details}"'
+        if hide_labels is not None: cmd_string += f' hideLabels="{hide_labels}"'
+        if transparent_background is not None: cmd_string += f' transparentBackground="{transparent_background}"'
+        if export_text_as_font is not None: cmd_string += f' exportTextAsFont="{export_text_as_font}"'
+        if orientation is not None: cmd_string += f' orientation="{orientation}"'
+        if page_size is not None: cmd_string += f' pageSize="{page_size}"'
+    else:
+        cmd_string = f'view export options="{cy_type.upper()}"'  # a good start
+
+        # optional args
+        if resolution is not None: cmd_string += ' Resolution="' + str(resolution) + '"'
+        if units is not None: cmd_string += ' Units="' + str(units) + '"'
+        if height is not None: cmd_string += ' Height="' + str(height) + '"'
+        if width is not None: cmd_string += ' Width="' + str(width) + '"'
+
+    if zoom is None:
+        zoom = 100
+    return f'{cmd_string} Zoom="{zoom}"'
@@ -39,12 +39,16 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 # ------------------------------------------------------------------------------
 
 # External library imports
+import importlib.util
+import itertools
+import os
 import sys
+import tempfile
 import time
+import uuid
 import warnings
 import pandas as pd
-import igraph as ig
-import networkx as nx
+import numpy as np
 
 # Internal module imports
 from . import commands
@@ -53,13 +57,14 @@ from . import network_selection
 from . import layouts
 from . import session
 from . import sandbox
+from . import py4cytoscape_tuning
 
 # Internal module convenience imports
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
 from .py4cytoscape_tuning import MODEL_PROPAGATION_SECS, CATCHUP_NETWORK_SECS, CATCHUP_NETWORK_TIMEOUT_SECS
 from .exceptions import CyError
-from .py4cytoscape_sandbox import get_abs_sandbox_path
+from .py4cytoscape_sandbox import get_abs_sandbox_path, get_current_sandbox_name
 
 def __init__(self):
     pass
@@ -360,6 +365,75 @@ def export_network(filename=None, type='SIF', network=None, base_url=DEFAULT_BAS
     return commands.commands_post(f'{cmd} OutputFile="{full_filename}"', base_url=base_url)
 
 
+@cy_log
+def export_network_edge_list(filename=None, network=None, base_url=DEFAULT_BASE_URL, *, edge_columns=None,
+                             overwrite_file=False):
+    """Export a network's edges to a Parquet or Arrow file.
+
+    Each row of the file is an edge, with 'source' and 'target' columns holding the names of the nodes it connects,
+    followed by edge table columns. The file is Parquet unless ``filename`` ends in '.arrow' or '.feather', in which
+    case it's an Arrow IPC (Feather version 2) file. The file is built in Python, then placed in the sandbox, just as
+    if Cytoscape had written it. Requires the pyarrow package.
+
+    Args:
+        filename (str): Full path or path relative to current working directory,
+            in addition to the name of the file. The ``.parquet`` extension is added if ``filename`` has no
+            Parquet or Arrow extension. If blank, then the current network name is used.
+        network (SUID or str or None): Name or SUID of a network or view. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        edge_columns (str or list or None): Edge table columns to write, as list or comma-separated list; default is
+            all columns
+        overwrite_file (bool): False allows an error to be generated if the file already exists;
+            True allows it to be overwritten
+
+    Returns:
+        dict: {'file': path of file on the Cytoscape workstation}
+
+    Raises:
+        CyError: if network name or SUID doesn't exist, or the file exists and ``overwrite_file`` is False
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> export_network_edge_list('galFiltered')
+        {'file': 'C:\\Users\\CyDeveloper\\galFiltered.parquet'}
+        >>> export_network_edge_list('galFiltered.arrow', edge_columns='interaction, EdgeBetweenness', overwrite_file=True)
+        {'file': 'C:\\Users\\CyDeveloper\\galFiltered.arrow'}
+
+    See Also:
+        :meth:`create_network_from_edge_list`, :meth:`export_network`
+    """
+    import pyarrow.feather as feather # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    import pyarrow.parquet as pq
+
+    if not filename: filename = get_network_name(network, base_url=base_url)
+    if re.search(r'\.(parquet|arrow|feather)$', filename) is None: filename += '.parquet'
+    if filename.endswith('.parquet'):
+        write_table = pq.write_table
+    else:
+        write_table = feather.write_feather
+
+    file_info = sandbox.sandbox_get_file_info(filename, base_url=base_url)
+    if len(file_info['modifiedTime']) and file_info['isFile']:
+        if overwrite_file:
+            narrate('This file has been overwritten.')
+        else:
+            raise CyError(f'File "{filename}" already exists ... network not exported.')
+
+    edge_list = NetworkSnapshot(network, base_url=base_url, node_columns=['name'], edge_columns=edge_columns).to_arrow()
+    if not get_current_sandbox_name():
+        # Cytoscape shares this file system, so write the file where Cytoscape would have
+        write_table(edge_list, file_info['filePath'])
+        return {'file': file_info['filePath']}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_file = os.path.join(temp_dir, os.path.basename(filename))
+        write_table(edge_list, temp_file)
+        res = sandbox.sandbox_send_to(temp_file, filename, overwrite=True, base_url=base_url)
+    return {'file': res['filePath']}
+
+
 @cy_log
 def delete_network(network=None, base_url=DEFAULT_BASE_URL):
     """Delete a network from the current Cytoscape session.
@@ -952,6 +1026,8 @@ def create_network_from_igraph(igraph, title='From igraph', collection='My Igrap
         new_cols = [replacement_name if i != first_index and col_list[i] == col_name else col_list[i] for i in range(len(col_list))]
         return new_cols
 
+    import igraph as ig # Imported here so py4cytoscape doesn't pay for it unless igraph is actually used
+
     # Get nodes as a table indexed by node number ... assume every node has at least a 'name' attribute as a string
     node_df = ig.Graph.get_vertex_dataframe(igraph)
     node_df['name'] = node_df['name'].astype(str)
@@ -971,9 +1047,11 @@ def create_network_from_igraph(igraph, title='From igraph', collection='My Igrap
 
     if edge_df is not None:
         try:
-            # Convert edge 'source' and 'target' values from index into node table to actual node name
-            edge_df['source'] = edge_df['source'].apply(lambda x: node_df['name'][x])
-            edge_df['target'] = edge_df['target'].apply(lambda x: node_df['name'][x])
+            # Convert edge 'source' and 'target' values from index into node table to actual node name ... vertex IDs
+            # are positions in the node table, so all edges can be resolved at once by indexing an array of names
+            names_array = node_df['name'].to_numpy()
+            edge_df['source'] = names_array[edge_df['source'].to_numpy()]
+            edge_df['target'] = names_array[edge_df['target'].to_numpy()]
         except:
             narrate('Not all edge sources or targets resolve to vertex names') # iGraph creates this df, so should never happen
             edge_df = None
@@ -1039,7 +1117,7 @@ def create_network_from_networkx(netx, title='From networkx', collection='My Net
 def create_network_from_data_frames(nodes=None, edges=None, title='From dataframe',
                                     collection='My Dataframe Network Collection', base_url=DEFAULT_BASE_URL, *,
                                     node_id_list='id', source_id_list='source', target_id_list='target',
-                                    interaction_type_list='interaction'):
+                                    interaction_type_list='interaction', transport=None):
     """Create a network from data frames.
 
     Takes data frames for nodes and edges, as well as naming parameters to generate the JSON data format required by
@@ -1059,6 +1137,16 @@ def create_network_from_data_frames(nodes=None, edges=None, title='From datafram
         Note that the extra ``id`` column is created in the node table because the ``id`` column is mandatory in the
         cytoscape.js format, which is what is sent to Cytoscape.
 
+        For very large networks, the ``file`` transport is much faster. Instead of sending cytoscape.js JSON, it writes
+        ``edges`` (plus a row for each node that has no edges) and then ``nodes`` to tab-separated files a slice at
+        a time, passes each file to Cytoscape through the sandbox, and has Cytoscape import it as a tabular file (see
+        ``import_network_from_tabular_file()`` and ``load_table_data_from_file()``). Attribute types are kept as
+        described above, except that integers too large for (Integer) are imported as (Long). The collection is
+        named after the edge file, i.e., ``<collection>.tsv``, and node names and values can't contain tabs or line
+        breaks. Because of these differences, this transport is used only if ``transport`` is 'file', or if an element
+        count has been set by ``set_file_transport_element_count()`` and the network has at least that many nodes
+        plus edges. It requires the pyarrow package.
+
     Args:
         nodes (DataFrame): see details and examples below; default NULL to derive nodes from edge sources and targets
         edges (DataFrame): see details and examples below; default NULL for disconnected set of nodes
@@ -1072,6 +1160,9 @@ def create_network_from_data_frames(nodes=None, edges=None, title='From datafram
         source_id_list (str): Name of column in ``edges`` containing source node name
         target_id_list (str): Name of column in ``edges``  containing target node name
         interaction_type_list (str): Name of column in ``edges``  containing interaction name
+        transport (str or None): 'json' to send the network as cytoscape.js JSON, 'file' to send it as tabular
+            files, or None to send it as JSON unless ``set_file_transport_element_count()`` says it's big enough for
+            files
 
     Returns:
         int: The ``SUID`` of the new network
@@ -1094,18 +1185,28 @@ def create_network_from_data_frames(nodes=None, edges=None, title='From datafram
         >>>
         >>> create_network_from_data_frames(nodes, edges, title='From node & edge dataframe')
         1477
+        >>> create_network_from_data_frames(nodes, edges, title='From node & edge files', transport='file')
+        1522
     """
 
     def compute_edge_name(source, target, interaction):
         return source + ' (' + interaction + ') ' + target
 
+    if transport is None:
+        transport = 'file' if _prefers_file_transport(nodes, edges) else 'json'
+    if transport == 'file':
+        network_suid = _create_network_from_data_frames_by_file(nodes, edges, title, collection, base_url,
+                                                                node_id_list, source_id_list, target_id_list,
+                                                                interaction_type_list)
+        _apply_default_style_and_layout(network_suid, base_url)
+        return network_suid
+    elif transport != 'json':
+        raise CyError(f'Unknown transport "{transport}"; must be either "json" or "file"')
+
     # Create a node list even if we have to use the edges lists to infer nodes
     if nodes is None:
         if not edges is None:
-            id_list = []
-            for source, target in zip(edges['source'].values, edges['target'].values):
-                id_list.append(source)
-                id_list.append(target)
+            id_list = np.column_stack([edges['source'].values, edges['target'].values]).ravel() # source, target, ...
             nodes = pd.DataFrame(data=id_list, columns=['id'])
         else:
             raise CyError('Must provide either nodes or edges')
@@ -1149,9 +1250,9 @@ def create_network_from_data_frames(nodes=None, edges=None, title='From datafram
     if not edges is None:
         # get rid of SUID column if one is present
         edges = edges.drop(['SUID'], axis=1, errors='ignore')
-        # create edge name out of source/interaction/target
-        edge_names = [compute_edge_name(source, target, interaction) for source, interaction, target in
-                      zip(edges[source_id_list], edges[interaction_type_list], edges[target_id_list])]
+        # create edge name out of source/interaction/target, a whole column at a time
+        edge_names = list(compute_edge_name(edges[source_id_list], edges[target_id_list],
+                                            edges[interaction_type_list]))
         edges['name'] = edge_names
         # find out the SUID of each node so it can be used in a multigraph if needed
         edges['data.key.column'] = edge_name_to_edge_suid(edge_names, network_suid, base_url=base_url, unique_list=True)
@@ -1161,13 +1262,7 @@ def create_network_from_data_frames(nodes=None, edges=None, title='From datafram
             tables.load_table_data(edges, data_key_column='data.key.column', table='edge', table_key_column='SUID',
                                    network=network_suid, base_url=base_url)
 
-    narrate('Applying default style...')
-    _delay_until_stable(lambda: commands.commands_post('vizmap apply styles="default"', base_url=base_url) is not None,
-                        'apply vizmap')
-
-    narrate('Applying preferred layout')
-    _delay_until_stable(lambda: layouts.layout_network(network=network_suid, base_url=base_url) is not None,
-                        'layout network')
+    _apply_default_style_and_layout(network_suid, base_url)
 
     # TODO: Verify that attribute types are properly set in Cytoscape
 
@@ -1236,7 +1331,65 @@ def create_network_from_cytoscapejs(cytoscapejs, title=None, collection='My Cyto
 
 
 @cy_log
-def import_network_from_tabular_file(file=None, first_row_as_column_names=False, start_load_row=1, column_type_list='s,i,t', delimiters='\\,,\t', base_url=DEFAULT_BASE_URL):
+def create_network_from_edge_list(edges, title='From edge list', base_url=DEFAULT_BASE_URL, *,
+                                  source_id_list='source', target_id_list='target',
+                                  interaction_type_list='interaction'):
+    """Create a network from an Arrow edge list or a Parquet or Arrow file.
+
+    Instead of being sent to CyREST as JSON, the edge list is written a batch at a time to a tab-separated file, which
+    is passed to Cytoscape through the sandbox and imported by Cytoscape's tabular network import (i.e.,
+    ``import_network_from_tabular_file()``). This is much faster for very large networks. Columns other than the
+    source, target and interaction columns are loaded as edge attributes, keeping their Arrow types as Cytoscape
+    types: integers as Integer or Long, floating point as Double, booleans as Boolean, lists as Lists and anything
+    else as String. Rows with no target create a node with no edges. Requires the pyarrow package.
+
+    Notes:
+        The network is created in a new collection named after the transferred file, i.e., ``<title>.tsv``. Node
+        names and values can't contain tabs or line breaks, and list elements can't contain '|'.
+
+    Args:
+        edges (pyarrow.Table or DataFrame or str): edge list as a ``pyarrow.Table`` or anything that can be converted to
+            one (e.g., a Polars dataframe), or the name of a local Parquet (.parquet) or Arrow IPC (.arrow or .feather)
+            file, which is read a batch at a time
+        title (str): network name
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        * :
+        source_id_list (str): Name of column in ``edges`` containing source node name
+        target_id_list (str): Name of column in ``edges`` containing target node name
+        interaction_type_list (str): Name of column in ``edges`` containing interaction name ... if there is no such
+            column, the interaction is "interacts with"
+
+    Returns:
+        int: The ``SUID`` of the new network
+
+    Raises:
+        CyError: if ``edges`` can't be read, has no source or target column, or has values that can't be imported
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> edges = pa.table({'source': ['node 0', 'node 0', 'node 2'], 'target': ['node 1', 'node 2', 'node 3'],
+        >>>                   'interaction': ['inhibits', 'interacts', 'activates'], 'weight': [5.1, 3.0, 5.2]})
+        >>> create_network_from_edge_list(edges, title='From Arrow')
+        1477
+        >>> create_network_from_edge_list('galFiltered.parquet', title='galFiltered copy')
+        1522
+
+    See Also:
+        :meth:`export_network_edge_list`, :meth:`create_network_from_data_frames`
+    """
+    schema, batches = _edge_list_batches(edges)
+    for col in [source_id_list, target_id_list]:
+        if not col in schema.names:
+            raise CyError(f'Edge list must have a "{col}" column')
+
+    return _import_tabular_network(f'{title}.tsv', title, schema, batches, source_id_list, target_id_list,
+                                   interaction_type_list, base_url)
+
+
+@cy_log
+def import_network_from_tabular_file(file=None, first_row_as_column_names=False, start_load_row=1, column_type_list='s,i,t', delimiters='\\,,\t', base_url=DEFAULT_BASE_URL, *, data_type_list=None):
     """Loads a network from specified file.
 
     Note:
@@ -1253,6 +1406,9 @@ def import_network_from_tabular_file(file=None, first_row_as_column_names=False,
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        data_type_list (str or None): comma-separated list of column data types ordered by column index
+            (e.g. "string,int,long,double,boolean,string list" or just "s,i,l,d,b,sl"); default lets Cytoscape
+            infer each column's type from its values
 
     Returns:
         dict: {"networks": [network suid], "views": [suid for views]} where networks and views lists have length 1
@@ -1295,9 +1451,10 @@ def import_network_from_tabular_file(file=None, first_row_as_column_names=False,
         index_params += f' indexColumnTypeInteraction="{type_list.index("i") + 1}"'
     if 'interaction' in type_list:
         index_params += f' indexColumnTypeInteraction="{type_list.index("interaction") + 1}"'
+    data_type_param = f' dataTypeList="{data_type_list}"' if data_type_list else ''
 
     res = commands.commands_post(
-        f'network import file file="{file}" firstRowAsColumnNames="{first_row_as_column_names}" startLoadRow="{start_load_row}"{index_params} columnTypeList="{column_type_list}" delimiters="{delimiters}"',
+        f'network import file file="{file}" firstRowAsColumnNames="{first_row_as_column_names}" startLoadRow="{start_load_row}"{index_params} columnTypeList="{column_type_list}"{data_type_param} delimiters="{delimiters}"',
         base_url=base_url)
 
     # should not be necessary, but is because "network load file" doesn't actually set the current network
@@ -1421,6 +1578,7 @@ def create_igraph_from_network(network=None, base_url=DEFAULT_BASE_URL):
     # set up iGraph vertices ... first create vertex by naming it, then pile on attributes
     # Tutorial: https://igraph.org/python/doc/tutorial/tutorial.html
     # Source: https://github.com/igraph/igraph/blob/master/src/igraph/__init__.py
+    import igraph as ig
     g = ig.Graph(directed=True)
 
     # add all nodes and their attributes
@@ -1439,15 +1597,21 @@ def create_igraph_from_network(network=None, base_url=DEFAULT_BASE_URL):
 
 
 @cy_log
-def create_networkx_from_network(network=None, base_url=DEFAULT_BASE_URL):
+def create_networkx_from_network(network=None, base_url=DEFAULT_BASE_URL, *, node_columns=None, edge_columns=None):
     """Return the Cytoscape network as a networkx multi-di-graph.
 
+    Edges connect the nodes they connect in Cytoscape, regardless of edge names.
+
     Args:
         network (SUID or str or None): Name or SUID of a network or view. Default is the
             "current" network active in Cytoscape.
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        node_columns (str or list or None): Node table columns to carry as node attributes, as list or
+            comma-separated list; default is all columns
+        edge_columns (str or list or None): Edge table columns to carry as edge attributes, as list or
+            comma-separated list; default is all columns
 
     Returns:
         MultiDiGraph: The new ``networkx`` object
@@ -1465,40 +1629,15 @@ def create_networkx_from_network(network=None, base_url=DEFAULT_BASE_URL):
         Number of edges: 359
         Average in degree:   1.0879
         Average out degree:   1.0879
+        >>> n = create_networkx_from_network(node_columns=['COMMON'], edge_columns='interaction, EdgeBetweenness')
 
     See Also:
-        :meth:`create_network_from_networkx`
+        :meth:`create_network_from_networkx`, :meth:`NetworkSnapshot`
     """
-    suid = get_network_suid(network, base_url=base_url)
-
-    # get dataframes
-    cyedges = tables.get_table_columns('edge', network=suid, base_url=base_url)
-    cynodes = tables.get_table_columns('node', network=suid, base_url=base_url)
-
-    # check for source and target columns ... if they're not present, dig them out of the full name
-    if not {'source', 'target'} <= set(cyedges.columns):
-        src_trg = parse_edges(cyedges['name'])
-        cyedges['source'] = [x[0] for x in src_trg]
-        cyedges['target'] = [x[2] for x in src_trg]
-
-    # Create a list of edges as tuples (src, targ, suid, attrs) with 'source' & 'target' removed from attrs
-    edges_dict = cyedges.to_dict(orient='records')
-    e_bunch = [(row['source'],
-                row['target'],
-                row['SUID'],
-                {k: row[k]     for k in row if k not in {'source', 'target'}}
-                ) for row in edges_dict]
-
-    # Create a list of nodes as tuples (name, attrs) with 'name' removed from attrs
-    nodes_dict = cynodes.to_dict(orient='records')
-    n_bunch = [(row['name'], {k: row[k]     for k in row if k not in {'name'}}) for row in nodes_dict]
-
-    # Create the networkx graph modeled as directed edges with ability to have multiple edges connecting two nodes
-    md_graph = nx.MultiDiGraph()
-    md_graph.add_edges_from(e_bunch)
-    md_graph.add_nodes_from(n_bunch)
-
-    return md_graph
+    # Edge endpoints come from the network's topology as node SUIDs, so there are no edge names to parse, and node
+    # and edge attributes are built column-wise by the snapshot
+    return NetworkSnapshot(network, base_url=base_url, node_columns=node_columns,
+                           edge_columns=edge_columns).to_networkx()
 
 @cy_log
 def create_cytoscapejs_from_network(network=None, base_url=DEFAULT_BASE_URL):
@@ -1544,6 +1683,262 @@ def create_cytoscapejs_from_network(network=None, base_url=DEFAULT_BASE_URL):
     return res
 
 
+class NetworkSnapshot:
+    """A client-side copy of a Cytoscape network's topology and node and edge tables.
+
+    The tables and topology are fetched once, in columnar form, so that the network can be analyzed or converted
+    repeatedly without going back to Cytoscape. When the network changes, ``refresh()`` brings the snapshot up to
+    date, re-fetching topology only for edges that were added.
+
+    Args:
+        network (SUID or str or None): Name or SUID of a network or view. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        node_columns (str or list or None): Node table columns to fetch, as list or comma-separated list; default is
+            all columns. The ``name`` column is always fetched.
+        edge_columns (str or list or None): Edge table columns to fetch, as list or comma-separated list; default is
+            all columns
+
+    Attributes:
+        network_suid (int): SUID of the network
+        nodes (DataFrame): node table, indexed by node SUID
+        edges (DataFrame): edge table, indexed by edge SUID
+        node_suids (numpy.ndarray): node SUIDs, in the order of ``nodes``
+        edge_suids (numpy.ndarray): edge SUIDs, in the order of ``edges``
+        edge_source (numpy.ndarray): position in ``node_suids`` of each edge's source node
+        edge_target (numpy.ndarray): position in ``node_suids`` of each edge's target node
+        csr_indptr (numpy.ndarray): adjacency in compressed sparse row form ... the outgoing edges of node ``i`` are
+            at positions ``csr_indptr[i]:csr_indptr[i+1]`` of ``csr_indices`` and ``csr_edges``
+        csr_indices (numpy.ndarray): position in ``node_suids`` of the target of each outgoing edge
+        csr_edges (numpy.ndarray): position in ``edge_suids`` of each outgoing edge
+
+    Raises:
+        CyError: if network name or SUID doesn't exist
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> snap = NetworkSnapshot(network='galFiltered.sif')
+        >>> g = snap.to_networkx()
+        >>> m = snap.to_scipy(weight='EdgeBetweenness')
+        >>> snap.refresh() # after the network has changed in Cytoscape
+        {'nodes_added': 0, 'nodes_removed': 0, 'edges_added': 2, 'edges_removed': 0}
+
+    See Also:
+        :meth:`create_networkx_from_network`, :meth:`create_igraph_from_network`,
+        :meth:`create_cytoscapejs_from_network`
+    """
+
+    # Added edges beyond this count are cheaper to get by re-fetching the whole topology than one at a time
+    _INCREMENTAL_EDGE_LIMIT = 1000
+
+    def __init__(self, network=None, base_url=DEFAULT_BASE_URL, *, node_columns=None, edge_columns=None):
+        self.base_url = base_url
+        self.network_suid = get_network_suid(network, base_url=base_url)
+        if node_columns is not None:
+            node_columns = normalize_list(node_columns)
+            if 'name' not in node_columns: node_columns = ['name'] + node_columns
+        self._node_columns = node_columns
+        self._edge_columns = None if edge_columns is None else normalize_list(edge_columns)
+
+        self._load_network()
+
+    def refresh(self):
+        """Bring the snapshot up to date with the network in Cytoscape.
+
+        Node and edge tables are always re-fetched, as Cytoscape doesn't report which values changed. Topology is
+        kept for edges that still exist, and fetched only for edges that were added.
+
+        Returns:
+            dict: counts of nodes and edges added and removed since the snapshot was taken or last refreshed
+
+        Raises:
+            CyError: if the network no longer exists
+            requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+        """
+        old_node_suids, old_endpoints = self.nodes.index, self._endpoints
+        edge_suids = pd.Index(commands.cyrest_get(f'networks/{self.network_suid}/edges', base_url=self.base_url),
+                              dtype='int64')
+        if len(edge_suids.difference(old_endpoints.index)) > self._INCREMENTAL_EDGE_LIMIT:
+            self._load_network()
+            added_edges = self.edges.index.difference(old_endpoints.index)
+        else:
+            self._load_tables()
+            added_edges = self.edges.index.difference(old_endpoints.index)
+            if len(added_edges) == 0:
+                endpoints = old_endpoints
+            else:
+                added_info = commands.cyrest_get_batch([f'networks/{self.network_suid}/edges/{edge}'
+                                                        for edge in added_edges], base_url=self.base_url)
+                endpoints = pd.concat([old_endpoints,
+                                       pd.DataFrame({'source': [info['data']['source'] for info in added_info],
+                                                     'target': [info['data']['target'] for info in added_info]},
+                                                    index=added_edges, dtype='int64')])
+            self._set_topology(endpoints)
+
+        return {'nodes_added': len(self.nodes.index.difference(old_node_suids)),
+                'nodes_removed': len(old_node_suids.difference(self.nodes.index)),
+                'edges_added': len(added_edges),
+                'edges_removed': len(old_endpoints.index.difference(self.edges.index))}
+
+    def to_networkx(self, node_columns=None, edge_columns=None):
+        """Return the network as a networkx multi-di-graph, the same as ``create_networkx_from_network()``.
+
+        Args:
+            node_columns (list or None): Node columns to carry as node attributes; default is all fetched columns
+            edge_columns (list or None): Edge columns to carry as edge attributes; default is all fetched columns
+
+        Returns:
+            MultiDiGraph: The new ``networkx`` object, with nodes keyed by name and edges keyed by SUID
+        """
+        import networkx as nx
+
+        names = self.nodes['name'].to_numpy(dtype=object)
+        node_columns = [col for col in (node_columns or self.nodes.columns) if col != 'name']
+        edge_columns = [col for col in (edge_columns or self.edges.columns) if col not in {'source', 'target'}]
+
+        md_graph = nx.MultiDiGraph()
+        md_graph.add_edges_from(zip(names[self.edge_source], names[self.edge_target], self.edge_suids.tolist(),
+                                    _column_dicts(self.edges, edge_columns)))
+        md_graph.add_nodes_from(zip(names, _column_dicts(self.nodes, node_columns)))
+        return md_graph
+
+    def to_igraph(self, node_columns=None, edge_columns=None):
+        """Return the network as a directed igraph, the same as ``create_igraph_from_network()``.
+
+        Args:
+            node_columns (list or None): Node columns to carry as vertex attributes; default is all fetched columns
+                except SUID
+            edge_columns (list or None): Edge columns to carry as edge attributes; default is all fetched columns
+                except SUID
+
+        Returns:
+            igraph: The new ``igraph`` object, with vertices named by node name and ``source`` and ``target`` edge
+            attributes holding node names
+        """
+        import igraph as ig
+
+        names = self.nodes['name'].to_numpy(dtype=object)
+        g = ig.Graph(n=len(names), edges=np.column_stack([self.edge_source, self.edge_target]).tolist(),
+                     directed=True)
+        g.vs['name'] = names.tolist()
+        for col in (node_columns or self.nodes.columns):
+            if col not in {'name', 'SUID'}: g.vs[col] = self.nodes[col].tolist()
+        for col in (edge_columns or self.edges.columns):
+            if col not in {'SUID', 'source', 'target'}: g.es[col] = self.edges[col].tolist()
+        g.es['source'] = names[self.edge_source].tolist()
+        g.es['target'] = names[self.edge_target].tolist()
+        return g
+
+    def to_scipy(self, weight=None):
+        """Return the network's adjacency matrix as a scipy sparse matrix.
+
+        Rows and columns are in the order of ``node_suids``. Requires the scipy package.
+
+        Args:
+            weight (str or None): Edge column holding each edge's weight; default is 1 for each edge. Weights of
+                multiple edges between the same nodes are summed.
+
+        Returns:
+            scipy.sparse.csr_matrix: square matrix whose [i, j] element is the weight of edges from node i to node j
+        """
+        from scipy import sparse
+
+        if weight is None:
+            data = np.ones(len(self.csr_edges))
+        else:
+            data = self.edges[weight].to_numpy(dtype=float)[self.csr_edges]
+        matrix = sparse.csr_matrix((data, self.csr_indices, self.csr_indptr),
+                                   shape=(len(self.node_suids), len(self.node_suids)))
+        matrix.sum_duplicates()
+        return matrix
+
+    def to_arrow(self, edge_columns=None):
+        """Return the network as an Arrow edge list.
+
+        Requires the pyarrow package.
+
+        Args:
+            edge_columns (list or None): Edge columns to carry along with each edge; default is all fetched columns
+
+        Returns:
+            pyarrow.Table: one row per edge in the order of ``edge_suids``, with 'source' and 'target' columns holding
+            node names, followed by the edge columns
+        """
+        import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+
+        names = self.nodes['name'].to_numpy(dtype=object)
+        edge_columns = [col for col in (edge_columns or self.edges.columns) if col not in {'source', 'target'}]
+        edge_list = pa.Table.from_pandas(self.edges[edge_columns], preserve_index=False)
+        edge_list = edge_list.add_column(0, 'target', pa.array(names[self.edge_target], type=pa.string()))
+        return edge_list.add_column(0, 'source', pa.array(names[self.edge_source], type=pa.string()))
+
+    def to_cytoscapejs(self):
+        """Return the network as a Cytoscape JS document.
+
+        Unlike ``create_cytoscapejs_from_network()``, the document has no node positions, as the snapshot has no
+        view. Missing values are None.
+
+        Returns:
+            dict: Cytoscape JS document with nodes and edges identified by SUID
+        """
+        def data_dicts(df):
+            return _column_dicts(df.astype(object).where(df.notna(), None), list(df.columns))
+
+        return {'data': {'SUID': self.network_suid},
+                'elements': {'nodes': [{'data': {'id': str(suid), **attrs}}
+                                       for suid, attrs in zip(self.node_suids.tolist(), data_dicts(self.nodes))],
+                             'edges': [{'data': {'id': str(suid), 'source': str(source), 'target': str(target),
+                                                 **attrs}}
+                                       for suid, source, target, attrs in
+                                       zip(self.edge_suids.tolist(), self.node_suids[self.edge_source].tolist(),
+                                           self.node_suids[self.edge_target].tolist(), data_dicts(self.edges))]}}
+
+    def _load_tables(self):
+        self.nodes = tables.get_table_columns('node', self._node_columns, network=self.network_suid,
+                                              base_url=self.base_url)
+        self.edges = tables.get_table_columns('edge', self._edge_columns, network=self.network_suid,
+                                              base_url=self.base_url)
+
+    def _load_network(self):
+        # Get the tables and the topology from the network's Cytoscape JS form, which is the only form CyREST offers
+        # edge endpoints in all at once. It holds the table values, too, so they needn't be fetched separately.
+        elements = commands.cyrest_get(f'networks/{self.network_suid}', base_url=self.base_url)['elements']
+        node_data = [node['data'] for node in elements.get('nodes', [])]
+        edge_data = [edge['data'] for edge in elements.get('edges', [])]
+        self.nodes = self._cytoscapejs_table('node', node_data, self._node_columns)
+        self.edges = self._cytoscapejs_table('edge', edge_data, self._edge_columns)
+        self._set_topology(pd.DataFrame({'source': [data['source'] for data in edge_data],
+                                         'target': [data['target'] for data in edge_data]},
+                                        index=self.edges.index, dtype='int64'))
+
+    def _cytoscapejs_table(self, table, element_data, columns):
+        # Build the table get_table_columns() would return from Cytoscape JS element data, whose keys are column names
+        # with spaces replaced by underscores (e.g., 'shared_name') and which leaves out missing values
+        col_types = tables.get_table_column_types(table, network=self.network_suid, base_url=self.base_url)
+        keys = set().union(*element_data)
+        df = pd.DataFrame(index=[int(data['SUID']) for data in element_data])
+        for col in tables._fetch_column_list(table, columns, list(col_types)):
+            key = col if col in keys else col.replace(' ', '_')
+            df[col] = tables._convert_column_values([data.get(key) for data in element_data], col_types[col])
+        return df
+
+    def _set_topology(self, endpoints):
+        # Keep endpoints for the edges in the edge table, and index them into the node table
+        self._endpoints = endpoints.reindex(self.edges.index)
+        self.node_suids = self.nodes.index.to_numpy(dtype='int64')
+        self.edge_suids = self.edges.index.to_numpy(dtype='int64')
+        node_positions = pd.Index(self.node_suids)
+        self.edge_source = node_positions.get_indexer(self._endpoints['source'])
+        self.edge_target = node_positions.get_indexer(self._endpoints['target'])
+
+        self.csr_edges = np.argsort(self.edge_source, kind='stable')
+        self.csr_indices = self.edge_target[self.csr_edges]
+        self.csr_indptr = np.concatenate([[0], np.cumsum(np.bincount(self.edge_source,
+                                                                     minlength=len(self.node_suids)))])
+
+
 # ==============================================================================
 # VI. Internal functions
 #
@@ -1551,6 +1946,9 @@ def create_cytoscapejs_from_network(network=None, base_url=DEFAULT_BASE_URL):
 # functions.
 # ------------------------------------------------------------------------------
 
+# Rows of a dataframe converted to Arrow at a time when it's written to a tabular file
+_TABULAR_BATCH_ROWS = 65536
+
 def _delay_until_stable(attempt_op, error_text, vote_count=1):
     catchup_network_timeout = time.time() + CATCHUP_NETWORK_TIMEOUT_SECS
     is_stable = False
@@ -1568,3 +1966,195 @@ def _delay_until_stable(attempt_op, error_text, vote_count=1):
             time.sleep(CATCHUP_NETWORK_SECS)
     if not is_stable:
         raise CyError(f'Timeout trying to {error_text}')
+
+
+def _apply_default_style_and_layout(network_suid, base_url):
+    narrate('Applying default style...')
+    _delay_until_stable(lambda: commands.commands_post('vizmap apply styles="default"', base_url=base_url) is not None,
+                        'apply vizmap')
+
+    narrate('Applying preferred layout')
+    _delay_until_stable(lambda: layouts.layout_network(network=network_suid, base_url=base_url) is not None,
+                        'layout network')
+
+def _prefers_file_transport(nodes, edges):
+    # Return whether a network is big enough that sending it as tabular files is faster than sending it as JSON, and
+    # pyarrow is installed to write the files
+    element_count = (0 if nodes is None else len(nodes)) + (0 if edges is None else len(edges))
+    threshold = py4cytoscape_tuning.FILE_TRANSPORT_ELEMENT_COUNT
+    return threshold is not None and element_count >= threshold and importlib.util.find_spec('pyarrow') is not None
+
+def _create_network_from_data_frames_by_file(nodes, edges, title, collection, base_url, node_id_list, source_id_list,
+                                             target_id_list, interaction_type_list):
+    # Create a network by having Cytoscape import edges (plus nodes that have no edges) from one tabular file and node
+    # attributes from another, and return its SUID
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+
+    if nodes is None and edges is None:
+        raise CyError('Must provide either nodes or edges')
+    if edges is None:
+        edges = pd.DataFrame({source_id_list: pd.Series(dtype=object), target_id_list: pd.Series(dtype=object)})
+    for col in [source_id_list, target_id_list]:
+        if not col in edges.columns:
+            raise CyError(f'Edges must have a "{col}" column')
+
+    # infer column types from the whole dataframe, so every slice of it is converted to the same types
+    edges = edges.drop(['SUID'], axis=1, errors='ignore')
+    edge_schema = _integer_schema(edges, pa.Schema.from_pandas(edges, preserve_index=False))
+    for col in [source_id_list, target_id_list]:
+        col_index = edge_schema.get_field_index(col)
+        if pa.types.is_null(edge_schema.field(col_index).type):
+            edge_schema = edge_schema.set(col_index, pa.field(col, pa.string()))
+    batches = _data_frame_batches(edges, edge_schema)
+
+    if nodes is not None:
+        # nodes that have no edges are imported as rows that have a source but no target
+        nodes = nodes.drop(['SUID'], axis=1, errors='ignore')
+        node_ids = nodes[node_id_list]
+        lone_nodes = node_ids[~(node_ids.isin(edges[source_id_list]) | node_ids.isin(edges[target_id_list]))]
+        if len(lone_nodes):
+            lone_batch = pa.RecordBatch.from_arrays(
+                [pa.array(lone_nodes, from_pandas=True).cast(field.type) if field.name == source_id_list
+                 else pa.nulls(len(lone_nodes), type=field.type)     for field in edge_schema], schema=edge_schema)
+            batches = itertools.chain(batches, [lone_batch])
+
+    network_suid = _import_tabular_network(f'{collection or title}.tsv', title, edge_schema, batches, source_id_list,
+                                           target_id_list, interaction_type_list, base_url)
+
+    # load node attributes into Cytoscape network, matching nodes by name
+    if nodes is not None and len(set(nodes.columns) - {node_id_list}) != 0:
+        node_schema = _integer_schema(nodes, pa.Schema.from_pandas(nodes, preserve_index=False))
+        data_type_list = ','.join('s' if name == node_id_list else _tabular_data_type(arrow_type)
+                                  for name, arrow_type in zip(node_schema.names, node_schema.types))
+        key_index = node_schema.get_field_index(node_id_list) + 1
+        _import_tabular_file(f'{title} nodes.tsv',
+                             lambda file: _write_tabular_file(node_schema, _data_frame_batches(nodes, node_schema),
+                                                              file),
+                             lambda file: tables.load_table_data_from_file(file, True, 1, '\t', key_index, 'node',
+                                                                           'shared name', network_suid,
+                                                                           base_url=base_url,
+                                                                           data_type_list=data_type_list),
+                             base_url)
+
+    return network_suid
+
+def _integer_schema(data, schema):
+    # Return the schema with 64-bit integer columns narrowed to 32 bits if all of their values fit, so they're imported
+    # as Integer columns, just as they would be from JSON
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    for col_index, field in enumerate(schema):
+        if pa.types.is_int64(field.type) and data[field.name].between(-2**31, 2**31 - 1).all():
+            schema = schema.set(col_index, field.with_type(pa.int32()))
+    return schema
+
+def _data_frame_batches(data, schema):
+    # Return an iterator over record batches of a dataframe, converting it to Arrow a slice at a time
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    for start in range(0, len(data), _TABULAR_BATCH_ROWS):
+        yield pa.RecordBatch.from_pandas(data.iloc[start:start + _TABULAR_BATCH_ROWS], schema=schema,
+                                         preserve_index=False)
+
+def _edge_list_batches(edges):
+    # Return the schema and an iterator over record batches of an edge list, which is either something that can be
+    # converted to an Arrow table or the name of a Parquet or Arrow IPC file ... files are read a batch at a time
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    import pyarrow.parquet as pq
+    if not isinstance(edges, str):
+        edges = tables._arrow_table(edges)
+        return edges.schema, iter(edges.to_batches())
+    try:
+        if edges.endswith('.parquet'):
+            parquet_file = pq.ParquetFile(edges)
+            return parquet_file.schema_arrow, parquet_file.iter_batches()
+        reader = pa.ipc.open_file(edges)
+        return reader.schema, (reader.get_batch(i) for i in range(reader.num_record_batches))
+    except (OSError, pa.ArrowException) as e:
+        raise CyError(f'Could not read edge list "{edges}": {e}')
+
+def _tabular_column_types(schema, source_id_list, target_id_list, interaction_type_list):
+    # Return the column_type_list and data_type_list that import each column of a tabular file with this schema as
+    # source, target, interaction or edge attribute
+    roles = {source_id_list: 's', target_id_list: 't', interaction_type_list: 'i'}
+    column_types = [roles.get(name, 'ea') for name in schema.names]
+    data_types = ['s' if name in roles else _tabular_data_type(arrow_type)
+                  for name, arrow_type in zip(schema.names, schema.types)]
+    return ','.join(column_types), ','.join(data_types)
+
+def _tabular_data_type(arrow_type):
+    # Return the tabular import data type for an Arrow type ... anything not numeric, boolean or a list is a string
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        return _tabular_data_type(arrow_type.value_type) + 'l'
+    if pa.types.is_boolean(arrow_type):
+        return 'b'
+    if pa.types.is_integer(arrow_type):
+        return 'i' if tables._cytoscape_integer_type(arrow_type) == 'Integer' else 'l'
+    if pa.types.is_floating(arrow_type):
+        return 'd'
+    return 's'
+
+def _write_tabular_file(schema, batches, file):
+    # Write record batches to a tab-separated file with a header row, one batch at a time. List elements are
+    # separated by '|', which is what Cytoscape's tabular import expects.
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    import pyarrow.csv as csv
+
+    def flatten(batch):
+        return pa.table([tables._arrow_flat_column(column, '|') for column in batch.columns], names=batch.schema.names)
+
+    # The header is written separately because Arrow quotes column names even when it doesn't quote values
+    if any(re.search('[\t\r\n"]', name) for name in schema.names):
+        raise CyError('Could not write tabular file ... column names may not contain tabs, quotes or line breaks')
+    write_options = csv.WriteOptions(include_header=False, delimiter='\t', quoting_style='none')
+    try:
+        with open(file, mode='wb') as sink:
+            sink.write(('\t'.join(schema.names) + '\n').encode('utf-8'))
+            with csv.CSVWriter(sink, flatten(schema.empty_table()).schema, write_options=write_options) as writer:
+                for batch in batches:
+                    writer.write_table(flatten(batch))
+    except pa.ArrowException as e:
+        raise CyError(f'Could not write tabular file ... values may not contain tabs, quotes or line breaks: {e}')
+
+def _import_tabular_network(file_name, title, schema, batches, source_id_list, target_id_list, interaction_type_list,
+                            base_url):
+    # Write record batches to a tabular file named file_name, import it as a network named title, and return the new
+    # network's SUID
+    column_type_list, data_type_list = _tabular_column_types(schema, source_id_list, target_id_list,
+                                                             interaction_type_list)
+    res = _import_tabular_file(file_name, lambda file: _write_tabular_file(schema, batches, file),
+                               lambda file: import_network_from_tabular_file(file, True, 1, column_type_list, '\t',
+                                                                             base_url=base_url,
+                                                                             data_type_list=data_type_list),
+                               base_url)
+    network_suid = res['networks'][0]
+    rename_network(title, network=network_suid, base_url=base_url)
+    return network_suid
+
+def _import_tabular_file(file_name, write_file, import_file, base_url):
+    # Have write_file() write a tabular file and import_file() import it, and return what import_file() returns. If
+    # Cytoscape shares this file system, it reads the file where it's written. Otherwise, the file is sent to the
+    # sandbox for the import, and then removed.
+    file_name = re.sub(r'[\\/:*?"<>|]', '_', file_name)
+    sandbox_name, sandbox_path = commands.do_initialize_sandbox(base_url=base_url)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_file = os.path.join(temp_dir, file_name)
+        write_file(temp_file)
+        if not sandbox_name:
+            return import_file(temp_file)
+
+        # Don't replace a file the user already has in the sandbox
+        if sandbox.sandbox_get_file_info(file_name, base_url=base_url)['isFile']:
+            file_name = f'{os.path.splitext(file_name)[0]}-{uuid.uuid4().hex[:8]}{os.path.splitext(file_name)[1]}'
+        sandbox.sandbox_send_to(temp_file, file_name, base_url=base_url)
+        try:
+            return import_file(file_name)
+        finally:
+            sandbox.sandbox_remove_file(file_name, base_url=base_url)
+
+def _column_dicts(df, columns):
+    # Return a list of {column: value} dicts, one per row of df, building them column-wise instead of row by row
+    if not columns:
+        return [{} for i in range(len(df))]
+    return [dict(zip(columns, values)) for values in zip(*[df[col].tolist() for col in columns])]
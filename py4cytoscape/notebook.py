@@ -33,11 +33,15 @@ from .py4cytoscape_notebook import get_notebook_is_running
 
 @cy_log
 def notebook_export_show_image(filename='image', type='PNG', resolution=None, units=None, height=None, width=None, zoom=None,
-                               sandbox_name=None, network=None, base_url=DEFAULT_BASE_URL, *, overwrite_file=True):
+                               sandbox_name=None, network=None, base_url=DEFAULT_BASE_URL, *, overwrite_file=True,
+                               in_memory=False):
     """Show network view in notebook output.
 
     Export a network view to an image file, then upload the file to the notebook file system and display the image.
 
+    If ``in_memory`` is True, a PNG image that needs no parameters other than ``height`` is instead fetched directly
+    into memory (see :meth:`get_network_view_image`), and ``filename`` is neither written nor transferred.
+
     Args:
         filename (str): Full path or path relative to current working directory, in addition to the name of the file.
             File is used to save image of network view so it can be transferred to the notebook file system and displayed.
@@ -59,6 +63,8 @@ def notebook_export_show_image(filename='image', type='PNG', resolution=None, un
             and the latest version of the CyREST API supported by this version of py4cytoscape.
         overwrite_file (bool): False allows Cytoscape show a message box before overwriting the file if the file already
             exists; True allows Cytoscape to overwrite it without asking
+        in_memory (bool): True fetches a PNG image directly when possible; False (the default) always exports the
+            image to ``filename`` and transfers the file
 
     Returns:
         object: iPython.display.Image class instance
@@ -69,12 +75,13 @@ def notebook_export_show_image(filename='image', type='PNG', resolution=None, un
 
     Examples:
         >>> notebook_export_show_image()
+        >>> notebook_export_show_image(height=300, in_memory=True) # fetched directly, without a file
         >>> notebook_export_show_image('myfile.png', overwrite_file=False)
         >>> notebook_export_show_image('imagex', type='JPG')
     """
     return _export_show_image(export_first=True, filename=filename, type=type, resolution=resolution, units=units,
                               height=height, width=width, zoom=zoom, sandbox_name=sandbox_name, network=network,
-                              base_url=base_url, overwrite_file=overwrite_file)
+                              base_url=base_url, overwrite_file=overwrite_file, in_memory=in_memory)
 
 @cy_log
 def notebook_show_image(filename, type='PNG', sandbox_name=None, network=None, base_url=DEFAULT_BASE_URL,
@@ -112,8 +119,18 @@ def notebook_show_image(filename, type='PNG', sandbox_name=None, network=None, b
                               base_url=base_url, overwrite_file=overwrite_file)
 
 def _export_show_image(export_first, filename='image', type='PNG', resolution=None, units=None, height=None, width=None, zoom=None,
-                       sandbox_name=None, network=None, base_url=DEFAULT_BASE_URL, *, overwrite_file=True):
+                       sandbox_name=None, network=None, base_url=DEFAULT_BASE_URL, *, overwrite_file=True,
+                       in_memory=False):
     if get_notebook_is_running():
+        from IPython import display
+
+        # Fetch a plain PNG straight into memory, without a trip through the sandbox and notebook file systems
+        if export_first and in_memory and type.lower() == 'png' and \
+                resolution is None and units in (None, 'pixels') and width is None and zoom is None:
+            image = network_views.get_network_view_image(type='PNG', height=height, network=network,
+                                                         base_url=base_url)
+            return display.Image(data=image, format='png')
+
         # Add suffix if one is not supplied ... preserve sandbox subdirectory if one is provided
         if re.search('.' + type.lower() + '$', filename) is None: filename += '.' + type.lower()
 
@@ -125,7 +142,6 @@ def _export_show_image(export_first, filename='image', type='PNG', resolution=No
         # Transfer sandbox version of image to local storage so notebook can see it
         sandbox.sandbox_get_from(filename, overwrite=overwrite_file, sandbox_name=sandbox_name, base_url=base_url)
 
-        from IPython import display
         return display.Image(filename)
     else:
         raise CyError('Cannot display network view image unless running as a Jupyter Notebook.')
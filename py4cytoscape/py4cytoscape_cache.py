@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+
+"""Client-side caches of Cytoscape state that is expensive to fetch and rarely changes, broken out into this file
+to avoid circular module usage.
+"""
+
+"""Copyright 2020-2022 The Cytoscape Consortium
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+# External library imports
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
+
+# Internal module imports
+from . import py4cytoscape_tuning
+
+# Internal module convenience imports
+
+# print(f'Starting {__name__} module')
+
+
+"""Table key index: the distinct values of a table column that is used as a merge key by load_table_data().
+
+Each entry is keyed by (base_url, network SUID, fully qualified table name, column name) and holds the table's
+row count at the time the column was fetched along with the column's values. The row count lets a caller detect that
+rows were added or deleted elsewhere (e.g., in the Cytoscape GUI) since the index was built. Requests through
+py4cytoscape that can add or remove rows clear the whole index for their base_url (see commands._remember_request()),
+and writes that can change a key column's values (e.g., loading, renaming or deleting the column) must call
+clear_table_key_index() for that column."""
+
+_table_key_index = {}
+
+def get_table_key_index(base_url, network_suid, table, column, row_count):
+    # Return the cached key values for a table column, or None if they aren't cached or the row count has changed
+    entry = _table_key_index.get((base_url, network_suid, table, column))
+    if entry is None or entry[0] != row_count:
+        return None
+    return entry[1]
+
+def set_table_key_index(base_url, network_suid, table, column, row_count, key_values):
+    # Remember the key values for a table column, along with the row count they correspond to
+    _table_key_index[(base_url, network_suid, table, column)] = (row_count, key_values)
+    return key_values
+
+def clear_table_key_index(base_url=None, network_suid=None, table=None, columns=None):
+    # Forget cached key values ... any of the qualifiers that are None match all entries
+    for key in list(_table_key_index):
+        k_base_url, k_network_suid, k_table, k_column = key
+        if (base_url is None or k_base_url == base_url) and \
+           (network_suid is None or k_network_suid == network_suid) and \
+           (table is None or k_table == table) and \
+           (columns is None or k_column in columns):
+            del _table_key_index[key]
+
+
+"""Client state: how to reach the Cytoscape at a base_url, as decided before the first request to it.
+
+Each entry is keyed by base_url and holds the execution environment, the function that issues requests in that
+environment, the default sandbox that goes with it and the sandbox generation (see py4cytoscape_sandbox) it was made
+in. Deciding these is cheap but not free, and it would otherwise be repeated on every request. An entry is stale if
+the execution environment has changed or the default sandbox has been reset since it was made; callers check this
+before using it. Only a first connection or a change of environment makes the other caches for base_url stale, so
+replacing a stale entry in the same environment keeps them."""
+
+_client_state = {}
+
+def get_client_state(base_url):
+    # Return the (environment, requester, default sandbox, sandbox generation) remembered for base_url, or None if
+    # there isn't one
+    return _client_state.get(base_url)
+
+def set_client_state(base_url, environment, requester, default_sandbox, sandbox_generation):
+    # Remember how to reach the Cytoscape at base_url ... if this is a new connection or a new way of reaching it,
+    # forget what it told us before
+    previous = _client_state.get(base_url)
+    if previous is None or previous[0] != environment:
+        clear_vocabulary(base_url)
+        clear_layout_metadata(base_url)
+        clear_table_cache_session(base_url)
+        clear_collection_names(base_url)
+    _client_state[base_url] = (environment, requester, default_sandbox, sandbox_generation)
+    return _client_state[base_url]
+
+def clear_client_state(base_url=None):
+    # Forget how to reach the Cytoscape at base_url, or at all base_urls if base_url is None
+    if base_url is None:
+        _client_state.clear()
+    else:
+        _client_state.pop(base_url, None)
+
+
+"""Layout metadata: the layouts a Cytoscape offers and the parameters each one takes.
+
+Each entry is keyed by base_url and holds the Cytoscape version the metadata was fetched from, the layout names, the
+GUI name of each layout and the parameter definitions of each layout, the latter two filled in as they are needed.
+The layouts and their parameters are fixed for a given Cytoscape version and set of installed apps, so the entry is
+kept until apps are changed through py4cytoscape, py4cytoscape (re)connects to base_url, or the cache is cleared, and
+it is refetched if the Cytoscape version changes. Parameter values can be changed at any time (e.g., in the Cytoscape
+GUI), so they aren't kept."""
+
+_layout_metadata = {}
+
+def get_layout_metadata(base_url):
+    # Return the layout metadata remembered for base_url, or None if there isn't any
+    return _layout_metadata.get(base_url)
+
+def set_layout_metadata(base_url, cytoscape_version, layout_names):
+    # Start remembering layout metadata for base_url, beginning with the layout names
+    _layout_metadata[base_url] = {'version': cytoscape_version, 'names': layout_names, 'long_names': {},
+                                  'parameters': {}}
+    return _layout_metadata[base_url]
+
+def clear_layout_metadata(base_url=None):
+    # Forget layout metadata for base_url, or for all base_urls if base_url is None
+    if base_url is None:
+        _layout_metadata.clear()
+    else:
+        _layout_metadata.pop(base_url, None)
+
+
+"""Collection names: the name of each collection (i.e., root network) in the current Cytoscape session.
+
+Each entry is keyed by (base_url, collection SUID) and holds the collection's name, or None if it is unnamed. Cytoscape
+doesn't reuse a SUID within a session, so an entry stays correct until the collection is renamed, which py4cytoscape
+doesn't do. A new session (e.g., one opened from a file, or a restarted Cytoscape) can reuse SUIDs, so entries for
+base_url are forgotten when py4cytoscape creates or opens a session, pings or (re)connects to base_url."""
+
+_collection_names = {}
+
+def get_collection_names(base_url, collection_suids):
+    # Return {SUID: name} for the collections whose names are remembered
+    return {suid: _collection_names[(base_url, suid)]
+            for suid in collection_suids if (base_url, suid) in _collection_names}
+
+def set_collection_names(base_url, names):
+    # Remember the names of collections, given as {SUID: name}
+    _collection_names.update({(base_url, suid): name for suid, name in names.items()})
+    return names
+
+def clear_collection_names(base_url=None):
+    # Forget collection names for base_url, or for all base_urls if base_url is None
+    for key in list(_collection_names):
+        if base_url is None or key[0] == base_url:
+            del _collection_names[key]
+
+
+"""Vocabulary: the Cytoscape and CyREST versions, and the values Cytoscape accepts for properties such as NODE_SHAPE.
+
+Each entry is keyed by base_url and holds {vocabulary item: value}, where the 'version' item is the reply of
+cytoscape_version_info(). These values can't change while Cytoscape runs with the same apps, so they are fetched once
+per connection and forgotten when py4cytoscape (re)connects to base_url or changes its apps. They also depend only on
+the Cytoscape version and the installed apps (e.g., an app can add values), so if a vocabulary cache directory is set
+(see py4cytoscape_tuning), the 'apps' item holds the installed apps and versions, and the other items are kept in a
+file named for the Cytoscape version and apps and reused by later runs."""
+
+_vocabulary = {}
+_VOCABULARY_FILE_KEY_ITEMS = {'version', 'apps'} # items that name the vocabulary file instead of being kept in it
+
+def get_vocabulary(base_url, item):
+    # Return the value of a vocabulary item for base_url, or None if it isn't known
+    return _vocabulary.get(base_url, {}).get(item)
+
+def set_vocabulary(base_url, item, value):
+    # Remember the value of a vocabulary item for base_url, and persist it if possible
+    vocabulary = _vocabulary.setdefault(base_url, {})
+    vocabulary[item] = value
+    if item not in _VOCABULARY_FILE_KEY_ITEMS:
+        _save_vocabulary_file(vocabulary)
+    return value
+
+def load_vocabulary_file(base_url):
+    # Fill in the vocabulary for base_url from the file for its Cytoscape version and apps, if there is one
+    vocabulary = _vocabulary.get(base_url, {})
+    file_name = _vocabulary_file_name(vocabulary)
+    if file_name:
+        try:
+            with open(file_name, 'r', encoding='utf-8') as file:
+                for item, value in json.load(file).items():
+                    vocabulary.setdefault(item, value)
+        except (OSError, ValueError):
+            pass # A missing or unreadable file just means the vocabulary must be fetched
+
+def clear_vocabulary(base_url=None):
+    # Forget the vocabulary for base_url, or for all base_urls if base_url is None ... persisted files are kept
+    if base_url is None:
+        _vocabulary.clear()
+    else:
+        _vocabulary.pop(base_url, None)
+
+def _save_vocabulary_file(vocabulary):
+    # Write all items except the file's key items to the file for the vocabulary's Cytoscape version and apps,
+    # replacing it atomically
+    file_name = _vocabulary_file_name(vocabulary)
+    if file_name:
+        try:
+            os.makedirs(os.path.dirname(file_name), exist_ok=True)
+            with open(file_name + '.part', 'w', encoding='utf-8') as file:
+                json.dump({item: value for item, value in vocabulary.items()
+                           if item not in _VOCABULARY_FILE_KEY_ITEMS}, file)
+            os.replace(file_name + '.part', file_name)
+        except OSError:
+            pass # Persisting is only an optimization
+
+def _vocabulary_file_name(vocabulary):
+    # Name the file holding vocabulary for a Cytoscape version and set of installed apps, or return None if vocabulary
+    # isn't to be persisted (e.g., the installed apps aren't known)
+    cache_dir = py4cytoscape_tuning.VOCABULARY_CACHE_DIR
+    if not cache_dir or 'version' not in vocabulary or not isinstance(vocabulary.get('apps'), list):
+        return None
+    version = re.sub('[^A-Za-z0-9._-]', '_', str(vocabulary['version'].get('cytoscapeVersion')))
+    apps_hash = hashlib.sha256('\n'.join(vocabulary['apps']).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f'vocabulary-{version}-{apps_hash}.json')
+
+
+"""View images: images of network views, as rendered by Cytoscape.
+
+Each entry is keyed by (base_url, view SUID, image type, image height, digest of the view's content) and holds the
+image's bytes. Because the key includes the digest, an entry can't be used once the view changes, so entries never
+need to be invalidated ... instead, the least recently used entries are dropped once there are more than
+py4cytoscape_tuning.VIEW_IMAGE_CACHE_SIZE of them."""
+
+_view_images = OrderedDict()
+
+def get_view_image(base_url, view_suid, image_type, height, digest):
+    # Return the image remembered for a view in a given state, or None if there isn't one
+    key = (base_url, view_suid, image_type, height, digest)
+    image = _view_images.get(key)
+    if image is not None:
+        _view_images.move_to_end(key)
+    return image
+
+def set_view_image(base_url, view_suid, image_type, height, digest, image):
+    # Remember the image of a view in a given state, dropping the least recently used images if there are too many
+    _view_images[(base_url, view_suid, image_type, height, digest)] = image
+    while len(_view_images) > max(py4cytoscape_tuning.VIEW_IMAGE_CACHE_SIZE, 0):
+        _view_images.popitem(last=False)
+    return image
+
+def clear_view_images(base_url=None):
+    # Forget view images for base_url, or for all base_urls if base_url is None
+    for key in list(_view_images):
+        if base_url is None or key[0] == base_url:
+            del _view_images[key]
+
+
+"""Request memo: the replies to CyREST GETs made within a coalesce() block, so that a GET repeated within the block
+is answered without another round trip.
+
+Each entry is keyed by (base_url, resource, URL, query parameters, Accept header) and holds the reply, where the
+resource is the first segment of the URL's path (e.g., 'networks'). The memo belongs to the thread that opened the
+block, exists only while the block runs and is forgotten when the outermost block ends. Writes made within the block
+must call clear_request_memo() for the resources they may change."""
+
+_request_memo = threading.local()
+
+def start_request_memo():
+    # Begin (or nest) a block whose GET replies are remembered
+    _request_memo.depth = getattr(_request_memo, 'depth', 0) + 1
+    if _request_memo.depth == 1:
+        _request_memo.replies = {}
+
+def end_request_memo():
+    # End a block, and forget all remembered replies if it's the outermost one
+    _request_memo.depth -= 1
+    if _request_memo.depth == 0:
+        _request_memo.replies = None
+
+def get_request_memo(key):
+    # Return the remembered reply for a GET, or None if there isn't one or no block is running
+    replies = getattr(_request_memo, 'replies', None)
+    return replies.get(key) if replies else None
+
+def set_request_memo(key, reply):
+    # Remember the reply for a GET if a block is running
+    replies = getattr(_request_memo, 'replies', None)
+    if replies is not None:
+        replies[key] = reply
+    return reply
+
+def clear_request_memo(base_url=None, resources=None):
+    # Forget remembered replies for some resources at base_url ... any of the qualifiers that are None match all entries
+    replies = getattr(_request_memo, 'replies', None)
+    for key in list(replies or {}):
+        k_base_url, k_resource = key[0], key[1]
+        if (base_url is None or k_base_url == base_url) and (resources is None or k_resource in resources):
+            del replies[key]
+
+
+"""Table cache: columns of node and edge tables, kept on disk so later runs that read the same session file needn't
+fetch them again.
+
+The cache is used only if a table cache directory is set (see py4cytoscape_tuning), and only from the time
+py4cytoscape opens or saves a session file until the first request through py4cytoscape that may change a table
+(see commands._remember_request()). During that time, the session's tables are the ones in the file, so columns are
+kept in a directory for the file's path, size and modification time. A later version of the file gets a new
+directory, and directories for earlier versions are discarded. Each column is kept along with the table's row count
+and the column's Cytoscape type when it was read; it is used only if both still match. Columns of numbers (and
+Booleans without missing values) are kept as NumPy .npy files, which are memory mapped instead of read (except on
+Windows, where a mapped file can't be deleted), and other columns as JSON."""
+
+_TABLE_CACHE_NPY_KINDS = 'biuf' # NumPy dtype kinds that can be memory mapped: Boolean, signed/unsigned int, float
+
+_table_cache_sessions = {}
+
+def get_table_cache_session(base_url):
+    # Return the table cache key for the session file whose tables are loaded at base_url, or None if the session may
+    # differ from any file
+    return _table_cache_sessions.get(base_url)
+
+def set_table_cache_session(base_url, session_file):
+    # Start using the table cache for the session file just opened or saved at base_url, and discard columns cached for
+    # other versions of the file. The cache isn't used if the file can't be found (e.g., Cytoscape is on another
+    # machine). Returns the table cache key, or None.
+    clear_table_cache_session(base_url)
+    cache_dir = py4cytoscape_tuning.TABLE_CACHE_DIR
+    if not cache_dir or not session_file:
+        return None
+    try:
+        file_stat = os.stat(session_file)
+    except (OSError, TypeError, ValueError):
+        return None
+    path_hash = hashlib.sha256(os.path.abspath(session_file).encode('utf-8')).hexdigest()[:16]
+    session_dir = f'tables-{path_hash}'
+    _table_cache_sessions[base_url] = os.path.join(session_dir, f'{file_stat.st_size}-{file_stat.st_mtime_ns}')
+
+    # Retry leftovers, too ... a file that couldn't be deleted before may be deletable now
+    in_use = set(_table_cache_sessions.values())
+    session_path = os.path.join(cache_dir, session_dir)
+    for version_dir in (os.listdir(session_path) if os.path.isdir(session_path) else []):
+        if os.path.join(session_dir, version_dir) not in in_use:
+            shutil.rmtree(os.path.join(session_path, version_dir), ignore_errors=True)
+    return _table_cache_sessions[base_url]
+
+def clear_table_cache_session(base_url=None):
+    # Stop using the table cache at base_url (or at all base_urls if base_url is None) until a session file is opened
+    # or saved. The cached columns are kept, as they still match the file.
+    if base_url is None:
+        _table_cache_sessions.clear()
+    else:
+        _table_cache_sessions.pop(base_url, None)
+
+def get_table_cache_column(session_key, network_suid, table, column, row_count, column_type):
+    # Return the cached values of a table column (a read-only array or a list), or None if they aren't cached or don't
+    # match the row count and type
+    file_name = _table_cache_file_name(session_key, network_suid, table, column)
+    if file_name is None:
+        return None
+    import numpy as np # Imported here so commands (which imports this module) doesn't pay for it
+    try:
+        with open(file_name + '.meta.json', 'r', encoding='utf-8') as file:
+            meta = json.load(file)
+        if meta['row_count'] != row_count or meta['type'] != column_type:
+            return None
+        if meta['format'] == 'npy':
+            return np.load(file_name + '.npy', mmap_mode=None if os.name == 'nt' else 'r', allow_pickle=False)
+        with open(file_name + '.values.json', 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError, KeyError):
+        return None # A missing or unreadable file just means the column must be fetched
+
+def set_table_cache_column(session_key, network_suid, table, column, row_count, column_type, values):
+    # Keep the values of a table column (a list, or an array of numbers or Booleans) on disk, replacing any earlier
+    # copy atomically
+    file_name = _table_cache_file_name(session_key, network_suid, table, column)
+    if file_name is None:
+        return values
+    import numpy as np
+    try:
+        os.makedirs(os.path.dirname(file_name), exist_ok=True)
+        if isinstance(values, np.ndarray) and values.dtype.kind in _TABLE_CACHE_NPY_KINDS:
+            data_format = 'npy'
+            with open(file_name + '.npy.part', 'wb') as file:
+                np.save(file, values, allow_pickle=False)
+            os.replace(file_name + '.npy.part', file_name + '.npy')
+        else:
+            data_format = 'json'
+            with open(file_name + '.values.json.part', 'w', encoding='utf-8') as file:
+                json.dump(list(values), file)
+            os.replace(file_name + '.values.json.part', file_name + '.values.json')
+        with open(file_name + '.meta.json.part', 'w', encoding='utf-8') as file:
+            json.dump({'table': table, 'column': column, 'row_count': row_count, 'type': column_type,
+                       'format': data_format}, file)
+        os.replace(file_name + '.meta.json.part', file_name + '.meta.json')
+    except (OSError, TypeError, ValueError):
+        pass # Caching is only an optimization
+    return values
+
+def clear_table_cache():
+    # Stop using the table cache, and discard all cached columns. Files that can't be deleted now (e.g., because
+    # they're still open) are tried again the next time.
+    clear_table_cache_session()
+    cache_dir = py4cytoscape_tuning.TABLE_CACHE_DIR
+    if not cache_dir or not os.path.isdir(cache_dir):
+        return
+    for session_dir in os.listdir(cache_dir):
+        if session_dir.startswith('tables-'):
+            shutil.rmtree(os.path.join(cache_dir, session_dir), ignore_errors=True)
+
+def _table_cache_file_name(session_key, network_suid, table, column):
+    # Name the files (less their suffixes) holding a cached column, or return None if the column isn't to be cached
+    cache_dir = py4cytoscape_tuning.TABLE_CACHE_DIR
+    if not cache_dir or not session_key:
+        return None
+    column_hash = hashlib.sha256(f'{table}\t{column}'.encode('utf-8')).hexdigest()[:32]
+    return os.path.join(cache_dir, session_key, str(network_suid), column_hash)
+
+
+def clear_caches():
+    """Discard all client-side caches of Cytoscape state.
+
+    py4cytoscape keeps some Cytoscape state (e.g., the values of table key columns) on the client so repeated calls
+    don't have to re-fetch it. py4cytoscape discards cached state when it changes the state itself, but it can't know
+    about changes made by other clients or in the Cytoscape GUI. Call this function after such changes.
+
+    Table columns kept on disk (see ``set_table_cache_dir()``) are discarded, too. Persisted vocabulary is kept, as
+    it depends only on the Cytoscape version.
+
+    Returns:
+        None
+
+    Examples:
+        >>> clear_caches()
+    """
+    clear_table_key_index()
+    clear_client_state()
+    clear_layout_metadata()
+    clear_collection_names()
+    clear_vocabulary()
+    clear_view_images()
+    clear_request_memo()
+    clear_table_cache()
@@ -38,11 +38,20 @@ from .py4cytoscape_logger_settings import _DETAIL_LOG_DIR, _DETAIL_LOG_LEVEL, _D
 
 _RESOLVED_DETAIL_LOG_DIR = os.environ.get('PY4CYTOSCAPE_DETAIL_LOGGER_DIR', _DETAIL_LOG_DIR)
 _detail_log_base = os.path.join(_RESOLVED_DETAIL_LOG_DIR, _DETAIL_LOG_NAME)
-if not os.path.exists(_RESOLVED_DETAIL_LOG_DIR): os.makedirs(_RESOLVED_DETAIL_LOG_DIR)
+
+class _DeferredRotatingFileHandler(RotatingFileHandler):
+    # Create the log directory and open the log file when the first record is written instead of at import time, so
+    # importing py4cytoscape doesn't touch the file system unless something is actually logged
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
 
 # Set up detail logger
 detail_logger = logging.getLogger('py4...')
-detail_handler = RotatingFileHandler(_detail_log_base, maxBytes=10485760, backupCount=10, encoding='utf8')
+detail_handler = _DeferredRotatingFileHandler(_detail_log_base, maxBytes=10485760, backupCount=10, encoding='utf8')
 detail_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s'))
 detail_logger.setLevel(_DETAIL_LOG_LEVEL)
 detail_logger.addHandler(detail_handler)
@@ -153,14 +162,15 @@ def log_http_request(method, url, **kwargs):
         if _SUMMARY_ENABLE_HTTP_CALLS and summary_logger.isEnabledFor(logging.INFO) and _summary_logger_enable:
             summary_logger.info(' ' + _logger_nesting_spacer + 'HTTP ' + method + '(' + url + ')' + params + json + data)
 
-def log_http_result(r):
+def log_http_result(r, streamed=False):
+    # For a streamed result, reading r.text would pull the entire content into memory, so don't log it
     if (_DETAIL_ENABLE_HTTP_CALLS and detail_logger.isEnabledFor(logging.DEBUG)) or \
         (_SUMMARY_ENABLE_HTTP_CALLS and summary_logger.isEnabledFor(logging.DEBUG)):
         if _DETAIL_ENABLE_HTTP_CALLS and detail_logger.isEnabledFor(logging.DEBUG):
-            content = ', content: ' + r.text if _DETAIL_ENABLE_HTTP_CONTENT else ''
+            content = ', content: ' + ('<streamed>' if streamed else r.text) if _DETAIL_ENABLE_HTTP_CONTENT else ''
             detail_logger.debug(_logger_nesting_spacer + r.reason + '[' + str(r.status_code) + ']' + content)
         if _SUMMARY_ENABLE_HTTP_CALLS and summary_logger.isEnabledFor(logging.INFO) and _summary_logger_enable:
-            content = ', content: ' + r.text if _SUMMARY_ENABLE_HTTP_CONTENT else ''
+            content = ', content: ' + ('<streamed>' if streamed else r.text) if _SUMMARY_ENABLE_HTTP_CONTENT else ''
             summary_logger.info(' ' + _logger_nesting_spacer + r.reason + '[' + str(r.status_code) + ']' + content)
 
 def narrate(progress):
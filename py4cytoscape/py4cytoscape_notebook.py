@@ -19,8 +19,15 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 # External library imports
 import requests
 import json
+import math
 import os
+import re
+import gzip
 import uuid
+try:
+    import orjson # Optional ... parses and serializes multi-MB payloads several times faster than json
+except ImportError:
+    orjson = None
 
 
 # Internal module convenience imports
@@ -31,7 +38,6 @@ from .py4cytoscape_utils import LOCAL_BASE_URL
 
 
 # Call CyREST as a remote service via Jupyter-bridge
-import chardet
 class SpoofResponse:
 
     def __init__(self, url, status_code, reason, text):
@@ -43,8 +49,13 @@ class SpoofResponse:
     def __repr__(self):
         return '<SpoofResponse [%s]>' % (self.status_code)
 
+    @property
+    def content(self):
+        # Jupyter-Bridge replies are always text, so this is the text's UTF-8 encoding
+        return self.text.encode('utf-8') if self.text is not None else b''
+
     def json(self):
-        return json.loads(self.text)
+        return _json_loads(self.text)
 
     def raise_for_status(self):
         """Raises stored :class:`HTTPError`, if one occurred."""
@@ -81,9 +92,142 @@ def get_browser_client_channel():
 def get_jupyter_bridge_url():
     return _JUPYTER_BRIDGE_URL
 
+# How to send several independent requests through Jupyter-bridge. In 'auto' mode, requests are packed into one
+# bridge message if the bridge advertises the 'batch' capability, or kept in flight together if it advertises the
+# 'pipeline' capability. Otherwise (and in 'sequential' mode), each request waits for its reply before the next is sent.
+_BRIDGE_REQUEST_MODES = {'auto', 'sequential'}
+_bridge_request_mode = os.environ.get('PY4CYTOSCAPE_BRIDGE_REQUEST_MODE', 'auto')
+_bridge_pipeline_depth = int(os.environ.get('PY4CYTOSCAPE_BRIDGE_PIPELINE_DEPTH', '8'))
+_bridge_capabilities = None # Resolved when the first multi-request operation is issued on a channel
+
+# In 'auto' mode, request bodies at least this large are gzip-compressed if the bridge advertises the 'gzip' capability.
+# (Replies are decompressed automatically by requests if the bridge compresses them.)
+_BRIDGE_GZIP_MIN_BYTES = int(os.environ.get('PY4CYTOSCAPE_BRIDGE_GZIP_MIN_BYTES', '65536'))
+
+# Reuse connections to Jupyter-bridge so each call doesn't pay for a new TCP and TLS handshake
+_bridge_session = requests.Session()
+
+def set_jupyter_bridge_request_mode(mode='auto', pipeline_depth=None):
+    global _bridge_request_mode, _bridge_pipeline_depth
+    if mode not in _BRIDGE_REQUEST_MODES:
+        raise ValueError(f'Jupyter-bridge request mode must be one of {sorted(_BRIDGE_REQUEST_MODES)}')
+    old_state = (_bridge_request_mode, _bridge_pipeline_depth)
+    _bridge_request_mode = mode
+    if pipeline_depth is not None:
+        _bridge_pipeline_depth = max(1, int(pipeline_depth))
+    return old_state
+
+def get_jupyter_bridge_request_mode():
+    return _bridge_request_mode, _bridge_pipeline_depth
+
 def do_request_jupyter_bridge(method, url, **kwargs):
     log_http_request(method, url, **kwargs)
 
+    # Call Jupyter-bridge to request a Cytoscape operation. Jupyter-bridge will put the request into a queue, and
+    # the local browser will pick it out, use it to call Cytoscape, and then queue a reply.
+    _queue_bridge_request(_make_bridge_request(method, url, **kwargs))
+
+    # Call Juptyer-bridge to pick up a reply queued by the local browser, which called Cytoscape to execute an operation
+    # and return a reply.
+    return _make_bridge_response(url, _dequeue_bridge_reply())
+
+def do_requests_jupyter_bridge(request_list):
+    # Execute a list of independent (method, url, kwargs) requests and return their responses in the same order
+    capabilities = _get_bridge_capabilities() if _bridge_request_mode == 'auto' and len(request_list) > 1 else set()
+
+    if 'batch' in capabilities:
+        # Pack all requests into a single bridge message. The browser executes each one and returns a single reply
+        # whose text is a list of the individual replies, each tagged with the id of the request it answers.
+        batch = []
+        for request_id, (method, url, kwargs) in enumerate(request_list):
+            log_http_request(method, url, **kwargs)
+            batch.append(dict(_make_bridge_request(method, url, **kwargs), id=request_id))
+        _queue_bridge_request({'command': 'batch', 'url': None, 'params': None, 'data': batch, 'headers': None})
+        batch_reply = _dequeue_bridge_reply()
+        if _is_unknown_bridge_command(batch_reply):
+            # The browser client doesn't understand batches, so nothing was executed ... send the requests one at a
+            # time from now on
+            detail_logger.debug(f'Jupyter-bridge batch rejected, so sending requests one at a time: {batch_reply}')
+            _disable_bridge_capabilities()
+            return [do_request_jupyter_bridge(method, url, **kwargs) for method, url, kwargs in request_list]
+        try:
+            if batch_reply['status'] != 200:
+                raise ValueError(batch_reply['reason'])
+            cy_replies = {cy_reply['id']: cy_reply for cy_reply in _json_loads(batch_reply['text'])}
+            return [_make_bridge_response(url, cy_replies[request_id])
+                    for request_id, (method, url, kwargs) in enumerate(request_list)]
+        except (KeyError, TypeError, ValueError) as e:
+            # Some or all of the batch may have been executed, so its requests can't safely be sent again (e.g., a
+            # POST would add a second annotation) ... report the failure, and stop batching
+            _disable_bridge_capabilities()
+            raise requests.exceptions.HTTPError(f'Undecipherable reply to a batch of {len(request_list)} requests '
+                                                f'received from Jupyter-bridge, so they may or may not have been '
+                                                f'executed: {e}')
+    elif 'pipeline' in capabilities:
+        # Keep up to _bridge_pipeline_depth requests queued at once. The browser tags each reply with the id of the
+        # request it answers, so replies can be matched up even if they come back out of order.
+        cy_replies = {}
+        next_request = 0
+        pipeline_depth = _bridge_pipeline_depth
+        while len(cy_replies) < len(request_list):
+            while next_request < len(request_list) and next_request - len(cy_replies) < pipeline_depth:
+                method, url, kwargs = request_list[next_request]
+                log_http_request(method, url, **kwargs)
+                _queue_bridge_request(dict(_make_bridge_request(method, url, **kwargs), id=next_request))
+                next_request += 1
+            cy_reply = _dequeue_bridge_reply()
+            reply_id = cy_reply.get('id')
+            if reply_id not in range(next_request) or reply_id in cy_replies:
+                # An untagged reply (e.g., an error, or from a client that doesn't pipeline) answers the oldest
+                # request still waiting, as requests are executed in the order they're queued. Send the rest one at a
+                # time, as there's no telling which later replies would match.
+                reply_id = min(set(range(next_request)) - set(cy_replies))
+                pipeline_depth = 1
+                _disable_bridge_capabilities()
+            cy_replies[reply_id] = cy_reply
+        return [_make_bridge_response(url, cy_replies[request_id])
+                for request_id, (method, url, kwargs) in enumerate(request_list)]
+    else:
+        return [do_request_jupyter_bridge(method, url, **kwargs) for method, url, kwargs in request_list]
+
+def _get_bridge_capabilities():
+    # Ask the Jupyter-bridge server (once per channel) which multi-request features it supports. Its ping reply lists
+    # them in a 'capabilities' field (or an X-Jupyter-Bridge-Capabilities header) ... older bridges reply with plain
+    # text, and get none.
+    global _bridge_capabilities
+    if _bridge_capabilities is None:
+        try:
+            r = _bridge_session.request('GET', f'{_JUPYTER_BRIDGE_URL}/ping')
+            r.raise_for_status()
+            capabilities = r.headers.get('X-Jupyter-Bridge-Capabilities')
+            if capabilities is not None:
+                _bridge_capabilities = {capability.strip() for capability in capabilities.split(',')} - {''}
+            else:
+                try:
+                    reply = _json_loads(r.content)
+                except ValueError:
+                    reply = None
+                _bridge_capabilities = set(reply.get('capabilities', [])) if isinstance(reply, dict) else set()
+        except Exception as e:
+            detail_logger.debug(f'Could not determine Jupyter-bridge capabilities: {e}')
+            _bridge_capabilities = set()
+    return _bridge_capabilities
+
+_BRIDGE_UNKNOWN_COMMAND_STATUSES = {400, 404, 405, 501} # a browser client's status for a command it doesn't support
+
+def _is_unknown_bridge_command(cy_reply):
+    # Return whether the browser client rejected a command it doesn't support, before executing anything
+    if not isinstance(cy_reply, dict) or cy_reply.get('status') == 200:
+        return False
+    return cy_reply.get('status') in _BRIDGE_UNKNOWN_COMMAND_STATUSES or \
+        'unknown command' in str(cy_reply.get('reason', '')).lower()
+
+def _disable_bridge_capabilities():
+    # Fall back to sending requests one at a time until a new browser client is started
+    global _bridge_capabilities
+    _bridge_capabilities = set()
+
+def _make_bridge_request(method, url, **kwargs):
     if 'json' in kwargs:
         data = kwargs['json']
     elif 'data' in kwargs:
@@ -91,27 +235,32 @@ def do_request_jupyter_bridge(method, url, **kwargs):
     else:
         data = None
 
-    http_request = {'command': method,
-                    'url': url,
-                    'params': kwargs['params'] if 'params' in kwargs else None,
-                    'data': data,
-                    'headers': kwargs['headers'] if 'headers' in kwargs else None
-                    }
-
-    # Call Jupyter-bridge to request a Cytoscape operation. Jupyter-bridge will put the request into a queue, and
-    # the local browser will pick it out, use it to call Cytoscape, and then queue a reply.
+    return {'command': method,
+            'url': url,
+            'params': kwargs['params'] if 'params' in kwargs else None,
+            'data': data,
+            'headers': kwargs['headers'] if 'headers' in kwargs else None
+            }
+
+def _queue_bridge_request(http_request):
+    body = _json_dumps(http_request)
+    headers = {'Content-Type': 'application/json'}
+    # Only look up capabilities when they're in use anyway ... sequential mode never probes the bridge
+    if len(body) >= _BRIDGE_GZIP_MIN_BYTES and _bridge_request_mode == 'auto' \
+            and 'gzip' in _get_bridge_capabilities():
+        body = gzip.compress(body, compresslevel=5) # Favor speed ... JSON compresses well even at low levels
+        headers['Content-Encoding'] = 'gzip'
     try:
-        r = requests.request('POST', f'{_JUPYTER_BRIDGE_URL}/queue_request?channel={_CHANNEL}',
-                             headers={'Content-Type': 'application/json'}, json=http_request)
+        r = _bridge_session.request('POST', f'{_JUPYTER_BRIDGE_URL}/queue_request?channel={_CHANNEL}',
+                                    headers=headers, data=body)
         r.raise_for_status()
     except Exception as e:
         raise requests.exceptions.HTTPError(f'Error posting to Jupyter-bridge: {_error_content(e)}')
 
-    # Call Juptyer-bridge to pick up a reply queued by the local browser, which called Cytoscape to execute an operation
-    # and return a reply.
+def _dequeue_bridge_reply():
     try:
         while True:
-            r = requests.request('GET', f'{_JUPYTER_BRIDGE_URL}/dequeue_reply?channel={_CHANNEL}')
+            r = _bridge_session.request('GET', f'{_JUPYTER_BRIDGE_URL}/dequeue_reply?channel={_CHANNEL}')
             if r.status_code != 408: break  # keep waiting for a result as long as we keep getting connection timeouts
         r.raise_for_status()
     except Exception as e:
@@ -127,15 +276,59 @@ def do_request_jupyter_bridge(method, url, **kwargs):
     # TCP packets (i.e., MTU=1500), this forces the headers and JSON payload to *not* be in the TCP [FIN] packet. This
     # seems to work, tacky as it may be. If it fails, we'll see that 'encoding' ends up being None, and the str() will
     # fail.
+    content = r.content
+    try:
+        # JSON is almost always UTF-8, which the parser decodes directly, so trust the declared charset (if any) and
+        # only fall back to guessing the encoding (which is slow for large replies) if that doesn't work
+        charset = re.search(r'charset=([\w-]+)', r.headers.get('Content-Type', ''))
+        if charset and charset.group(1).lower() not in ('utf-8', 'utf8'):
+            return _json_loads(content.decode(charset.group(1)))
+        return _json_loads(content)
+    except:
+        pass
     try:
-        content = r.content
+        import chardet # Needed only for the rare reply that isn't in its declared charset
         encoding = chardet.detect(content)['encoding']
         message = str(content, encoding, errors='replace')
-        cy_reply = json.loads(message)
+        return json.loads(message)
     except:
         content = content or 'None'
         raise requests.exceptions.HTTPError(u'Undeciperable message received from Jupyter-bridge: %s' % (str(content)))
 
+def _json_loads(content):
+    # Parse JSON from str or UTF-8 bytes. orjson rejects the NaN and Infinity values that json accepts, so fall back
+    # to json if it fails.
+    if orjson:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+def _json_dumps(obj):
+    # Serialize to UTF-8 bytes, accepting NumPy values if orjson is available. NaN and Infinity aren't valid JSON, so
+    # both serializers write them as null.
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    try:
+        return json.dumps(obj, allow_nan=False).encode('utf-8')
+    except ValueError:
+        return json.dumps(_null_non_finite(obj), allow_nan=False).encode('utf-8')
+
+def _null_non_finite(obj):
+    # Copy obj with NaN and Infinity replaced by None, as orjson does
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    elif isinstance(obj, dict):
+        return {key: _null_non_finite(value) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_null_non_finite(value) for value in obj]
+    return obj
+
+def _make_bridge_response(url, cy_reply):
     r = SpoofResponse(url, cy_reply['status'], cy_reply['reason'], cy_reply['text'])
     if cy_reply['status'] == 0:
         raise requests.exceptions.HTTPError(u'Could not contact url: %s' % (url), response=r)
@@ -237,8 +430,9 @@ def check_execution_environment(base_url):
 
 
 def get_browser_client_js(debug_bridge=False):
-    global _CHANNEL
+    global _CHANNEL, _bridge_capabilities
     _CHANNEL = uuid.uuid4() # Get a new channel here ... each new browser client works on a fresh channel
+    _bridge_capabilities = None # ... and the new client may support different features than the old one
     try:
         # Prepend channel number of client Javascript so it can communicate with this process via Jupyter-bridge
         r = requests.get(
@@ -35,6 +35,7 @@ PREDEFINED_SANDBOX_NAME = 'default_sandbox'
 _current_sandbox_name = None
 _current_sandbox_path = None # Resolve this by explicitly setting it or when first Cytoscape command is issued
 _sandbox_reinitialize = True
+_sandbox_generation = 0 # Changes whenever the default sandbox is reset or is to be reinitialized
 
 
 _SANDBOX_TEMPLATE = {'sandboxName': None, 'copySamples': True, 'reinitialize': True}
@@ -93,14 +94,20 @@ def set_current_sandbox(sandbox_name, sandbox_path):
 
 def set_sandbox_reinitialize(do_reinitialize=True):
     # Set and return flag indicating that next command should reinitialize the sandbox according to the default_sandbox
-    global _sandbox_reinitialize
+    global _sandbox_reinitialize, _sandbox_generation
     _sandbox_reinitialize = do_reinitialize
+    if do_reinitialize: _sandbox_generation += 1
     return _sandbox_reinitialize
 
 def get_sandbox_reinitialize():
     # Return flag indicating that next command should reinitialize the sandbox according to the default_sandbox
     return _sandbox_reinitialize
 
+def get_sandbox_generation():
+    # Return a number that changes whenever the default sandbox is reset or is to be reinitialized, so that anything
+    # decided using the old default sandbox can be recognized as stale
+    return _sandbox_generation
+
 def get_abs_sandbox_path(file_location):
     sandbox_name, sandbox_path = get_current_sandbox()
     if not sandbox_name:
@@ -112,11 +119,12 @@ def get_abs_sandbox_path(file_location):
 
 def reset_default_sandbox():
     # Reset the entire state of the sandbox system
-    global _default_sandbox, _default_sandbox_path , _sandbox_reinitialize
+    global _default_sandbox, _default_sandbox_path , _sandbox_reinitialize, _sandbox_generation
     _default_sandbox = {}
     _default_sandbox_path = None
     set_current_sandbox(None, None)
     _sandbox_reinitialize = True
+    _sandbox_generation += 1
 
 
 reset_default_sandbox() # Create a clean slate
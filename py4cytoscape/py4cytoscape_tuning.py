@@ -28,6 +28,10 @@ MODEL_PROPAGATION_SECS = int(environ.get('PY4CYTOSCAPE_MODEL_PROPAGATION_SECS',
 CATCHUP_NETWORK_SECS = int(environ.get('PY4CYTOSCAPE_CATCHUP_NETWORK_SECS', '4')) # How long to sleep between network operation retries
 CATCHUP_NETWORK_TIMEOUT_SECS = int(environ.get('PY4CYTOSCAPE_CATCHUP_NETWORK_TIMEOUT_SECS', '60')) # How long to keep retrying network operation
 CATCHUP_NETWORK_MERGE_SECS = int(environ.get('PY4CYTOSCAPE_CATCHUP_NETWORK_MERGE_SECS', '1')) # How long to sleep waiting for merge to complete Network table
+VOCABULARY_CACHE_DIR = environ.get('PY4CYTOSCAPE_VOCABULARY_CACHE_DIR') # Where to keep vocabulary between runs, or None
+VIEW_IMAGE_CACHE_SIZE = int(environ.get('PY4CYTOSCAPE_VIEW_IMAGE_CACHE_SIZE', '32')) # How many view images to keep in memory
+TABLE_CACHE_DIR = environ.get('PY4CYTOSCAPE_TABLE_CACHE_DIR') # Where to keep table columns between runs, or None
+FILE_TRANSPORT_ELEMENT_COUNT = int(environ['PY4CYTOSCAPE_FILE_TRANSPORT_ELEMENT_COUNT']) if environ.get('PY4CYTOSCAPE_FILE_TRANSPORT_ELEMENT_COUNT') else None # How many nodes plus edges make a new network worth sending as a file, or None to never choose files automatically
 
 def set_catchup_filter_secs(delay_secs):
     global CATCHUP_FILTER_SECS
@@ -49,4 +53,18 @@ def set_catchup_network_merge_secs(delay_secs):
     global CATCHUP_NETWORK_MERGE_SECS
     CATCHUP_NETWORK_MERGE_SECS = delay_secs
 
+def set_vocabulary_cache_dir(cache_dir):
+    global VOCABULARY_CACHE_DIR
+    VOCABULARY_CACHE_DIR = cache_dir
 
+def set_view_image_cache_size(image_count):
+    global VIEW_IMAGE_CACHE_SIZE
+    VIEW_IMAGE_CACHE_SIZE = image_count
+
+def set_table_cache_dir(cache_dir):
+    global TABLE_CACHE_DIR
+    TABLE_CACHE_DIR = cache_dir
+
+def set_file_transport_element_count(element_count):
+    global FILE_TRANSPORT_ELEMENT_COUNT
+    FILE_TRANSPORT_ELEMENT_COUNT = element_count
@@ -28,10 +28,12 @@ DEFAULT_BASE_URL = os.environ.get('DEFAULT_BASE_URL') or LOCAL_BASE_URL
 import urllib.parse
 import re
 import sys
+import functools
+import numbers
 from colour import Color
 
-# Internal module imports
-from . import tables
+# Internal module imports ... tables is imported within functions so that modules needing only these utilities
+# (e.g., commands) don't import pandas
 from . import cytoscape_system
 
 # Internal module convenience imports
@@ -117,22 +119,20 @@ def verify_hex_color(color):
         >>> verify_hex_color('red')
         '#FF0000'
     """
-    try:
-        if color.startswith('#') and len(color) == 7:
-            return color
-        else:
-            return Color(color).get_hex_l().upper()
-    except:
-        raise CyError(
-            f'"{color}" is not a valid color name (e.g., "red") or a hexadecimal color (has to begin with # and be 7 characters long, e.g., #FF00FF).',
-            caller=sys._getframe(1).f_code.co_name)
+    hex_color = _normalize_color(color) if isinstance(color, str) else None
+    if hex_color is None:
+        raise CyError(_invalid_color_message(color), caller=sys._getframe(1).f_code.co_name)
+    return hex_color
 
 
 def verify_hex_colors(colors):
     """Validate and provide user feedback when hex color code (or a list of codes) are required input.
 
+    Each distinct color in a list is validated only once, so long lists of a few colors are cheap to verify.
+
     Args:
-        colors (str or list): a single value or a list of colors, which are 6 digit hex values
+        colors (str or list or Series or ndarray): a single value or a list of colors, which are 6 digit hex values
+            or color names
 
     Returns:
         str or list: colors as '#' followed by 6 digit hex value
@@ -147,10 +147,27 @@ def verify_hex_colors(colors):
         ['#053061', '#2166AC', '#4393C3', '#92C5DE', '#D1E5F0', '#F7F7F7', '#FDDBC7', '#F4A582', '#D6604D', '#B2182B', '#67001F']
         >>> verify_hex_colors(['red', 'blue', '#4393C3'])
         ['#FF0000', '#0000FF', '#4393C3']
+        >>> verify_hex_colors(pd.Series(['red', 'red', '#4393C3']))
+        ['#FF0000', '#FF0000', '#4393C3']
     """
     if colors is None: return None
+    colors = _values_as_list(colors)
     if isinstance(colors, list):
-        return [verify_hex_color(c) for c in colors]
+        bad_color = _find_invalid_value(colors, str)
+        if bad_color is not _NO_INVALID_VALUE:
+            raise CyError(_invalid_color_message(bad_color), caller=sys._getframe(1).f_code.co_name)
+
+        # Normalize each distinct color that isn't already hex, and then translate the list only if there were any
+        normalized = {}
+        for color in set(colors):
+            if not (len(color) == 7 and color.startswith('#')):
+                hex_color = _normalize_color(color)
+                if hex_color is None:
+                    raise CyError(_invalid_color_message(color), caller=sys._getframe(1).f_code.co_name)
+                normalized[color] = hex_color
+        if not normalized:
+            return list(colors)
+        return [normalized.get(color, color) for color in colors]
     else:
         return verify_hex_color(colors)
 
@@ -170,7 +187,7 @@ def verify_opacity(opacity, max_opacity=100):
     Examples:
         >>> verify_opacity(77)
     """
-    if not (isinstance(opacity, float) or isinstance(opacity, int)) or opacity < 0 or opacity > max_opacity:
+    if not isinstance(opacity, numbers.Real) or opacity < 0 or opacity > max_opacity:
         raise CyError(f'"{opacity}" is not a valid opacity (has to be an integer between 0 and {max_opacity}).',
                       caller=sys._getframe(1).f_code.co_name)
 
@@ -181,7 +198,8 @@ def verify_opacities(opacities):
     """Validate and provide user feedback when opacity is required input.
 
     Args:
-        opacities (int, float or list): a single value or a list of values, all of which are integers or floats
+        opacities (int, float or list or Series or ndarray): a single value or a list of values, all of which are
+            integers or floats
 
     Returns:
         str or list: verified opacities
@@ -194,8 +212,13 @@ def verify_opacities(opacities):
         >>> verify_opacities([177, 200])
     """
     if opacities is None: return None
+    opacities = _values_as_list(opacities)
     if isinstance(opacities, list):
-        return [verify_opacity(opacity, max_opacity=255) for opacity in opacities]
+        bad_opacity = _find_invalid_value(opacities, numbers.Real, lambda opacity: not (opacity < 0 or opacity > 255))
+        if bad_opacity is not _NO_INVALID_VALUE:
+            raise CyError(f'"{bad_opacity}" is not a valid opacity (has to be an integer between 0 and 255).',
+                          caller=sys._getframe(1).f_code.co_name)
+        return list(opacities)
     else:
         return verify_opacity(opacities, max_opacity=255)
 
@@ -205,7 +228,8 @@ def verify_dimensions(dimension, sizes):
 
     Args:
         dimension (str): name of the sizes being examined (e.g., 'width')
-        sizes (int, float or list): a single value or a list of values, all of which are integers or floats
+        sizes (int, float or list or Series or ndarray): a single value or a list of values, all of which are
+            integers or floats
 
     Returns:
         list: verified dimensions
@@ -218,17 +242,13 @@ def verify_dimensions(dimension, sizes):
         >>> verify_dimensions('width', [10, 20])
     """
 
-    def verify_dimension(dimension, size):
-        if not isinstance(size, float) and not isinstance(size, int):
-            raise CyError(f'Illegal {dimension} "{size}". It needs to be a number.',
-                          caller=sys._getframe(2).f_code.co_name)
-        return size
-
     if sizes is None: return None
-    if isinstance(sizes, list):
-        return [verify_dimension(dimension, size) for size in sizes]
-    else:
-        return verify_dimension(dimension, sizes)
+    sizes = _values_as_list(sizes)
+    bad_size = _find_invalid_value(sizes if isinstance(sizes, list) else [sizes], numbers.Real)
+    if bad_size is not _NO_INVALID_VALUE:
+        raise CyError(f'Illegal {dimension} "{bad_size}". It needs to be a number.',
+                      caller=sys._getframe(1).f_code.co_name)
+    return list(sizes) if isinstance(sizes, list) else sizes
 
 
 def verify_slot(slot):
@@ -415,7 +435,7 @@ def verify_bools(bool_values):
     """Validate list of boolean values
 
     Args:
-         (list or str): boolean values (e.g., True or False)
+         (list or str or Series or ndarray): boolean values (e.g., True or False)
 
     Returns:
         list or str: the style
@@ -432,25 +452,20 @@ def verify_bools(bool_values):
         [True, False]
     """
 
-    def verify_bool(bool_value):
-        if isinstance(bool_value, bool):
-            return bool_value
-        elif isinstance(bool_value, str) and bool_value.upper() in {'TRUE', 'FALSE'}:
-            return bool_value
-        raise CyError(f'"{bool_value}" is not a valid boolean. It must be either true or false.',
-                      caller=sys._getframe(2).f_code.co_name)
-
     if bool_values is None: return None
-    if isinstance(bool_values, list):
-        return [verify_bool(bool_value) for bool_value in bool_values]
-    else:
-        return verify_bool(bool_values)
+    bool_values = _values_as_list(bool_values)
+    bad_bool = _find_invalid_value(bool_values if isinstance(bool_values, list) else [bool_values], (bool, str),
+                                   lambda value: isinstance(value, bool) or value.upper() in {'TRUE', 'FALSE'})
+    if bad_bool is not _NO_INVALID_VALUE:
+        raise CyError(f'"{bad_bool}" is not a valid boolean. It must be either true or false.',
+                      caller=sys._getframe(1).f_code.co_name)
+    return list(bool_values) if isinstance(bool_values, list) else bool_values
 
 def verify_strs(str_values):
     """Validate list of string values
 
     Args:
-         (list or str): string values (e.g., 'happy'
+         (list or str or Series or ndarray): string values (e.g., 'happy'
 
     Returns:
         list or str: the style
@@ -465,17 +480,12 @@ def verify_strs(str_values):
         ['happy', 'sad']
     """
 
-    def verify_str(str_value):
-        if isinstance(str_value, str):
-            return str_value
-        raise CyError(f'"{str_value}" is not a valid string.',
-                      caller=sys._getframe(2).f_code.co_name)
-
     if str_values is None: return None
-    if isinstance(str_values, list):
-        return [verify_str(str_value) for str_value in str_values]
-    else:
-        return verify_str(str_values)
+    str_values = _values_as_list(str_values)
+    bad_str = _find_invalid_value(str_values if isinstance(str_values, list) else [str_values], str)
+    if bad_str is not _NO_INVALID_VALUE:
+        raise CyError(f'"{bad_str}" is not a valid string.', caller=sys._getframe(1).f_code.co_name)
+    return list(str_values) if isinstance(str_values, list) else str_values
 
 def normalize_rotation(degree):
     """Validates and fixes rotation values from -180 to +180 range to match GUI
@@ -587,6 +597,7 @@ def node_suid_to_node_name(node_suids, network=None, base_url=DEFAULT_BASE_URL):
     node_suids = normalize_list(node_suids)
     
     # Fetch the node data from Cytoscape
+    from . import tables
     df = tables.get_table_columns('node', ['name'], 'default', network, base_url=base_url)
     suid_to_name = dict(zip(df.index, df['name']))
     all_names = set(df['name'])
@@ -702,6 +713,7 @@ def edge_suid_to_edge_name(edge_suids, network=None, base_url=DEFAULT_BASE_URL):
     edge_suids = normalize_list(edge_suids)
 
     # Fetch the edge data from Cytoscape
+    from . import tables
     df = tables.get_table_columns('edge', ['name'], 'default', network, base_url=base_url)
     suid_to_name = dict(zip(df.index, df['name']))
     all_names = set(df['name'])
@@ -756,6 +768,7 @@ def table_column_exists(table_column, table, network=None, base_url=DEFAULT_BASE
         >>> table_column_exists('bogus', 'edge', network='myNetwork')
         False
     """
+    from . import tables
     if table_column not in tables.get_table_column_names(table, network=network, base_url=base_url):
         narrate('Column ' + table_column + ' does not exist in the ' + table + ' table.')
         return False
@@ -985,6 +998,7 @@ def _item_to_suid(item_names, table_name, network=None, base_url=DEFAULT_BASE_UR
     item_names = normalize_list(item_names)
 
     # Get a table of column names indexed by SUID and a set containing all of the SUIDs
+    from . import tables
     df = tables.get_table_columns(table_name, ['name'], 'default', network, base_url=base_url)
     all_suids = set(df.index)
 
@@ -1022,3 +1036,40 @@ def _item_to_suid(item_names, table_name, network=None, base_url=DEFAULT_BASE_UR
 
     return suid_list
 
+
+
+_NO_INVALID_VALUE = object()
+
+def _values_as_list(values):
+    # Return a pandas Series or NumPy array as a list of Python values, and anything else as is
+    return values.tolist() if hasattr(values, 'tolist') else values
+
+
+def _find_invalid_value(values, valid_types, is_valid=None):
+    # Return the first value in a list that isn't of a valid type or (if given) isn't accepted by is_valid, or
+    # _NO_INVALID_VALUE if all are good. Types are checked first and is_valid is called only once for each distinct
+    # value, as checking every value of a long list of repeated values is too slow.
+    invalid_types = {value_type for value_type in set(map(type, values)) if not issubclass(value_type, valid_types)}
+    if invalid_types:
+        return next(value for value in values if type(value) in invalid_types)
+    if is_valid is not None:
+        for value in set(values):
+            if not is_valid(value):
+                return value
+    return _NO_INVALID_VALUE
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_color(color):
+    # Return a color name or hex value as '#' followed by 6 hex digits, or None if it isn't a color. Looking up a color
+    # name is slow, and the same few colors tend to be used over and over, so results are remembered.
+    if color.startswith('#') and len(color) == 7:
+        return color
+    try:
+        return Color(color).get_hex_l().upper()
+    except:
+        return None
+
+
+def _invalid_color_message(color):
+    return f'"{color}" is not a valid color name (e.g., "red") or a hexadecimal color (has to begin with # and be 7 characters long, e.g., #FF00FF).'
@@ -54,6 +54,7 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 
 # External library imports
 import base64
+import json
 import os
 import time
 
@@ -66,6 +67,9 @@ from .py4cytoscape_sandbox import *
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
 
+# Files are moved to and from Cytoscape in blocks of this size so that a transfer needs a constant amount of memory
+# regardless of file size. It must be a multiple of 3 so that each block base64-encodes independently.
+_TRANSFER_BLOCK_BYTES = 3 * 1024 * 1024
 
 @cy_log
 def sandbox_set(sandbox_name, copy_samples=True, reinitialize=True, base_url=DEFAULT_BASE_URL):
@@ -167,7 +171,7 @@ def sandbox_remove(sandbox_name=None, base_url=DEFAULT_BASE_URL):
     default_sandbox_name = get_default_sandbox()['sandboxName']
     current_sandbox_before_remove = get_current_sandbox_name()
 
-    res = _sandbox_op(f'filetransfer removeSandbox', sandbox_name, base_url=base_url)
+    res = _sandbox_op('removeSandbox', sandbox_name, base_url=base_url)
     if sandbox_name is None or sandbox_name == current_sandbox_before_remove:
         set_current_sandbox(default_sandbox_name, get_default_sandbox_path()) # There is no more current sandbox ... wipe out name of sandbox
         sandbox_name = current_sandbox_before_remove
@@ -219,7 +223,7 @@ def sandbox_get_file_info(file_name, sandbox_name=None, base_url=DEFAULT_BASE_UR
         `Sandboxing <https://py4cytoscape.readthedocs.io/en/latest/concepts.html#sandboxing>`_ in the Concepts section in the py4cytoscape User Manual.
     """
     try:
-        return _sandbox_op(f'filetransfer getFileInfo', sandbox_name, file_name=file_name, base_url=base_url)
+        return _sandbox_op('getFileInfo', sandbox_name, file_name=file_name, base_url=base_url)
     except Exception as e:
         # This is a nasty case ... there isn't much way for getFileInfo to fail as long as the FileTransfer app
         # is installed. We'll assume failure means it isn't installed. And if that's so, it must mean that we're
@@ -278,16 +282,27 @@ def sandbox_send_to(source_file, dest_file=None, overwrite=True, sandbox_name =
         `Sandboxing <https://py4cytoscape.readthedocs.io/en/latest/concepts.html#sandboxing>`_ in the Concepts section in the py4cytoscape User Manual.
     """
     try:
+        file_byte_count = os.path.getsize(source_file)
         with open(source_file, mode='rb') as file:
-            file_content = file.read()
-        file_content64 = base64.b64encode(file_content).decode('utf-8')
+            pass
     except Exception as e:
         raise CyError(f'Could not read file "{source_file}": {e}')
 
     if not dest_file or not dest_file.strip():
         head, dest_file = os.path.split(source_file)
 
-    return _sandbox_op(f'filetransfer toSandbox fileByteCount={len(file_content)} overwrite={overwrite} fileBase64="{file_content64}"', sandbox_name, file_name=dest_file, base_url=base_url)
+    if commands._is_jupyter_bridge(base_url):
+        # Jupyter-Bridge needs the whole request in a single message, so the file can't be streamed
+        with open(source_file, mode='rb') as file:
+            file_content64 = base64.b64encode(file.read()).decode('utf-8')
+        return _sandbox_op('toSandbox', sandbox_name, file_name=dest_file, base_url=base_url,
+                           fileByteCount=file_byte_count, overwrite=overwrite, fileBase64=file_content64)
+
+    # Stream the file into the command's body, so it never has to be in memory all at once
+    params = _sandbox_params(sandbox_name, dest_file, base_url=base_url)
+    params.update({'fileByteCount': str(file_byte_count), 'overwrite': str(overwrite)})
+    return commands._do_commands_post(f'{base_url}/commands/filetransfer/toSandbox', base_url=base_url,
+                                      data=_Base64FileBody(source_file, file_byte_count, params))
 
 @cy_log
 def sandbox_url_to(source_url, dest_file, overwrite=True, sandbox_name = None, base_url=DEFAULT_BASE_URL):
@@ -350,7 +365,8 @@ def sandbox_url_to(source_url, dest_file, overwrite=True, sandbox_name = None, b
     if not dest_file:
         raise CyError(f'Destination file cannot be null')
 
-    return _sandbox_op(f'filetransfer urlToSandbox overwrite={overwrite} sourceURL={source_url}', sandbox_name, file_name=dest_file, base_url=base_url)
+    return _sandbox_op('urlToSandbox', sandbox_name, file_name=dest_file, base_url=base_url,
+                       overwrite=overwrite, sourceURL=source_url)
 
 @cy_log
 def sandbox_get_from(source_file, dest_file=None, overwrite=True, sandbox_name = None, base_url=DEFAULT_BASE_URL):
@@ -394,17 +410,24 @@ def sandbox_get_from(source_file, dest_file=None, overwrite=True, sandbox_name =
     if not overwrite and os.path.exists(dest_file):
         raise CyError(f'File "{dest_file}" already exists')
 
-    res = _sandbox_op(f'filetransfer fromSandbox', sandbox_name, file_name=source_file, base_url=base_url)
+    if commands._is_jupyter_bridge(base_url):
+        # Jupyter-Bridge returns the whole reply in a single message, so the file can't be streamed
+        res = _sandbox_op('fromSandbox', sandbox_name, file_name=source_file, base_url=base_url)
 
-    file_content = base64.b64decode(res['fileBase64'], validate=True)
-    try:
-        with open(dest_file, mode='wb') as file:
-            file.write(file_content)
-    except Exception as e:
-        raise CyError(f'Could not write to file "{dest_file}": {e}')
+        file_content = base64.b64decode(res['fileBase64'], validate=True)
+        try:
+            with open(dest_file, mode='wb') as file:
+                file.write(file_content)
+        except Exception as e:
+            raise CyError(f'Could not write to file "{dest_file}": {e}')
 
-    del res['fileBase64']
-    return res
+        del res['fileBase64']
+        return res
+
+    # Stream the file out of the command's reply, so it never has to be in memory all at once
+    params = _sandbox_params(sandbox_name, source_file, base_url=base_url)
+    r = commands._do_commands_post_stream(f'{base_url}/commands/filetransfer/fromSandbox', base_url=base_url, json=params)
+    return _write_streamed_file(r, dest_file)
 
 @cy_log
 def sandbox_remove_file(file_name, sandbox_name=None, base_url=DEFAULT_BASE_URL):
@@ -439,9 +462,17 @@ def sandbox_remove_file(file_name, sandbox_name=None, base_url=DEFAULT_BASE_URL)
     See Also:
         `Sandboxing <https://py4cytoscape.readthedocs.io/en/latest/concepts.html#sandboxing>`_ in the Concepts section in the py4cytoscape User Manual.
     """
-    return _sandbox_op(f'filetransfer removeFile', sandbox_name, file_name=file_name, base_url=base_url)
+    return _sandbox_op('removeFile', sandbox_name, file_name=file_name, base_url=base_url)
+
+def _sandbox_op(verb, sandbox_name, file_name=None, base_url=DEFAULT_BASE_URL, **args):
+    # Execute a filetransfer command ... arguments are passed as values so file names and URLs needn't be quoted
+    args.update(_sandbox_params(sandbox_name, file_name, base_url=base_url))
+    res = commands.commands_post_args('filetransfer', verb, base_url=base_url, **args)
+    return res
 
-def _sandbox_op(command, sandbox_name, file_name=None, base_url=DEFAULT_BASE_URL):
+def _sandbox_params(sandbox_name, file_name=None, base_url=DEFAULT_BASE_URL):
+    # Return the sandboxName and fileName parameters for a filetransfer command
+    params = {}
     if file_name: file_name = file_name.strip()
     if sandbox_name:
         sandbox_name = sandbox_name.strip()
@@ -470,7 +501,7 @@ def _sandbox_op(command, sandbox_name, file_name=None, base_url=DEFAULT_BASE_URL
         # works well when file_name is a relative name. If it's absolute, it'll be appended to the
         # sandbox directory name, which will create something unintelligible that will be trapped
         # by the FileTransfer app.
-        command += f' sandboxName="{sandbox_name}"'
+        params['sandboxName'] = sandbox_name
     elif file_name:
         # Running locally with no sandbox defined ... essentially passing through to the whole workstation
         # file system. If the caller supplies an absolute path, use it ... otherwise, make it relative to
@@ -479,7 +510,76 @@ def _sandbox_op(command, sandbox_name, file_name=None, base_url=DEFAULT_BASE_URL
             pass
         else:
             file_name = os.path.join(sandbox_path, file_name)
-    if file_name: command += f' fileName="{file_name}"'
-
-    res = commands.commands_post(command, base_url=base_url)
-    return res
+    if file_name: params['fileName'] = file_name
+
+    return params
+
+class _Base64FileBody:
+    # A filetransfer toSandbox JSON body whose fileBase64 value is read from a file and encoded a block at a time as
+    # the body is sent. Iterating starts over from the beginning of the file, so a failed request can be retried.
+
+    def __init__(self, file_name, file_byte_count, params):
+        self.file_name = file_name
+        self.prefix = (json.dumps(params)[:-1] + ', "fileBase64": "').encode('utf-8')
+        self.suffix = b'"}'
+        self.length = len(self.prefix) + 4 * ((file_byte_count + 2) // 3) + len(self.suffix)
+
+    def __len__(self):
+        return self.length # Lets requests send a Content-Length instead of using chunked encoding
+
+    def __iter__(self):
+        yield self.prefix
+        with open(self.file_name, mode='rb') as file:
+            for block in iter(lambda: file.read(_TRANSFER_BLOCK_BYTES), b''):
+                yield base64.b64encode(block)
+        yield self.suffix
+
+def _write_streamed_file(r, dest_file):
+    # Decode the fileBase64 value of a streamed filetransfer fromSandbox reply into dest_file a block at a time, and
+    # return the rest of the reply's data. The file is written under a temporary name and renamed only after all of it
+    # has arrived and been checked, so an interrupted transfer never leaves a truncated dest_file behind.
+    marker = b'"fileBase64"'
+    reply = bytearray() # everything in the reply except the fileBase64 value
+    undecoded = b'' # base64 characters left over because they weren't a multiple of 4
+    in_value = found_value = False
+    byte_count = 0
+    part_file = dest_file + '.part'
+    try:
+        try:
+            file = open(part_file, mode='wb')
+        except Exception as e:
+            raise CyError(f'Could not write to file "{dest_file}": {e}')
+        with file:
+            for chunk in r.iter_content(chunk_size=_TRANSFER_BLOCK_BYTES):
+                if not in_value:
+                    reply += chunk
+                    if found_value: continue
+                    marker_pos = reply.find(marker)
+                    value_pos = reply.find(b'"', marker_pos + len(marker)) if marker_pos >= 0 else -1
+                    if value_pos < 0: continue
+                    chunk = bytes(reply[value_pos + 1:])
+                    del reply[value_pos + 1:]
+                    in_value = found_value = True
+                end_pos = chunk.find(b'"')
+                undecoded += (chunk if end_pos < 0 else chunk[:end_pos]).replace(b'\\', b'') # JSON may escape '/'
+                decodable = len(undecoded) - len(undecoded) % 4
+                file_content = base64.b64decode(undecoded[:decodable], validate=True)
+                file.write(file_content)
+                byte_count += len(file_content)
+                undecoded = undecoded[decodable:]
+                if end_pos >= 0:
+                    reply += chunk[end_pos:]
+                    in_value = False
+
+        res = json.loads(reply)
+        if len(res['errors']):
+            raise CyError(str(res['errors'][0]), caller='sandbox_get_from')
+        res = res['data']
+        if in_value or undecoded or byte_count != res.get('fileByteCount', byte_count):
+            raise CyError(f'Transfer of "{dest_file}" was incomplete: received {byte_count} bytes', caller='sandbox_get_from')
+        del res['fileBase64']
+        os.replace(part_file, dest_file)
+        return res
+    finally:
+        r.close()
+        if os.path.exists(part_file): os.remove(part_file)
@@ -29,6 +29,8 @@ from . import sandbox
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
 from .py4cytoscape_sandbox import get_abs_sandbox_path
+from .py4cytoscape_cache import clear_collection_names, set_table_cache_session
+from . import py4cytoscape_tuning
 
 
 def __init__(self):
@@ -67,7 +69,9 @@ def close_session(save_before_closing, filename=None, base_url=DEFAULT_BASE_URL)
     """
     if save_before_closing: save_session(filename, base_url=base_url)
 
-    return commands.commands_post('session new', base_url=base_url)
+    res = commands.commands_post('session new', base_url=base_url)
+    clear_collection_names(base_url)
+    return res
 
 
 @cy_log
@@ -115,7 +119,10 @@ def open_session(file_location=None, base_url=DEFAULT_BASE_URL):
             file_location = 'sampleData/sessions/Yeast Perturbation.cys' # relative to Cytoscape install directory
 
     narrate(f'Opening {file_location}...')
-    return commands.commands_post(f'session open {type}="{file_location}"', base_url=base_url)
+    res = commands.commands_post(f'session open {type}="{file_location}"', base_url=base_url)
+    clear_collection_names(base_url)
+    _start_table_cache(base_url)
+    return res
 
 
 @cy_log
@@ -156,7 +163,7 @@ def save_session(filename=None, base_url=DEFAULT_BASE_URL, *, overwrite_file=Tru
         filename = commands.cyrest_get('session/name', base_url=base_url)
         if filename == '':
             raise CyError('Save failed. Provide a filename the first time you save a session.')
-        return commands.commands_post('session save', base_url=base_url)
+        res = commands.commands_post('session save', base_url=base_url)
     else:
         # TODO: R uses '.cys$' here, but shouldn't the '.' be escaped??
         if re.search('.cys$', filename) is None: filename += '.cys'
@@ -168,4 +175,13 @@ def save_session(filename=None, base_url=DEFAULT_BASE_URL, *, overwrite_file=Tru
             else:
                 raise CyError(f'File "{filename}" already exists ... session not saved.')
 
-        return commands.commands_post(f'session save as file="{get_abs_sandbox_path(filename)}"', base_url=base_url)
+        res = commands.commands_post(f'session save as file="{get_abs_sandbox_path(filename)}"', base_url=base_url)
+    _start_table_cache(base_url)
+    return res
+
+
+def _start_table_cache(base_url):
+    # The session's tables now match its file, so node and edge columns can be kept in the table cache (if one is set)
+    if py4cytoscape_tuning.TABLE_CACHE_DIR:
+        session_res = commands.cyrest_get('session/name', base_url=base_url)
+        set_table_cache_session(base_url, session_res.get('name') if isinstance(session_res, dict) else session_res)
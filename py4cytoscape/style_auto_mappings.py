@@ -35,6 +35,7 @@ import colorbrewer
 # Internal module imports
 from . import styles
 from . import tables
+from . import networks
 #from . import colorbrewer
 
 # Internal module convenience imports
@@ -65,6 +66,13 @@ def _scheme(scheme_type):
         return scheme_def
     return decorator_scheme
 
+# Decorator that turns a breakpoint lambda into a triple (breakpoint function name, 'breakpoints', lambda)
+def _breakpoints(func):
+    @functools.wraps(func)
+    def breakpoints_def(*args, **kwargs):
+        return (func.__name__, 'breakpoints', func(*args, **kwargs))
+    return breakpoints_def
+
 
 @_palette('qualitative')
 def palette_color_random():
@@ -737,10 +745,74 @@ def scheme_c_number_continuous(start_value=10, end_value=30):
     Returns:
         lambda: generates a descriptor for a continuous mapping
 
+    Note:
+        By default, a continuous mapping has three points (the minimum, midpoint and maximum of the data). If a
+        ``breakpoints`` descriptor calls for more points, the numbers are spaced evenly from ``start_value`` to
+        ``end_value``.
+
     See Also:
         :meth:`gen_node_height_map`, :meth:`gen_node_opacity_map`, :meth:`gen_node_size_map`, :meth:`gen_node_width_map`, :meth:`gen_edge_opacity_map`, :meth:`gen_edge_size_map`, :meth:`gen_edge_width_map`
     """
-    return lambda min_data, max_data: [start_value, start_value + (end_value - start_value) / 2, end_value]
+    return lambda min_data, max_data, value_count=3: \
+        [start_value] + [start_value + (end_value - start_value) * i / (value_count - 1)    for i in range(1, value_count - 1)] + [end_value]
+
+# ==============================================================================
+# II.b Breakpoints for continuous mapping generators
+# ------------------------------------------------------------------------------
+
+@_breakpoints
+def breakpoints_c_range(count=3):
+    """Place continuous mapping points evenly between the smallest and largest data values
+
+    This is equivalent to dividing the data range into ``count - 1`` histogram bins of equal width.
+
+    Args:
+        count (int): Number of mapping points, including the smallest and largest values
+
+    Returns:
+        lambda: generates the mapping points for an array of data values
+
+    See Also:
+        :meth:`breakpoints_c_quantile`, :meth:`breakpoints_c_rank`, :meth:`gen_node_color_map`, :meth:`gen_node_size_map`
+    """
+    return lambda values: np.linspace(values.min(), values.max(), count)
+
+@_breakpoints
+def breakpoints_c_quantile(quantiles=(0, 0.25, 0.5, 0.75, 1)):
+    """Place continuous mapping points at quantiles of the data values
+
+    Quantiles follow the distribution of the data, so skewed data (e.g., p-values or betweenness) gets mapping points
+    where most of its values are instead of where a few outliers are. Quantiles that fall on the same data value are
+    merged into a single point.
+
+    Args:
+        quantiles (list or tuple): Increasing fractions between 0 and 1 (inclusive) of the data to place points at
+
+    Returns:
+        lambda: generates the mapping points for an array of data values
+
+    See Also:
+        :meth:`breakpoints_c_range`, :meth:`breakpoints_c_rank`, :meth:`gen_node_color_map`, :meth:`gen_node_size_map`
+    """
+    return lambda values: np.quantile(values, quantiles)
+
+@_breakpoints
+def breakpoints_c_rank(count=5):
+    """Place continuous mapping points at evenly spaced ranks of the distinct data values
+
+    Unlike quantiles, ranks count each distinct value once, so a value shared by many rows (e.g., a degree of 1)
+    doesn't absorb several mapping points.
+
+    Args:
+        count (int): Number of mapping points, including the smallest and largest values
+
+    Returns:
+        lambda: generates the mapping points for an array of data values
+
+    See Also:
+        :meth:`breakpoints_c_range`, :meth:`breakpoints_c_quantile`, :meth:`gen_node_color_map`, :meth:`gen_node_size_map`
+    """
+    return lambda values: _rank_breakpoints(values, count)
 
 # ==============================================================================
 # III.a Mapping generators for colors
@@ -754,7 +826,9 @@ def gen_node_color_map(table_column,
                        default_color=None,
                        style_name=None,
                        network=None,
-                       base_url=DEFAULT_BASE_URL):
+                       base_url=DEFAULT_BASE_URL,
+                       *,
+                       breakpoints=None):
     """Generate color map parameters for discrete or continuous values in a node table
 
     A basic palette is a tuple containing the palette function name, palette type, and a lambda resolving
@@ -778,6 +852,8 @@ def gen_node_color_map(table_column,
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        breakpoints (tuple): For continuous mappings, descriptor for a function that chooses the data values to
+            map from (e.g., ``breakpoints_c_quantile()``); default is the minimum, midpoint and maximum
 
     Returns:
         dict: Collection of parameter values suitable for passing to a color style_mappings setter function
@@ -800,7 +876,7 @@ def gen_node_color_map(table_column,
     See Also:
         `Value Generators <https://py4cytoscape.readthedocs.io/en/0.0.9/concepts.html#value-generators>`_ in the Concepts section in the py4cytoscape User Manual.
     """
-    return _gen_color_map('node', table_column, palette, mapping_type, default_color, style_name, network, base_url)
+    return _gen_color_map('node', table_column, palette, mapping_type, default_color, style_name, network, base_url, breakpoints)
 
 @cy_log
 def gen_edge_color_map(table_column,
@@ -810,7 +886,9 @@ def gen_edge_color_map(table_column,
                        default_color=None,
                        style_name=None,
                        network=None,
-                       base_url=DEFAULT_BASE_URL):
+                       base_url=DEFAULT_BASE_URL,
+                       *,
+                       breakpoints=None):
     """Generate color map parameters for discrete or continuous values in an edge table
 
     A basic palette is a tuple containing the palette function name, palette type, and a lambda resolving
@@ -834,6 +912,8 @@ def gen_edge_color_map(table_column,
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        breakpoints (tuple): For continuous mappings, descriptor for a function that chooses the data values to
+            map from (e.g., ``breakpoints_c_quantile()``); default is the minimum, midpoint and maximum
 
     Returns:
         dict: Collection of parameter values suitable for passing to a color style_mappings setter function
@@ -860,7 +940,7 @@ def gen_edge_color_map(table_column,
     See Also:
         `Value Generators <https://py4cytoscape.readthedocs.io/en/0.0.9/concepts.html#value-generators>`_ in the Concepts section in the py4cytoscape User Manual.
     """
-    return _gen_color_map('edge', table_column, palette, mapping_type, default_color, style_name, network, base_url)
+    return _gen_color_map('edge', table_column, palette, mapping_type, default_color, style_name, network, base_url, breakpoints)
 
 # ==============================================================================
 # III.b Mapping generators for opacities
@@ -874,7 +954,9 @@ def gen_node_opacity_map(table_column,
                          default_number=None,
                          style_name=None,
                          network=None,
-                         base_url=DEFAULT_BASE_URL):
+                         base_url=DEFAULT_BASE_URL,
+                         *,
+                         breakpoints=None):
     """Generate opacity map parameters for discrete or continuous values in a node table
 
     A basic scheme is a tuple containing the scheme function name, scheme type, and a lambda resolving to a function
@@ -895,6 +977,8 @@ def gen_node_opacity_map(table_column,
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        breakpoints (tuple): For continuous mappings, descriptor for a function that chooses the data values to
+            map from (e.g., ``breakpoints_c_quantile()``); default is the minimum, midpoint and maximum
 
     Returns:
         dict: Collection of parameter values suitable for passing to a opacity style_mappings setter function
@@ -919,7 +1003,7 @@ def gen_node_opacity_map(table_column,
     See Also:
         `Value Generators <https://py4cytoscape.readthedocs.io/en/0.0.9/concepts.html#value-generators>`_ in the Concepts section in the py4cytoscape User Manual.
     """
-    return _gen_map('node', table_column, number_scheme, mapping_type, 'opacities', 'default_opacity', default_number, style_name, network, base_url)
+    return _gen_map('node', table_column, number_scheme, mapping_type, 'opacities', 'default_opacity', default_number, style_name, network, base_url, breakpoints)
 
 @cy_log
 def gen_edge_opacity_map(table_column,
@@ -929,7 +1013,9 @@ def gen_edge_opacity_map(table_column,
                          default_number=None,
                          style_name=None,
                          network=None,
-                         base_url=DEFAULT_BASE_URL):
+                         base_url=DEFAULT_BASE_URL,
+                         *,
+                         breakpoints=None):
     """Generate opacity map parameters for discrete or continuous values in an edge table
 
     A basic scheme is a tuple containing the scheme function name, scheme type, and a lambda resolving to a function
@@ -949,6 +1035,8 @@ def gen_edge_opacity_map(table_column,
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        breakpoints (tuple): For continuous mappings, descriptor for a function that chooses the data values to
+            map from (e.g., ``breakpoints_c_quantile()``); default is the minimum, midpoint and maximum
 
     Returns:
         dict: Collection of parameter values suitable for passing to a opacity style_mappings setter function
@@ -973,7 +1061,7 @@ def gen_edge_opacity_map(table_column,
     See Also:
         `Value Generators <https://py4cytoscape.readthedocs.io/en/0.0.9/concepts.html#value-generators>`_ in the Concepts section in the py4cytoscape User Manual.
     """
-    return _gen_map('edge', table_column, number_scheme, mapping_type, 'opacities', 'default_opacity', default_number, style_name, network, base_url)
+    return _gen_map('edge', table_column, number_scheme, mapping_type, 'opacities', 'default_opacity', default_number, style_name, network, base_url, breakpoints)
 
 # ==============================================================================
 # III.c Mapping generators for widths
@@ -987,7 +1075,9 @@ def gen_node_width_map(table_column,
                        default_number=None,
                        style_name=None,
                        network=None,
-                       base_url=DEFAULT_BASE_URL):
+                       base_url=DEFAULT_BASE_URL,
+                       *,
+                       breakpoints=None):
     """Generate width map parameters for discrete or continuous values in a node table
 
     A basic scheme is a tuple containing the scheme function name, scheme type, and a lambda resolving to a function
@@ -1007,6 +1097,8 @@ def gen_node_width_map(table_column,
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        breakpoints (tuple): For continuous mappings, descriptor for a function that chooses the data values to
+            map from (e.g., ``breakpoints_c_quantile()``); default is the minimum, midpoint and maximum
 
     Returns:
         dict: Collection of parameter values suitable for passing to a width style_mappings setter function
@@ -1031,7 +1123,7 @@ def gen_node_width_map(table_column,
     See Also:
         `Value Generators <https://py4cytoscape.readthedocs.io/en/0.0.9/concepts.html#value-generators>`_ in the Concepts section in the py4cytoscape User Manual.
     """
-    return _gen_map('node', table_column, number_scheme, mapping_type, 'widths', 'default_width', default_number, style_name, network, base_url)
+    return _gen_map('node', table_column, number_scheme, mapping_type, 'widths', 'default_width', default_number, style_name, network, base_url, breakpoints)
 
 @cy_log
 def gen_edge_width_map(table_column,
@@ -1041,7 +1133,9 @@ def gen_edge_width_map(table_column,
                        default_number=None,
                        style_name=None,
                        network=None,
-                       base_url=DEFAULT_BASE_URL):
+                       base_url=DEFAULT_BASE_URL,
+                       *,
+                       breakpoints=None):
     """Generate width map parameters for discrete or continuous values in an edge table
 
     A basic scheme is a tuple containing the scheme function name, scheme type, and a lambda resolving to a function
@@ -1062,6 +1156,8 @@ def gen_edge_width_map(table_column,
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        breakpoints (tuple): For continuous mappings, descriptor for a function that chooses the data values to
+            map from (e.g., ``breakpoints_c_quantile()``); default is the minimum, midpoint and maximum
 
     Returns:
         dict: Collection of parameter values suitable for passing to a width style_mappings setter function
@@ -1086,7 +1182,7 @@ def gen_edge_width_map(table_column,
     See Also:
         `Value Generators <https://py4cytoscape.readthedocs.io/en/0.0.9/concepts.html#value-generators>`_ in the Concepts section in the py4cytoscape User Manual.
     """
-    return _gen_map('edge', table_column, number_scheme, mapping_type, 'widths', 'default_width', default_number, style_name, network, base_url)
+    return _gen_map('edge', table_column, number_scheme, mapping_type, 'widths', 'default_width', default_number, style_name, network, base_url, breakpoints)
 
 # ==============================================================================
 # III.d Mapping generators for heights
@@ -1100,7 +1196,9 @@ def gen_node_height_map(table_column,
                         default_number=None,
                         style_name=None,
                         network=None,
-                        base_url=DEFAULT_BASE_URL):
+                        base_url=DEFAULT_BASE_URL,
+                        *,
+                        breakpoints=None):
     """Generate height map parameters for discrete or continuous values in a node table
 
     A basic scheme is a tuple containing the scheme function name, scheme type, and a lambda resolving to a function
@@ -1121,6 +1219,8 @@ def gen_node_height_map(table_column,
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        breakpoints (tuple): For continuous mappings, descriptor for a function that chooses the data values to
+            map from (e.g., ``breakpoints_c_quantile()``); default is the minimum, midpoint and maximum
 
     Returns:
         dict: Collection of parameter values suitable for passing to a height style_mappings setter function
@@ -1145,7 +1245,7 @@ def gen_node_height_map(table_column,
     See Also:
         `Value Generators <https://py4cytoscape.readthedocs.io/en/0.0.9/concepts.html#value-generators>`_ in the Concepts section in the py4cytoscape User Manual.
     """
-    return _gen_map('node', table_column, number_scheme, mapping_type, 'heights', 'default_height', default_number, style_name, network, base_url)
+    return _gen_map('node', table_column, number_scheme, mapping_type, 'heights', 'default_height', default_number, style_name, network, base_url, breakpoints)
 
 # ==============================================================================
 # III.e Mapping generators for sizes
@@ -1159,7 +1259,9 @@ def gen_node_size_map(table_column,
                       default_number=None,
                       style_name=None,
                       network=None,
-                      base_url=DEFAULT_BASE_URL):
+                      base_url=DEFAULT_BASE_URL,
+                      *,
+                      breakpoints=None):
     """Generate size map parameters for discrete or continuous values in a node table
 
     A basic scheme is a tuple containing the scheme function name, scheme type, and a lambda resolving to a function
@@ -1180,6 +1282,8 @@ def gen_node_size_map(table_column,
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        breakpoints (tuple): For continuous mappings, descriptor for a function that chooses the data values to
+            map from (e.g., ``breakpoints_c_quantile()``); default is the minimum, midpoint and maximum
 
     Returns:
         dict: Collection of parameter values suitable for passing to a size style_mappings setter function
@@ -1204,7 +1308,7 @@ def gen_node_size_map(table_column,
     See Also:
         `Value Generators <https://py4cytoscape.readthedocs.io/en/0.0.9/concepts.html#value-generators>`_ in the Concepts section in the py4cytoscape User Manual.
     """
-    return _gen_map('node', table_column, number_scheme, mapping_type, 'sizes', 'default_size', default_number, style_name, network, base_url)
+    return _gen_map('node', table_column, number_scheme, mapping_type, 'sizes', 'default_size', default_number, style_name, network, base_url, breakpoints)
 
 @cy_log
 def gen_edge_size_map(table_column,
@@ -1214,7 +1318,9 @@ def gen_edge_size_map(table_column,
                       default_number=None,
                       style_name=None,
                       network=None,
-                      base_url=DEFAULT_BASE_URL):
+                      base_url=DEFAULT_BASE_URL,
+                      *,
+                      breakpoints=None):
     """Generate size map parameters for discrete or continuous values in an edge table
 
     A basic scheme is a tuple containing the scheme function name, scheme type, and a lambda resolving to a function
@@ -1234,6 +1340,8 @@ def gen_edge_size_map(table_column,
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        breakpoints (tuple): For continuous mappings, descriptor for a function that chooses the data values to
+            map from (e.g., ``breakpoints_c_quantile()``); default is the minimum, midpoint and maximum
 
     Returns:
         dict: Collection of parameter values suitable for passing to a size style_mappings setter function
@@ -1258,7 +1366,7 @@ def gen_edge_size_map(table_column,
     See Also:
         `Value Generators <https://py4cytoscape.readthedocs.io/en/0.0.9/concepts.html#value-generators>`_ in the Concepts section in the py4cytoscape User Manual.
     """
-    return _gen_map('edge', table_column, number_scheme, mapping_type, 'sizes', 'default_size', default_number, style_name, network, base_url)
+    return _gen_map('edge', table_column, number_scheme, mapping_type, 'sizes', 'default_size', default_number, style_name, network, base_url, breakpoints)
 
 # ==============================================================================
 # III.f Mapping generators for shapes
@@ -1393,7 +1501,7 @@ def _palette_color_brewer(value_count, palette, reverse):
         # closest colors in proportion to their proximity.
         #
         # Get the longest palette and the fixed distance, then initialize the interpolated palette
-        max_palette = palette[longest_palette]
+        max_palette = list(palette[longest_palette]) # copy, so reversing doesn't change the palette itself
         if reverse: max_palette.reverse()
         per_color_increment = float(len(max_palette) - 1) / (value_count - 1)
         candidate_palette = list(' ' * value_count)
@@ -1434,7 +1542,8 @@ def _gen_color_map(table,
                    default_value,
                    style_name,
                    network,
-                   base_url):
+                   base_url,
+                   breakpoints=None):
 
     mapping_type = normalize_mapping(mapping_type, 'color palette', ['d', 'c'], long_name=False)
 
@@ -1447,7 +1556,7 @@ def _gen_color_map(table,
     if mapping_type == 'd':
         return _gen_d_color_map(table, table_column, palette, default_value, style_name, network, base_url)
     else:
-        return _gen_c_color_map(table, table_column, palette, default_value, style_name, network, base_url)
+        return _gen_c_color_map(table, table_column, palette, default_value, style_name, network, base_url, breakpoints)
 
 
 # Find the unique values in a column, map them to a desired target set, and return a dictionary of parameter values
@@ -1477,37 +1586,34 @@ def _gen_c_color_map(table,
                      default_value,
                      style_name,
                      network,
-                     base_url):
+                     base_url,
+                     breakpoints=None):
 
     # Find out all of the values in the named column
-    df_values = tables.get_table_columns(table=table, columns=table_column, network=network, base_url=base_url)
+    values = _numeric_column_values(table, table_column, network, base_url)
 
     # Start out with using preferred palette (for continuous, there could be a one-tailed or two-tailed scheme)
     palette_to_use = palette[0] if type(palette[0]) is tuple else palette
 
     # For continuous, one tailed means all negative or all positive ... otherwise two-tailed with 0 in between
-    max_data = df_values[table_column].max() if table_column in df_values else np.nan
-    min_data = df_values[table_column].min() if table_column in df_values else np.nan
-    if type(max_data) in [int, float, np.int64, np.float64]:
-        if np.isnan(max_data):
-            min_data = 0
-            max_data = 1
-        if np.sign(min_data) == np.sign(max_data):
-            # One-tailed mapping ... btw: prefer sequential palette if color mapping
-            mid_data = min_data + (max_data - min_data) / 2
-            src_values = [float(min_data), float(mid_data), float(max_data)]
-            best_palette = 'sequential'
-            map_type = 'one-tailed'
-        else:
-            # Two-tailed mapping ... btw: prefer divergent palette if color mapping
-            max_max_data = float(max(abs(min_data), abs(max_data)))
-            src_values = [-max_max_data, 0.0, max_max_data]
-            if type(palette[0]) is tuple and len(palette) >= 2:
-                palette_to_use = palette[1]
-            best_palette = 'divergent'
-            map_type = 'two-tailed'
+    min_data, max_data = (values.min(), values.max()) if len(values) else (0.0, 1.0)
+    if np.sign(min_data) == np.sign(max_data):
+        # One-tailed mapping ... btw: prefer sequential palette if color mapping
+        mid_data = min_data + (max_data - min_data) / 2
+        src_values = [float(min_data), float(mid_data), float(max_data)]
+        best_palette = 'sequential'
+        map_type = 'one-tailed'
     else:
-        raise CyError(f'Cannot perform continuous mapping on column "{table_column}", which is not numeric')
+        # Two-tailed mapping ... btw: prefer divergent palette if color mapping
+        max_max_data = float(max(abs(min_data), abs(max_data)))
+        src_values = [-max_max_data, 0.0, max_max_data]
+        if type(palette[0]) is tuple and len(palette) >= 2:
+            palette_to_use = palette[1]
+        best_palette = 'divergent'
+        map_type = 'two-tailed'
+    src_values = _continuous_breakpoints(values, breakpoints, src_values)
+    if map_type == 'two-tailed' and 0.0 not in src_values:
+        src_values = sorted(src_values + [0.0]) # 0 stays a point so the palette's neutral color stays at 0
 
     # Check palette and map values to colors
     palette_func_name = palette_to_use[0]
@@ -1516,12 +1622,26 @@ def _gen_c_color_map(table,
 
     if best_palette not in palette_type:
         narrate(f'Warning: {palette_func_name} is not a {best_palette} palette and may give poor results for a {map_type} continuous mapping.')
-    dst_values = palette_func(len(src_values))
+    if map_type == 'two-tailed':
+        dst_values = _centered_palette_colors(palette_func, src_values)
+    else:
+        dst_values = palette_func(len(src_values))
 
     return {'table_column': table_column, 'table_column_values': src_values, 'colors': dst_values,
             'mapping_type': 'c', 'default_color': default_value, 'style_name': style_name,
             'network': network, 'base_url': base_url}
 
+# Return a color for each of the sorted src_values, which include 0. Each tail gets its own half of an odd-sized
+# palette, so 0 gets the middle (neutral) color and the extremes get the end colors however many points each tail has.
+def _centered_palette_colors(palette_func, src_values):
+    neg_count = sum(1 for value in src_values if value < 0)
+    pos_count = sum(1 for value in src_values if value > 0)
+    neg_colors = palette_func(2 * neg_count + 1)[:neg_count + 1] if neg_count else []
+    pos_colors = palette_func(2 * pos_count + 1)[pos_count:] if pos_count else []
+    if neg_colors and pos_colors:
+        pos_colors = pos_colors[1:] # both halves include the middle color
+    return neg_colors + pos_colors
+
 # Find the unique values in a column, map them to a desired target set, and return a dictionary of parameter values
 # suitable for passing to style_mapping setter function
 def _gen_map(table,
@@ -1533,7 +1653,8 @@ def _gen_map(table,
              default_value,
              style_name,
              network,
-             base_url):
+             base_url,
+             breakpoints=None):
 
     mapping_type = normalize_mapping(mapping_type, 'color palette', ['d', 'c'], long_name=False)
 
@@ -1546,7 +1667,7 @@ def _gen_map(table,
     if mapping_type == 'd':
         return _gen_d_map(table, table_column, scheme, value_name, default_name, default_value, style_name, network, base_url)
     else:
-        return _gen_c_map(table, table_column, scheme, value_name, default_name, default_value, style_name, network, base_url)
+        return _gen_c_map(table, table_column, scheme, value_name, default_name, default_value, style_name, network, base_url, breakpoints)
 
 
 # Find the unique values in a column, map them to a desired target set, and return a dictionary of parameter values
@@ -1576,13 +1697,11 @@ def _gen_d_map(table,
 # suitable for passing to style_mapping setter function
 def _map_values(table, table_column, scheme_func, value_name, default_name, default_value, style_name, network, base_url):
 
-    table_col_types = tables.get_table_column_types(table=table, network=network, base_url=base_url)
-    if table_column in table_col_types:
-        # Find out all of the values in the named column
-        df_values = tables.get_table_columns(table=table, columns=table_column, network=network, base_url=base_url)
-
+    # Find out all of the values in the named column
+    table_col_type, values = _column_values(table, table_column, network, base_url)
+    if table_col_type is not None:
         # Find the frequency distribution, with most common elements first (... not same ordering as Cytoscape) ... guarantee the order by sorting
-        df_freq = df_values[table_column].value_counts()
+        df_freq = values.rename(table_column).value_counts()
         if len(df_freq) > 1:
             # df_freq is a series that looks like this (3.0, 1) (4.0, 1) where the first element is newcol
             # and the second is the count of each value of newcol.
@@ -1610,7 +1729,6 @@ def _map_values(table, table_column, scheme_func, value_name, default_name, defa
         # the non-nan values are integers. When these values are tallied by the value_counts() function,
         # the type of the result would be Float64, too. The function converts the values back to the
         # type expected for the Cytoscape data.
-        table_col_type = table_col_types[table_column]
         if table_col_type in ['Double']:
             def f(x): return float(x)
         elif table_col_type in ['Long', 'Integer']:
@@ -1641,7 +1759,8 @@ def _gen_c_map(table,
                default_value,
                style_name,
                network,
-               base_url):
+               base_url,
+               breakpoints=None):
 
     # Check palette and map values to colors
     scheme_func_name = scheme[0]
@@ -1652,28 +1771,55 @@ def _gen_c_map(table,
         raise CyError(f'Scheme {scheme_func_name} cannot be used for continuous mappings')
 
     # Find out all of the values in the named column
-    df_values = tables.get_table_columns(table=table, columns=table_column, network=network, base_url=base_url)
-
-    # For continuous, create triple that contains min, mid, max
-    max_data = df_values[table_column].max() if table_column in df_values else np.nan
-    min_data = df_values[table_column].min() if table_column in df_values else np.nan
-    if type(max_data) in [int, float, np.int64, np.float64]:
-        if np.isnan(max_data):
-            min_data = 0
-            max_data = 1
-        min_data = float(min_data)
-        max_data = float(max_data)
-        mid_data = min_data + (max_data - min_data) / 2
-        src_values = [min_data, mid_data, max_data]
-    else:
-        raise CyError(f'Cannot perform continuous mapping on column "{table_column}", which is not numeric')
+    values = _numeric_column_values(table, table_column, network, base_url)
 
-    # Create map to min, mid, max values
-    dst_values = scheme_func(min_data, max_data)
+    # For continuous, create triple that contains min, mid, max unless other breakpoints are called for
+    min_data, max_data = (float(values.min()), float(values.max())) if len(values) else (0.0, 1.0)
+    mid_data = min_data + (max_data - min_data) / 2
+    src_values = _continuous_breakpoints(values, breakpoints, [min_data, mid_data, max_data])
+
+    # Create map to min, mid, max values ... schemes only take a count if there are other than three values
+    if len(src_values) == 3:
+        dst_values = scheme_func(min_data, max_data)
+    else:
+        dst_values = scheme_func(min_data, max_data, len(src_values))
     return {'table_column': table_column, 'table_column_values': src_values, value_name: dst_values,
             'mapping_type': 'c', default_name: default_value, 'style_name': style_name,
             'network': network, 'base_url': base_url}
 
+# Return the Cytoscape type and values of a table column
+def _column_values(table, table_column, network, base_url):
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+    return tables._get_table_column_values(table, table_column, 'default', net_suid, base_url=base_url)
+
+# Return the non-missing values of a numeric table column as a float array ... a missing column has no values
+def _numeric_column_values(table, table_column, network, base_url):
+    table_col_type, values = _column_values(table, table_column, network, base_url)
+    if table_col_type not in [None, 'Double', 'Long', 'Integer']:
+        raise CyError(f'Cannot perform continuous mapping on column "{table_column}", which is not numeric')
+    return values.dropna().to_numpy(dtype='float64')
+
+# Choose the data values for a continuous mapping using a breakpoints descriptor, falling back to default_values if
+# there is no descriptor or the data has too few distinct values to make at least two points
+def _continuous_breakpoints(values, breakpoints, default_values):
+    if breakpoints is None or len(values) == 0:
+        return default_values
+
+    breakpoints_func_name = breakpoints[0]
+    breakpoints_type = breakpoints[1]
+    breakpoints_func = breakpoints[2]
+
+    if 'breakpoints' not in breakpoints_type:
+        raise CyError(f'{breakpoints_func_name} is not a breakpoints descriptor')
+
+    src_values = np.unique(np.asarray(breakpoints_func(values), dtype='float64'))
+    return [float(x) for x in src_values] if len(src_values) >= 2 else default_values
+
+# Return count points at evenly spaced ranks of the distinct values
+def _rank_breakpoints(values, count):
+    distinct_values = np.unique(values)
+    return distinct_values[np.round(np.linspace(0, len(distinct_values) - 1, count)).astype(int)]
+
 # Find the unique values in a column, map them to desired target shapes, and return a dictionary of parameter values
 # suiteable for passing to style_mapping setter function
 def _gen_d_shape_map(table,
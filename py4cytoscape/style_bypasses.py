@@ -69,7 +69,7 @@ def set_node_property_bypass(node_names, new_values, visual_property, bypass=Tru
         node_names (str or list or int or None): List of nodes as ``list`` of node names or SUIDs,
             comma-separated string of node names or SUIDs, or scalar node name
             or SUID. Node names should be found in the ``name`` column of the ``nodes table``.
-        new_values (list): List of values to set, or single value
+        new_values (list or Series or ndarray): List of values to set, or single value
         visual_property (str): Name of a visual property. See ``get_visual_property_names``.
         bypass (bool): Whether to set permanent bypass value. Default is True
         network (SUID or str or None): Name or SUID of a network. Default is the
@@ -118,6 +118,7 @@ def set_node_property_bypass(node_names, new_values, visual_property, bypass=Tru
 
     visual_property = normalize_prop_name(visual_property)
 
+    if hasattr(new_values, 'tolist'): new_values = new_values.tolist() # e.g., pandas Series or NumPy array
     if not isinstance(new_values, list): new_values = [new_values]
 
     # If the property is verifiable, verify the values and adjust as appropriate
@@ -231,9 +232,8 @@ def clear_node_property_bypass(node_names, visual_property, network=None, base_u
     if node_suids == []:
         res = {'data': {}, 'errors': []}
     else:
-        for suid in node_suids:
-            res = commands.cyrest_delete(f'networks/{net_suid}/views/{view_suid}/nodes/{suid}/{visual_property}/bypass',
-                                         base_url=base_url)
+        res = commands.cyrest_delete_batch([f'networks/{net_suid}/views/{view_suid}/nodes/{suid}/{visual_property}/bypass'
+                                            for suid in node_suids], base_url=base_url)[-1]
 
     return res
     # TODO: OK to miss res values during the loop?
@@ -258,7 +258,7 @@ def set_edge_property_bypass(edge_names, new_values, visual_property, bypass=Tru
         edge_names (str or list or int or None): List of edges as ``list`` of edge names or SUIDs,
             comma-separated string of edge names or SUIDs, or scalar edge name
             or SUID. Edge names should be found in the ``name`` column of the ``edges table``.
-        new_values (list): List of values to set, or single value
+        new_values (list or Series or ndarray): List of values to set, or single value
         visual_property (str): Name of a visual property. See ``get_visual_property_names``.
         bypass (bool): Whether to set permanent bypass value. Default is True
         network (SUID or str or None): Name or SUID of a network. Default is the
@@ -307,6 +307,7 @@ def set_edge_property_bypass(edge_names, new_values, visual_property, bypass=Tru
 
     visual_property = normalize_prop_name(visual_property)
 
+    if hasattr(new_values, 'tolist'): new_values = new_values.tolist() # e.g., pandas Series or NumPy array
     if not isinstance(new_values, list): new_values = [new_values]
 
     # If the property is verifiable, verify the values and adjust as appropriate
@@ -417,9 +418,8 @@ def clear_edge_property_bypass(edge_names, visual_property, network=None, base_u
     if edge_suids == []:
         res = {'data': {}, 'errors': []}
     else:
-        for suid in edge_suids:
-            res = commands.cyrest_delete(f'networks/{net_suid}/views/{view_suid}/edges/{suid}/{visual_property}/bypass',
-                                         base_url=base_url)
+        res = commands.cyrest_delete_batch([f'networks/{net_suid}/views/{view_suid}/edges/{suid}/{visual_property}/bypass'
+                                            for suid in edge_suids], base_url=base_url)[-1]
 
     return res
     # TODO: OK to miss res values during the loop?
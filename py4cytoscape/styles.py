@@ -32,6 +32,7 @@ from . import commands
 from . import networks
 from . import sandbox
 from . import network_views
+from . import cytoscape_system
 
 # Internal module convenience imports
 from .exceptions import CyError
@@ -390,8 +391,7 @@ def get_arrow_shapes(base_url=DEFAULT_BASE_URL):
         >>> get_arrow_shapes()
         ['OPEN_CIRCLE', 'SQUARE', 'CIRCLE', 'DELTA_SHORT_2', 'DELTA', 'DIAMOND_SHORT_2', ...]
     """
-    res = commands.cyrest_get('styles/visualproperties/EDGE_TARGET_ARROW_SHAPE/values', base_url=base_url)
-    return res['values']
+    return _get_visual_property_values('EDGE_TARGET_ARROW_SHAPE', base_url)
 
 
 @cy_log
@@ -416,8 +416,7 @@ def get_line_styles(base_url=DEFAULT_BASE_URL):
         >>> get_line_styles()
         ['MARQUEE_DASH_DOT', 'SOLID', 'BACKWARD_SLASH', 'EQUAL_DASH', 'CONTIGUOUS_ARROW', ...]
     """
-    res = commands.cyrest_get('styles/visualproperties/EDGE_LINE_TYPE/values', base_url=base_url)
-    return res['values']
+    return _get_visual_property_values('EDGE_LINE_TYPE', base_url)
 
 @cy_log
 def get_node_shapes(base_url=DEFAULT_BASE_URL):
@@ -441,8 +440,7 @@ def get_node_shapes(base_url=DEFAULT_BASE_URL):
         >>> get_node_shapes()
         ['ROUND_RECTANGLE', 'VEE', 'TRIANGLE', 'HEXAGON', 'PARALLELOGRAM', 'ELLIPSE', 'OCTAGON', ...]
     """
-    res = commands.cyrest_get('styles/visualproperties/NODE_SHAPE/values', base_url=base_url)
-    return res['values']
+    return _get_visual_property_values('NODE_SHAPE', base_url)
 
 
 @cy_log
@@ -464,9 +462,11 @@ def get_visual_property_names(base_url=DEFAULT_BASE_URL):
         >>> get_visual_property_names()
         ['COMPOUND_NODE_PADDING', 'COMPOUND_NODE_SHAPE', 'DING_RENDERING_ENGINE_ROOT', 'EDGE', ...]
     """
-    res = commands.cyrest_get('styles/default/defaults', base_url=base_url)
-    visual_properties = [prop['visualProperty']     for prop in res['defaults']]
-    return visual_properties
+    def fetch():
+        res = commands.cyrest_get('styles/default/defaults', base_url=base_url)
+        return [prop['visualProperty']     for prop in res['defaults']]
+
+    return cytoscape_system._get_vocabulary('visual property names', fetch, base_url=base_url)
 
 
 @cy_log
@@ -495,3 +495,9 @@ def get_current_style(network=None, base_url=DEFAULT_BASE_URL):
     view_suid = network_views.get_network_view_suid(net_suid, base_url=base_url)
     res = commands.cyrest_get(f'networks/{net_suid}/views/{view_suid}/currentStyle', base_url=base_url)
     return res['title']
+
+
+def _get_visual_property_values(visual_property, base_url):
+    # Return the values Cytoscape allows for a discrete visual property, which are fetched only once per connection
+    return cytoscape_system._get_vocabulary(visual_property, lambda: commands.cyrest_get(
+        f'styles/visualproperties/{visual_property}/values', base_url=base_url)['values'], base_url=base_url)
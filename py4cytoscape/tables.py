@@ -22,18 +22,22 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 """
 
 # External library imports
+import functools
 import pandas as pd
 import numpy as np
 
 # Internal module imports
 from . import commands
 from . import networks
+from . import py4cytoscape_tuning
 
 # Internal module convenience imports
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log, narrate
 from .exceptions import CyError
 from .py4cytoscape_sandbox import get_abs_sandbox_path
+from .py4cytoscape_cache import get_table_key_index, set_table_key_index, clear_table_key_index
+from .py4cytoscape_cache import get_table_cache_session, get_table_cache_column, set_table_cache_column
 
 def __init__(self):
     pass
@@ -76,6 +80,7 @@ def delete_table_column(column, table='node', namespace='default', network=None,
     net_suid = networks.get_network_suid(network, base_url=base_url)
     res = commands.cyrest_delete(f'networks/{net_suid}/tables/{namespace}{table}/columns/{column}',
                                  base_url=base_url, require_json=False)
+    clear_table_key_index(base_url, net_suid, namespace + table, columns={column})
     return res
 
 
@@ -129,6 +134,14 @@ def get_table_columns(table='node', columns=None, namespace='default', network=N
 
     Note:
         For requested columns not present in the table, the column is not returned, but a warning is shown.
+
+    Note:
+        If a table cache directory is set (see ``set_table_cache_dir()``), node and edge columns read after
+        ``open_session()`` or ``save_session()`` are kept in that directory for the session file, and read from there
+        by later calls (including calls from later runs) that follow opening or saving the same version of the file.
+        The cache isn't used once the session is changed through py4cytoscape, until it's saved again, or if
+        Cytoscape's session file isn't accessible from this machine. Call ``clear_caches()`` after changing the session
+        in other ways (e.g., in the Cytoscape GUI).
     """
     suid = networks.get_network_suid(network, base_url=base_url)
 
@@ -136,48 +149,25 @@ def get_table_columns(table='node', columns=None, namespace='default', network=N
     table_col_info = get_table_column_types(table, namespace=namespace, network=network, base_url=base_url)
     table_col_list = list(table_col_info.keys())
 
-    # all columns ... handle comma separated lists and list objects
-    if columns is None:
-        col_list = table_col_list
-    elif isinstance(columns, str):
-        col_list = [col.strip() for col in columns.split(',')]
-    else:
-        col_list = columns
+    fetch_col_list = _fetch_column_list(table, columns, table_col_list)
 
-    # get suid column first and make a dataframe with SUID as index
-    res_names = commands.cyrest_get(f'networks/{suid}/tables/{namespace}{table}/columns/SUID', base_url=base_url)
-    suid_list = res_names['values']
+    # fetch the suid column and all values for each column together so they can share round trips
+    res_cols = _get_table_column_lists(table, ['SUID'] + fetch_col_list, table_col_info, namespace, suid, base_url)
+
+    # make a dataframe with SUID as index ... SUIDs aren't converted, so they can be cached as they are
+    suid_list = res_cols[0]['array'] if 'array' in res_cols[0] else res_cols[0]['values']
+    if 'cache' in res_cols[0]:
+        res_cols[0]['cache'](np.asarray(suid_list, dtype='int64'))
     df = pd.DataFrame(index=suid_list)
 
     # then fill in each requested column
-    for col in col_list:
-        if not col in table_col_list:
-            narrate(f'Column "{col}" not found in "{table}" table')
-            # TODO: Is this really the behavior we want?
-            break
+    for col, res_col in zip(fetch_col_list, res_cols[1:]):
+        if 'array' in res_col:
+            # Columns read from the table cache were already converted when they were cached
+            df[col] = res_col['array']
+            continue
 
-        # fetch all values for the column
-        res_col = commands.cyrest_get(f'networks/{suid}/tables/{namespace}{table}/columns/{col}', base_url=base_url)
-
-        # the R version of this function replaces missing values with the constant NA, which
-        # doesn't exist in Python. Pandas authority discusses this situation, but doesn't
-        # make a clear recommendation, so we'll leave None as None for non-numerics and nan for
-        # numerics.
-        # https://pandas.pydata.org/pandas-docs/stable/user_guide/missing_data.html
-        table_col_type = table_col_info[col]
-        if table_col_type in ['Double']:
-            def f(x):
-                return np.nan if x is None else float(x)
-        elif table_col_type in ['Long', 'Integer']:
-            def f(x):
-                return np.nan if x is None else int(x)
-        elif table_col_type in ['Boolean']:
-            def f(x):
-                return None if x is None else bool(x)
-        else:
-            def f(x):
-                return x
-        cvv = [f(x) for x in res_col['values']]
+        cvv = _convert_column_values(res_col['values'], table_col_info[col])
 
         if len(suid_list) != len(cvv):
             narrate('Column "%s" has only %d elements, but should have %d' % (col, len(cvv), len(suid_list)))
@@ -185,10 +175,82 @@ def get_table_columns(table='node', columns=None, namespace='default', network=N
 
         # Assign entire column, assuming values are ordered consistently by Cytoscape
         df[col] = cvv
+        if 'cache' in res_col:
+            res_col['cache'](df[col].to_numpy() if df[col].dtype.kind in 'biuf' else cvv)
 
     return df
 
 
+@cy_log
+def get_table_arrow(table='node', columns=None, namespace='default', network=None, base_url=DEFAULT_BASE_URL):
+    """Retrieve one or more columns of data from node, edge or network tables as an Arrow table.
+
+    This is the same as ``get_table_columns()``, except that the columns are returned as a ``pyarrow.Table``, which
+    Polars, DuckDB and other Arrow-based libraries can use without copying it. Each column's values go straight from
+    the CyREST reply into an Arrow array of the column's type: Double as double, Long as int64, Integer as int32,
+    Boolean as bool and String as string. Missing values are nulls. Requires the pyarrow package.
+
+    Args:
+        table (str): Name of table, e.g., node (default), edge, network
+        columns (str or list or None): Names of columns to retrieve values from as list object or comma-separated list;
+            default is all columns
+        namespace (str): Namespace of table. Default is "default".
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        pyarrow.Table: 'SUID' column followed by requested columns, and rows for each node/edge or network.
+
+    Raises:
+        HTTPError: if table or namespace doesn't exist in network
+        CyError: if network name or SUID doesn't exist
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> get_table_arrow(columns=['name', 'gal1RGexp'])
+        pyarrow.Table
+        SUID: int64
+        name: string
+        gal1RGexp: double
+        ----
+        SUID: [[3072,3073,...]]
+        name: [["YDL081C","YGL166W",...]]
+        gal1RGexp: [[0.139,-0.262,...]]
+        >>> polars.from_arrow(get_table_arrow('edge'))  # as a Polars dataframe, without copying
+        >>> pq.write_table(get_table_arrow(), 'nodes.parquet')  # as a Parquet file
+
+    Note:
+        As with ``get_table_columns()``, a requested column not present in the table is not returned, and node and edge
+        columns are read from the table cache directory if one is set (see ``set_table_cache_dir()``).
+
+    See Also:
+        :meth:`get_table_columns`, :meth:`load_table_arrow`
+    """
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+
+    suid = networks.get_network_suid(network, base_url=base_url)
+
+    # column information (names and types) ... SUID is always the first column
+    table_col_info = get_table_column_types(table, namespace=namespace, network=network, base_url=base_url)
+    fetch_col_list = ['SUID'] + [col for col in _fetch_column_list(table, columns, list(table_col_info.keys()))
+                                 if col != 'SUID']
+
+    # fetch all columns together so they can share round trips, and convert each one in a single step
+    res_cols = _get_table_column_lists(table, fetch_col_list, table_col_info, namespace, suid, base_url)
+    arrays = []
+    for col, res_col in zip(fetch_col_list, res_cols):
+        array = _arrow_column(res_col, table_col_info.get(col))
+        if arrays and len(array) != len(arrays[0]):
+            narrate('Column "%s" has only %d elements, but should have %d' % (col, len(array), len(arrays[0])))
+            break  # TODO: Is this the right response?
+        arrays.append(array)
+
+    return pa.table(arrays, names=fetch_col_list[:len(arrays)])
+
+
 @cy_log
 def get_table_value(table, row_name, column, namespace='default', network=None, base_url=DEFAULT_BASE_URL):
     """Retrieve the value from a specific row and column from node, edge or network tables.
@@ -332,7 +394,7 @@ def get_table_column_types(table='node', namespace='default', network=None, base
     return col_types
 
 @cy_log
-def load_table_data_from_file(file, first_row_as_column_names=False, start_load_row=1, delimiters='\\,,\t', data_key_column_index=1, table='node', table_key_column='shared name', network=None, base_url=DEFAULT_BASE_URL):
+def load_table_data_from_file(file, first_row_as_column_names=False, start_load_row=1, delimiters='\\,,\t', data_key_column_index=1, table='node', table_key_column='shared name', network=None, base_url=DEFAULT_BASE_URL, *, data_type_list=None):
     """Loads data into Cytoscape tables from a tabular file.
 
     This function loads data into Cytoscape node/edge/network
@@ -365,6 +427,9 @@ def load_table_data_from_file(file, first_row_as_column_names=False, start_load_
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        data_type_list (str or None): comma-separated list of column data types ordered by column index
+            (e.g. "string,int,long,double,boolean,string list" or just "s,i,l,d,b,sl"); default lets Cytoscape
+            infer each column's type from its values
 
     Returns:
         list: SUIDs of tables merged into
@@ -393,14 +458,16 @@ def load_table_data_from_file(file, first_row_as_column_names=False, start_load_
     else:
         raise CyError(f'Unknown table type {table}; must be either "node", "edge" or "network"')
 
+    data_type_param = f' dataTypeList="{data_type_list}"' if data_type_list else ''
+
     res = commands.commands_post(
-        f'table import file file="{file}" firstRowAsColumnNames="{first_row_as_column_names}" startLoadRow="{start_load_row}" delimiters="{delimiters}" keyColumnIndex="{data_key_column_index}" dataTypeTargetForNetworkCollection="{table}" keyColumnForMapping="{table_key_column}"',
+        f'table import file file="{file}" firstRowAsColumnNames="{first_row_as_column_names}" startLoadRow="{start_load_row}" delimiters="{delimiters}"{data_type_param} keyColumnIndex="{data_key_column_index}" dataTypeTargetForNetworkCollection="{table}" keyColumnForMapping="{table_key_column}"',
         base_url=base_url)
     return res
 
 @cy_log
 def load_table_data(data, data_key_column='row.names', table='node', table_key_column='name', namespace='default',
-                    network=None, base_url=DEFAULT_BASE_URL):
+                    network=None, base_url=DEFAULT_BASE_URL, *, prefilter=True):
     """Loads data into Cytoscape tables keyed by row.
 
     This function loads data into Cytoscape node/edge/network
@@ -423,6 +490,9 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        prefilter (bool): True to drop data rows whose keys aren't in the Cytoscape table before uploading them, and
+            fail if no keys match; False to upload all rows and let Cytoscape ignore rows whose keys don't match.
+            Default is True.
 
     Returns:
         str: 'Success: Data loaded in <table name> table' or 'Failed to load data: <reason>'
@@ -439,17 +509,20 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
         >>> data = df.DataFrame(data={'id':['YDL194W','YDR277C','YBR043C'], 'newcol':[1,2,3]})
         >>> load_table_data(data, data_key_column='id', table='node', table_key_column='name', network='galfiltered.sif')
         'Success: Data loaded in defaultnode table'
+        >>> load_table_data(data, data_key_column='id', table='node', table_key_column='name', prefilter=False)
+        'Success: Data loaded in defaultnode table'
+
+    Note:
+        To prefilter rows, the Cytoscape table's key column is fetched once and then cached, so repeated loads into the
+        same table don't re-fetch it. The cache is discarded when py4cytoscape changes the key column or the number of
+        rows in the table changes. If the key column's values are changed in some other way (e.g., in the Cytoscape
+        GUI), call ``clear_caches()``. For large tables where most keys are expected to match, ``prefilter=False``
+        avoids fetching the key column altogether.
     """
     if type(table_key_column) is not str:
         raise CyError('table_key_column must be the name of a single column.')
 
     net_suid = networks.get_network_suid(network, base_url=base_url)
-    table_key_column_values = get_table_columns(table=table, namespace=namespace, columns=table_key_column,
-                                                network=net_suid, base_url=base_url)
-    # TODO: Shouldn't namespace be in this parameter list? R doesn't have it ... I added it
-
-    if table_key_column_values.columns is None:
-        raise CyError('Failed to load data. Please check table_key_column.')
 
     if data_key_column == 'row.names':
         data['row.names'] = data.index
@@ -457,10 +530,17 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
     if not data_key_column in data.columns:
         raise CyError('Failed to load data. Please check data_key_column.')
 
-    # create table containing columns present in data and already present in Cytoscape table and
-    # verify that there is at least one key in the Cytoscape table that matches a key in the data
-    # Note: we rely on isin() to do the proper type comparison for the data values involved
-    data_subset = data[data[data_key_column].isin(table_key_column_values[table_key_column])]
+    if prefilter:
+        table_key_column_values = _get_table_key_values(table, table_key_column, namespace, net_suid, base_url=base_url)
+
+        # create table containing columns present in data and already present in Cytoscape table and
+        # verify that there is at least one key in the Cytoscape table that matches a key in the data
+        # Note: we rely on isin() to do the proper type comparison for the data values involved
+        data_subset = data[data[data_key_column].isin(table_key_column_values)]
+    else:
+        # send all rows and let Cytoscape skip the ones that don't match a key. Use a shallow copy so the list
+        # conversion below doesn't change the caller's dataframe.
+        data_subset = data.copy(deep=False)
     if data_subset.empty:
         from .py4cytoscape_logger import detail_logger
         detail_logger.debug(f'Pandas: {pd.__version__}')
@@ -470,11 +550,11 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
         detail_logger.debug(f'data: {data}')
         detail_logger.debug(f'type(data[data_key_column]): {type(data[data_key_column])}')
         detail_logger.debug(f'data[data_key_column]: {data[data_key_column]}')
-        detail_logger.debug(f'table_key_column_values: {table_key_column_values}')
-        detail_logger.debug(
-            f'type(table_key_column_values[table_key_column]): {type(table_key_column_values[table_key_column])}')
-        detail_logger.debug(f'table_key_column_values[table_key_column]: {table_key_column_values[table_key_column]}')
+        if prefilter:
+            detail_logger.debug(f'table_key_column_values: {table_key_column_values}')
         detail_logger.debug(f'data_subset: {data_subset}')
+        if not prefilter:
+            raise CyError('Failed to load data. Data contains no rows.')
         raise CyError(f'Provided table key column "{table_key_column}" and data key column "{data_key_column}" do not contain any matches')
 
     # look for elements that are lists (instead of scalars) and turn them into comma-separated strings.
@@ -505,10 +585,114 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
                               body={'key': table_key_column, 'dataKey': data_key_column, 'data': data_list},
                               require_json=False, base_url=base_url)
 
+    # any cached key column that was just written to may now have different values
+    clear_table_key_index(base_url, net_suid, tbl, columns=set(data_subset.columns))
+
     return f'Success: Data loaded in {tbl} table'
     # TODO: This is a difficult result to test for ... are we able to change it?
 
 
+@cy_log
+def load_table_arrow(data, data_key_column='name', table='node', table_key_column='name', namespace='default',
+                     network=None, base_url=DEFAULT_BASE_URL, *, prefilter=True):
+    """Loads data from an Arrow table into Cytoscape tables keyed by row.
+
+    This is the same as ``load_table_data()``, except that ``data`` is a ``pyarrow.Table`` or anything that can be
+    converted to one (e.g., a Polars or pandas dataframe, or a dict of columns), and the rows sent to CyREST are
+    prepared a whole column at a time by Arrow. Lists are stored as comma-separated strings, and nulls and NaN are
+    stored as missing values. Integer columns not already in the Cytoscape table are created as Integer columns, or
+    as Long columns if they hold 64-bit (or unsigned 32-bit) values. Requires the pyarrow package.
+
+    Args:
+        data (pyarrow.Table or DataFrame or dict): each row is a node and columns contain node attributes
+        data_key_column (str): name of ``data`` column to use as key; default is "name"
+        table (str): name of Cytoscape table to load data into, e.g., node, edge or network; default is "node"
+        table_key_column (str): name of Cytoscape table column to use as key; default is "name"
+        namespace (str): Namespace of table. Default is "default".
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        prefilter (bool): True to drop data rows whose keys aren't in the Cytoscape table before uploading them, and
+            fail if no keys match; False to upload all rows and let Cytoscape ignore rows whose keys don't match.
+            Default is True.
+
+    Returns:
+        str: 'Success: Data loaded in <table name> table'
+
+    Raises:
+        HTTPError: if table or namespace or table doesn't exist in network
+        CyError: if network name or SUID doesn't exist, ``data`` can't be converted to an Arrow table, or no keys match
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> data = pa.table({'id': ['YDL194W', 'YDR277C', 'YBR043C'], 'newcol': [1, 2, 3]})
+        >>> load_table_arrow(data, data_key_column='id', table='node', table_key_column='name')
+        'Success: Data loaded in defaultnode table'
+        >>> load_table_arrow(pq.read_table('scores.parquet'), data_key_column='id')
+        'Success: Data loaded in defaultnode table'
+        >>> load_table_arrow(polars_df, data_key_column='id', prefilter=False)
+        'Success: Data loaded in defaultnode table'
+
+    See Also:
+        :meth:`load_table_data`, :meth:`get_table_arrow`
+    """
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    import pyarrow.compute as pc
+
+    if type(table_key_column) is not str:
+        raise CyError('table_key_column must be the name of a single column.')
+
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+
+    data = _arrow_table(data)
+    if not data_key_column in data.column_names:
+        raise CyError('Failed to load data. Please check data_key_column.')
+
+    if prefilter:
+        # keep only the rows whose keys are in the Cytoscape table ... keys of a type that can't be compared with
+        # the data's keys don't match any of them
+        table_key_column_values = _get_table_key_values(table, table_key_column, namespace, net_suid, base_url=base_url)
+        key_column = data[data_key_column]
+        if pa.types.is_dictionary(key_column.type):
+            key_column = key_column.cast(key_column.type.value_type)
+        try:
+            value_set = pa.array(table_key_column_values.to_list()).cast(key_column.type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            value_set = pa.array([], type=key_column.type)
+        data = data.filter(pc.is_in(key_column, value_set=value_set))
+    if data.num_rows == 0:
+        if not prefilter:
+            raise CyError('Failed to load data. Data contains no rows.')
+        raise CyError(f'Provided table key column "{table_key_column}" and data key column "{data_key_column}" do not contain any matches')
+
+    # turn the columns into ones whose values can be sent as JSON, and then make one dict per row for CyREST
+    data = pa.table([_arrow_flat_column(column, ',') for column in data.columns], names=data.column_names)
+    data_list = data.to_pylist()
+
+    tbl = namespace + table  # calculate fully qualified table name
+
+    # if there are any integer columns that aren't in the Cytoscape table, add them explicitly now so they don't
+    # default to float
+    existing_cols = get_table_column_names(table, namespace, net_suid, base_url=base_url)
+    for col, col_type in zip(data.column_names, data.schema.types):
+        if pa.types.is_integer(col_type) and not col in existing_cols:
+            commands.cyrest_post(f'networks/{net_suid}/tables/{tbl}/columns',
+                                 body={'name': col, 'type': _cytoscape_integer_type(col_type)}, require_json=False,
+                                 base_url=base_url)
+
+    # finally, add the values for whatever columns we have (and create new columns as needed)
+    commands.cyrest_put(f'networks/{net_suid}/tables/{tbl}',
+                        body={'key': table_key_column, 'dataKey': data_key_column, 'data': data_list},
+                        require_json=False, base_url=base_url)
+
+    # any cached key column that was just written to may now have different values
+    clear_table_key_index(base_url, net_suid, tbl, columns=set(data.column_names))
+
+    return f'Success: Data loaded in {tbl} table'
+
+
 @cy_log
 def map_table_column(column, species, map_from, map_to, force_single=True, table='node', namespace='default',
                      network=None, base_url=DEFAULT_BASE_URL):
@@ -609,9 +793,198 @@ def rename_table_column(column, new_name, table='node', namespace='default', net
     res = commands.cyrest_put(f'networks/{net_suid}/tables/{namespace}{table}/columns',
                               body={'oldName': column, 'newName': new_name},
                               base_url=base_url, require_json=False)
+    clear_table_key_index(base_url, net_suid, namespace + table, columns={column, new_name})
     return res
 
 
+def _convert_column_values(values, table_col_type):
+    # the R version of this function replaces missing values with the constant NA, which
+    # doesn't exist in Python. Pandas authority discusses this situation, but doesn't
+    # make a clear recommendation, so we'll leave None as None for non-numerics and nan for
+    # numerics.
+    # https://pandas.pydata.org/pandas-docs/stable/user_guide/missing_data.html
+    if table_col_type in ['Double']:
+        def f(x):
+            return np.nan if x is None else float(x)
+    elif table_col_type in ['Long', 'Integer']:
+        def f(x):
+            return np.nan if x is None else int(x)
+    elif table_col_type in ['Boolean']:
+        def f(x):
+            return None if x is None else bool(x)
+    else:
+        def f(x):
+            return x
+    return [f(x) for x in values]
+
+
+def _fetch_column_list(table, columns, table_col_list):
+    # all columns ... handle comma separated lists and list objects
+    if columns is None:
+        col_list = table_col_list
+    elif isinstance(columns, str):
+        col_list = [col.strip() for col in columns.split(',')]
+    else:
+        col_list = columns
+
+    # only columns up to the first one not in the table are returned
+    fetch_col_list = []
+    for col in col_list:
+        if not col in table_col_list:
+            narrate(f'Column "{col}" not found in "{table}" table')
+            # TODO: Is this really the behavior we want?
+            break
+        fetch_col_list.append(col)
+    return fetch_col_list
+
+
+def _get_table_key_values(table, table_key_column, namespace, net_suid, base_url=DEFAULT_BASE_URL):
+    # Return the distinct values in a table's key column, using the cached copy if the table hasn't changed size
+    tbl = namespace + table
+    if table in ['node', 'edge']:
+        row_count = commands.cyrest_get(f'networks/{net_suid}/{table}s/count', base_url=base_url)['count']
+        key_values = get_table_key_index(base_url, net_suid, tbl, table_key_column, row_count)
+        if key_values is not None:
+            return key_values
+    else:
+        row_count = None  # Network tables are tiny, so don't bother caching them
+
+    try:
+        res_col = commands.cyrest_get(f'networks/{net_suid}/tables/{tbl}/columns/{table_key_column}', base_url=base_url)
+    except CyError:
+        raise CyError('Failed to load data. Please check table_key_column.')
+    key_values = pd.Index(res_col['values']).dropna().unique()
+
+    if row_count is not None:
+        set_table_key_index(base_url, net_suid, tbl, table_key_column, row_count, key_values)
+    return key_values
+
+
+def _get_table_column_lists(table, columns, col_types, namespace, net_suid, base_url=DEFAULT_BASE_URL):
+    # Return the CyREST reply ({'values': [...]}) for each column, in order. If the table cache is in use, a column
+    # found there is returned as {'array': values} instead, and a column that isn't has a 'cache' function that keeps
+    # its values (once converted by the caller) in the table cache.
+    tbl = namespace + table
+    col_urls = [f'networks/{net_suid}/tables/{tbl}/columns/{col}' for col in columns]
+    session_key = get_table_cache_session(base_url) if py4cytoscape_tuning.TABLE_CACHE_DIR else None
+    if session_key is None or table not in ['node', 'edge']:
+        return commands.cyrest_get_batch(col_urls, base_url=base_url)
+
+    # The cache holds columns for a session file, and each column is good only for the row count it was read at
+    row_count = commands.cyrest_get(f'networks/{net_suid}/{table}s/count', base_url=base_url)['count']
+    res_cols = [{'array': values} if values is not None else None
+                for values in (get_table_cache_column(session_key, net_suid, tbl, col, row_count, col_types.get(col))
+                               for col in columns)]
+
+    # Fetch whatever isn't cached, and arrange to cache it once it's converted
+    missing = [i for i, res_col in enumerate(res_cols) if res_col is None]
+    for i, res_col in zip(missing, commands.cyrest_get_batch([col_urls[i] for i in missing], base_url=base_url)):
+        col = columns[i]
+        res_col['cache'] = functools.partial(set_table_cache_column, session_key, net_suid, tbl, col, row_count,
+                                             col_types.get(col))
+        res_cols[i] = res_col
+    return res_cols
+
+
+def _get_table_column_values(table, column, namespace, net_suid, base_url=DEFAULT_BASE_URL):
+    # Return the Cytoscape type and all values of a table column. If there's no such column, the type is None and there
+    # are no values. Missing numbers are nan. Within a coalesce() block, repeated calls reuse the fetched replies.
+    tbl = namespace + table
+    col_types = {col['name']: col['type']
+                 for col in commands.cyrest_get(f'networks/{net_suid}/tables/{tbl}/columns', base_url=base_url)}
+    column_type = col_types.get(column)
+    if column_type is None:
+        values = pd.Series([], dtype='object')
+    else:
+        res_col = commands.cyrest_get(f'networks/{net_suid}/tables/{tbl}/columns/{column}', base_url=base_url)
+        values = pd.Series(res_col['values'], dtype='float64' if column_type == 'Double' else None)
+    return column_type, values
+
+
+# Arrow type for each Cytoscape column type ... the element type of a List column is inferred from its values
+_ARROW_TYPE_NAMES = {'Double': 'float64', 'Long': 'int64', 'Integer': 'int32', 'Boolean': 'bool_', 'String': 'string'}
+
+
+def _arrow_column(res_col, column_type):
+    # Return a column from _get_table_column_lists as an Arrow array of the column's type. A column fetched from
+    # CyREST is kept in the table cache in the form get_table_columns() would have converted it to.
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    type_name = _ARROW_TYPE_NAMES.get(column_type)
+    arrow_type = getattr(pa, type_name)() if type_name else None
+    if 'array' in res_col:
+        # Cached numbers are numpy arrays with missing integers as nan, and anything else is a list of values
+        array = pa.array(res_col['array'], from_pandas=True)
+        return array if arrow_type is None or array.type == arrow_type else array.cast(arrow_type)
+
+    array = pa.array(res_col['values'], type=arrow_type)
+    if 'cache' in res_col:
+        values = array.to_numpy(zero_copy_only=False)
+        if values.dtype.kind in 'iu': values = values.astype('int64')
+        res_col['cache'](values if values.dtype.kind in 'biuf' else res_col['values'])
+    return array
+
+
+def _arrow_table(data):
+    # Return data as a pyarrow.Table ... a pandas dataframe's index is dropped, and other dataframes (e.g., Polars)
+    # are converted by their own to_arrow()
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    if isinstance(data, pa.Table):
+        return data
+    if isinstance(data, pa.RecordBatch):
+        return pa.Table.from_batches([data])
+    try:
+        if isinstance(data, pd.DataFrame):
+            return pa.Table.from_pandas(data, preserve_index=False)
+        if hasattr(data, 'to_arrow'):
+            return data.to_arrow()
+        return pa.table(data)
+    except (TypeError, ValueError, pa.ArrowException) as e:
+        raise CyError(f'Data cannot be converted to an Arrow table: {e}')
+
+
+def _arrow_flat_column(column, list_delimiter):
+    # Return an Arrow column of values Cytoscape can store: lists become list_delimiter-separated strings, dates and
+    # times become strings, NaN becomes null and dictionary-encoded columns are decoded
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    import pyarrow.compute as pc
+    column_type = column.type
+    if pa.types.is_dictionary(column_type):
+        column_type = column_type.value_type
+        column = column.cast(column_type)
+    if pa.types.is_list(column_type) or pa.types.is_large_list(column_type):
+        column = column.cast(pa.list_(pa.string()))
+        if isinstance(column, pa.ChunkedArray):
+            return pa.chunked_array([_arrow_join_list(chunk, list_delimiter) for chunk in column.chunks], pa.string())
+        return _arrow_join_list(column, list_delimiter)
+    if pa.types.is_floating(column_type):
+        return pc.if_else(pc.is_nan(column), pa.scalar(None, type=column_type), column)
+    if pa.types.is_timestamp(column_type) or pa.types.is_date(column_type):
+        return column.cast(pa.string())
+    return column
+
+
+def _arrow_join_list(lists, list_delimiter):
+    # Return an Arrow array of list_delimiter-separated strings, one per list in an Arrow array of string lists. Null
+    # elements are dropped first, as binary_join() would make the whole string null; null lists stay null.
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    import pyarrow.compute as pc
+    values = pc.list_flatten(lists)
+    if values.null_count:
+        valid = pc.is_valid(values)
+        lengths = np.bincount(pc.list_parent_indices(lists).filter(valid).to_numpy(), minlength=len(lists))
+        offsets = pa.array(np.concatenate([[0], np.cumsum(lengths)]), type=pa.int32())
+        lists = pa.ListArray.from_arrays(offsets, values.filter(valid), mask=lists.is_null())
+    return pc.binary_join(lists, list_delimiter)
+
+
+def _cytoscape_integer_type(arrow_type):
+    # Return the Cytoscape column type that holds all values of an Arrow integer type
+    import pyarrow as pa # Imported here so py4cytoscape doesn't pay for it unless Arrow is actually used
+    if arrow_type.bit_width < 32 or (arrow_type.bit_width == 32 and pa.types.is_signed_integer(arrow_type)):
+        return 'Integer'
+    return 'Long'
+
+
 # TODO: Check to see if this is needed in RCy3
 def _nan_to_none(original_df, attr_dict_list):
     # convert missing numbers from 'nan' to None, which will cause the JSON converter to properly emit null
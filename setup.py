@@ -35,6 +35,10 @@ setuptools.setup(
         'backoff',
         'colour'
     ],
+    extras_require={
+        'fast': ['orjson'],
+        'arrow': ['pyarrow'],
+    },
     classifiers=[
         'Intended Audience :: Science/Research',
         'Intended Audience :: Developers',
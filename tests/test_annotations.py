@@ -22,6 +22,7 @@ import os.path
 """
 
 import unittest
+import pandas as pd
 
 from test_utils import *
 
@@ -1231,6 +1232,63 @@ class AppsTests(unittest.TestCase):
         # Verify that bad z-order is detected
         self.assertRaises(CyError, update_group_annotation, annotation_name=group_uuid, z_order='bogus')
 
+    @print_entry_exit
+    def test_add_update_delete_annotations(self):
+        # Initialize
+        load_test_session()
+
+        # Verify that a mix of annotation types can be added at once, and that missing values are left to defaults
+        df = pd.DataFrame({'annotation_type': ['text', 'shape', 'bounded_text'],
+                           'text': ['ann1 text', None, 'ann3 text'],
+                           'type': [None, 'ELLIPSE', 'RECTANGLE'],
+                           'name': ['ann1', 'ann2', 'ann3'],
+                           'x_pos': [100, 200, 300], 'y_pos': [100, 200, 300]})
+        res = add_annotations(df)
+        self.assertEqual(len(res), 3)
+        self._check_expected_values(res[0], {'name': 'ann1', 'text': 'ann1 text', 'x': '100.0', 'y': '100.0',
+                                             'type': 'org.cytoscape.view.presentation.annotations.TextAnnotation'})
+        self._check_expected_values(res[1], {'name': 'ann2', 'shapeType': 'ELLIPSE',
+                                             'type': 'org.cytoscape.view.presentation.annotations.ShapeAnnotation'})
+        self._check_expected_values(res[2], {'name': 'ann3', 'text': 'ann3 text',
+                                             'type': 'org.cytoscape.view.presentation.annotations.BoundedTextAnnotation'})
+        self._check_annotation_list(get_annotation_list(), 3, {'uuid', 'name'})
+
+        # Verify that annotation_type can be given for all rows
+        res = add_annotations(pd.DataFrame({'text': ['ann4 text', 'ann5 text'], 'name': ['ann4', 'ann5']}),
+                              annotation_type='text')
+        self.assertListEqual([ann['name'] for ann in res], ['ann4', 'ann5'])
+
+        # Verify that annotations are updated according to their own types, identified by name or UUID
+        df = pd.DataFrame({'annotation_name': ['ann1', res[1]['uuid']], 'angle': [45, 90],
+                           'x_pos': [101, 201], 'y_pos': [102, 202]})
+        res = update_annotations(df)
+        self._check_expected_values(res[0], {'name': 'ann1', 'rotation': '45.0', 'x': '101.0', 'y': '102.0'})
+        self._check_expected_values(res[1], {'name': 'ann5', 'rotation': '90.0', 'x': '201.0', 'y': '202.0'})
+
+        # Verify that nothing is changed if any row is invalid
+        self.assertRaises(CyError, add_annotations, pd.DataFrame({'text': ['x', 'y'], 'name': ['ann6', 'ann1']}),
+                          annotation_type='text')
+        self.assertRaises(CyError, add_annotations, pd.DataFrame({'text': ['x'], 'url': ['y']}), annotation_type='text')
+        self.assertRaises(CyError, add_annotations, pd.DataFrame({'text': ['x']}))
+        self.assertRaises(CyError, update_annotations, pd.DataFrame({'annotation_name': ['bogus'], 'angle': [1]}))
+        self.assertRaises(CyError, update_annotations, pd.DataFrame({'annotation_name': ['ann2'], 'text': ['x']}))
+        self.assertRaises(CyError, delete_annotations, ['ann1', 'bogus'])
+        self._check_annotation_list(get_annotation_list(), 5, {'uuid', 'name'})
+
+        # Verify that annotations can be deleted by name or UUID
+        delete_annotations(['ann1', res[1]['uuid'], 'ann2'])
+        self.assertSetEqual({ann['name'] for ann in get_annotation_list()}, {'ann3', 'ann4'})
+
+        # Verify that text and names containing quotes or name=value text are passed to Cytoscape as given
+        res = add_annotations(pd.DataFrame({'text': ['say "hi" x=1'], 'name': ['"quoted" name']}),
+                              annotation_type='text')
+        self._check_expected_values(res[0], {'name': '"quoted" name', 'text': 'say "hi" x=1'})
+        delete_annotations('"quoted" name')
+        self.assertSetEqual({ann['name'] for ann in get_annotation_list()}, {'ann3', 'ann4'})
+
+        # Verify check for null names list
+        self.assertRaises(CyError, delete_annotations)
+
 # ---------------------------------------------------------------
 
     def _check_expected_values(self, target, expected_values):
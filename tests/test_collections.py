@@ -112,6 +112,28 @@ class CollectionsTests(unittest.TestCase):
         # Verify that bogus collection SUID returns nothing
         self.assertRaises(CyError, get_collection_networks, -1)
 
+    @print_entry_exit
+    def test_get_collections_summary(self):
+        # Verify that case of no collections is handled
+        res = get_collections_summary()
+        self.assertEqual(len(res.index), 0)
+        self.assertListEqual(list(res.columns), ['SUID', 'name', 'networks'])
+
+        # Verify that having two collections returns each collection's name and networks
+        load_test_session('data/Multiple Collections.cys')
+        galFiltered_collection_suid = get_collection_suid()
+        res = get_collections_summary()
+        self.assertSetEqual(set(res['name']), {'galFiltered.sif', 'BINDyeast.sif'})
+        self.assertListEqual(list(res.index), list(res['SUID']))
+        self.assertEqual(res['name'][galFiltered_collection_suid], 'galFiltered.sif')
+        self.assertSetEqual(set(res['networks'][galFiltered_collection_suid]),
+                            set(get_collection_networks(galFiltered_collection_suid)))
+
+        # Verify that the summary agrees with the collection list, with or without cached names
+        self.assertSetEqual(set(res['name']), set(get_collection_list()))
+        clear_caches()
+        self.assertSetEqual(set(get_collections_summary()['name']), set(get_collection_list()))
+
 
 if __name__ == '__main__':
     unittest.main()
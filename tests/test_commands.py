@@ -22,6 +22,7 @@
 
 import unittest
 import json
+import pandas as df
 from requests import RequestException
 
 from test_utils import *
@@ -93,6 +94,39 @@ class CommandsTests(unittest.TestCase):
         self.assertIsInstance(res['apiVersion'], str)
         self.assertIsInstance(res['cytoscapeVersion'], str)
 
+    @print_entry_exit
+    def test_cyrest_get_batch(self):
+        # Initialization
+        load_test_session()
+
+        # Verify that results come back in the same order as the operations, and that each matches a single GET
+        res = cyrest_get_batch(['version', 'networks/count', f'networks/{get_network_suid()}/nodes/count'])
+        self.assertListEqual(res, [cyrest_get('version'), {'count': 1}, {'count': get_node_count()}])
+
+        # Verify that non-JSON results are returned as strings, and an empty operation list returns an empty list
+        self.assertListEqual(cyrest_get_batch(['gc', 'gc'], require_json=False), ['', ''])
+        self.assertListEqual(cyrest_get_batch([]), [])
+
+        # Verify that errors are caught
+        self.assertRaises(ValueError, cyrest_get_batch, ['version', 'gc'], require_json=True)
+        self.assertRaises((CyError, RequestException), cyrest_get_batch, ['version', 'networks/0/nodes/count'])
+
+    @print_entry_exit
+    def test_cyrest_delete_batch(self):
+        # Initialization
+        load_test_session()
+        cur_network_suid = get_network_suid()
+        clone_network_suid = clone_network()
+
+        # Verify that deleting views of two networks returns a non-JSON result for each
+        res = cyrest_delete_batch([f'networks/{cur_network_suid}/views', f'networks/{clone_network_suid}/views'], require_json=False)
+        self.assertListEqual(res, ['', ''])
+        self.assertListEqual(get_network_views(cur_network_suid), [])
+        self.assertListEqual(get_network_views(clone_network_suid), [])
+
+        self.assertRaises(RequestException, cyrest_delete_batch, ['session'],
+                          base_url='http://totallybogus')  # test non-existent URL
+
     @print_entry_exit
     def test_cyrest_post(self):
         # Initialization
@@ -140,6 +174,38 @@ class CommandsTests(unittest.TestCase):
         self.assertRaises(RequestException, cyrest_post, 'networks/views/currentNetworkView',
                           body={'networkViewSUID': view}, base_url='http://yahoo.com')
 
+    @print_entry_exit
+    def test_coalesce(self):
+        # Initialization
+        load_test_session()
+        suid = get_network_suid()
+
+        # Verify that a repeated GET gets the same reply, and that replies are returned in order within a batch
+        with coalesce():
+            columns = get_table_column_names()
+            self.assertListEqual(get_table_column_names(), columns)
+            self.assertListEqual(cyrest_get_batch(['networks/count', f'networks/{suid}/nodes/count', 'networks/count']),
+                                 [{'count': 1}, {'count': get_node_count()}, {'count': 1}])
+
+            # Verify that a write to a table is seen by the next GET of the table's columns
+            load_table_data(df.DataFrame(data={'id': ['YDL194W'], 'coalescecol': [1]}), data_key_column='id')
+            self.assertIn('coalescecol', get_table_column_names())
+
+            # Verify that a command is seen by the next GET, too
+            node_count = get_node_count()
+            select_nodes(['YDL194W'], by_col='name')
+            delete_selected_nodes()
+            self.assertEqual(get_node_count(), node_count - 1)
+
+            # Verify that nested blocks keep remembering replies until the outermost block ends
+            with coalesce():
+                self.assertEqual(get_node_count(), node_count - 1)
+            self.assertEqual(get_node_count(), node_count - 1)
+
+        # Verify that nothing is remembered once the block ends
+        add_cy_nodes(['coalesce node'])
+        self.assertEqual(get_node_count(), node_count)
+
     @print_entry_exit
     def test_commands_api(self):
         self.assertTrue(commands_api())
@@ -215,6 +281,27 @@ class CommandsTests(unittest.TestCase):
         self.assertRaises(RequestException, commands_post, '', base_url='http://totallybogus')
         self.assertRaises(RequestException, commands_post, '', base_url='http://yahoo.com')
 
+    @print_entry_exit
+    def test_commands_post_args(self):
+        # Initialization
+        load_test_session()
+
+        # Verify the same returns as commands_post
+        self._check_cy_result(commands_post_args('command', 'sleep', duration=5), {})
+        self._check_cy_result(commands_post_args('apps', 'status', app='Network Merge'),
+                              {'appName': 'Network Merge', 'status': 'Installed'})
+
+        # Verify that values containing quotes, blanks and name=value text reach Cytoscape intact, and None is omitted
+        odd_name = 'My "best" network x=1'
+        res = commands_post_args('network', 'rename', name=odd_name, sourceNetwork=f'SUID:{get_network_suid()}',
+                                 bogus=None)
+        self.assertEqual(res['name'], odd_name)
+        self.assertEqual(get_network_name(), odd_name)
+
+        # Verify that bad commands are caught
+        self.assertRaises(CyError, commands_post_args, 'session', 'open', file='c:/file name')
+        self.assertRaises(RequestException, commands_post_args, 'command', 'sleep', base_url='http://totallybogus')
+
     @print_entry_exit
     def test_commands_run(self):
         # Initialization
@@ -21,6 +21,7 @@
 """
 
 import unittest
+import re
 
 from test_utils import *
 
@@ -55,10 +56,41 @@ class AppsTests(unittest.TestCase):
 
         check_version_info()
         input('Terminate Cytoscape and hit [enter]')
+        check_version_info() # version is remembered from the last connection
+        clear_caches()
         self.assertRaises(requests.exceptions.RequestException, cytoscape_version_info)
         input('Restart Cytoscape, wait for startup to complete, and then hit [enter]')
         check_version_info()
 
+    @print_entry_exit
+    def test_vocabulary_cache(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as cache_dir:
+            try:
+                # Verify that vocabulary is remembered in a file named for the Cytoscape version and installed apps
+                set_vocabulary_cache_dir(cache_dir)
+                clear_caches()
+                node_shapes = get_node_shapes()
+                line_styles = get_line_styles()
+                version = cytoscape_version_info()['cytoscapeVersion']
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+                self.assertRegex(os.listdir(cache_dir)[0], f'^vocabulary-{re.escape(version)}-[0-9a-f]{{16}}\\.json$')
+
+                # Verify that a fresh connection gets the same vocabulary, whether from the file or from Cytoscape
+                clear_caches()
+                self.assertListEqual(get_node_shapes(), node_shapes)
+                cytoscape_ping()
+                self.assertListEqual(get_line_styles(), line_styles)
+                set_vocabulary_cache_dir(None)
+                clear_caches()
+                self.assertListEqual(get_node_shapes(), node_shapes)
+
+                # Verify that callers can't change the remembered vocabulary
+                get_node_shapes().append('bogus')
+                self.assertListEqual(get_node_shapes(), node_shapes)
+            finally:
+                set_vocabulary_cache_dir(None)
+
     
     @print_entry_exit
     def test_cytoscape_api_versions(self):
@@ -268,6 +268,73 @@ class FiltersTests(unittest.TestCase):
 
 
     
+    @print_entry_exit
+    def test_filter_suids_and_hide(self):
+        # Initialization
+        load_test_session()
+        expected_nodes = {'YGL035C', 'YLR362W', 'YPL248C'}
+        expected_suids = set(node_name_to_node_suid(list(expected_nodes)))
+
+        # Verify that a filter can return SUIDs instead of names
+        selected = create_degree_filter('degree filter 1x', [9, 11], 'BETWEEN', get_suids=True)
+        self.assertSetEqual(set(selected['nodes']), expected_suids)
+        self.assertIsNone(selected['edges'])
+        selected = apply_filter('degree filter 1x', get_suids=True)
+        self.assertSetEqual(set(selected['nodes']), expected_suids)
+
+        # Verify that hiding leaves the filter's selection alone and hides exactly the unselected nodes
+        self.check_values(apply_filter('degree filter 1x', hide=True)['nodes'], expected_nodes)
+        self.assertSetEqual(set(get_selected_nodes()), expected_nodes)
+        visible = get_node_property(visual_property='NODE_VISIBLE')
+        self.assertSetEqual({name for name, is_visible in visible.items() if is_visible}, expected_nodes)
+
+    
+    @print_entry_exit
+    def test_evaluate_filters(self):
+        # Initialization
+        load_test_session()
+        snap = NetworkSnapshot()
+
+        def names(result):
+            return set(snap.nodes['name'][result]) if result.name == 'nodes' else set(snap.edges['name'][result])
+
+        # Verify that client-side column filters agree with the server-side filters in test_create_column_filter
+        self.assertSetEqual(names(evaluate_column_filter(snap, 'COMMON', 'HIS', 'CONTAINS')),
+                            {'YBR248C', 'YOR202W', 'YCL030C'})
+        self.assertSetEqual(names(evaluate_column_filter(snap, 'COMMON', 'H.S.', 'REGEX')),
+                            {'YBR248C', 'YOR202W', 'YCL030C'})
+        self.assertSetEqual(names(evaluate_column_filter(snap, 'COMMON', 'RAP1', 'IS')), {'YNL216W'})
+        self.assertSetEqual(names(evaluate_column_filter(snap, 'NumberOfDirectedEdges', [7, 8], 'BETWEEN')),
+                            {'YEL009C', 'YPL075W', 'YDR412W', 'YJR022W', 'YDR395W'})
+        self.assertSetEqual(names(evaluate_column_filter(snap, 'NumberOfDirectedEdges', 17, 'GREATER_THAN')),
+                            {'YMR043W'})
+        self.assertSetEqual(names(evaluate_column_filter(snap, 'gal1RGexp', -2.1, 'LESS_THAN')), {'YBR020W'})
+        self.assertSetEqual(names(evaluate_column_filter(snap, 'EdgeBetweenness', [18040.0, 18360.0], 'BETWEEN',
+                                                         type='edges')),
+                            {'YPR119W (pd) YMR043W', 'YDR412W (pp) YPR119W'})
+
+        # Verify that degree filters and composites agree with the server-side filters
+        degree_9_11 = evaluate_degree_filter(snap, [9, 11])
+        degree_10_17 = evaluate_degree_filter(snap, [10, 17])
+        self.assertSetEqual(names(degree_9_11), {'YGL035C', 'YLR362W', 'YPL248C'})
+        self.assertSetEqual(names(evaluate_composite_filter([degree_9_11, degree_10_17])), {'YGL035C', 'YPL248C'})
+        self.assertSetEqual(names(evaluate_composite_filter([degree_9_11, degree_10_17], type='ANY')),
+                            {'YGL035C', 'YLR362W', 'YPL248C', 'YNL216W'})
+
+        # Verify that a result can be selected in Cytoscape
+        selected = select_filter_result(snap, degree_9_11)
+        self.check_values(selected['nodes'], {'YGL035C', 'YLR362W', 'YPL248C'})
+        self.assertIsNone(selected['edges'])
+        self.assertSetEqual(set(get_selected_nodes()), {'YGL035C', 'YLR362W', 'YPL248C'})
+        self.assertIsNone(get_selected_edges())
+
+        # Verify that bad filters are caught
+        self.assertRaises(CyError, evaluate_column_filter, snap, 'BOGUS', 'HIS', 'CONTAINS')
+        self.assertRaises(CyError, evaluate_column_filter, snap, 'COMMON', 'HIS', 'BOGUS_PREDICATE')
+        self.assertRaises(CyError, evaluate_degree_filter, snap, [8])
+        self.assertRaises(CyError, evaluate_composite_filter, [degree_9_11])
+
+    
     @print_entry_exit
     def test_get_filter_list(self):
         # Initialization
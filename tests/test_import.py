@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+""" Verify that importing py4cytoscape stays cheap.
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+
+import os
+import subprocess
+import sys
+import unittest
+
+from test_utils import *
+
+# Generous upper bound on the time to import py4cytoscape in a fresh interpreter ... the import itself should take a few
+# milliseconds, so exceeding this means something heavy has crept back into the import path
+_MAX_IMPORT_SECS = 0.5
+
+
+class ImportTests(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def _run_fresh(self, code):
+        # Run code in a fresh interpreter that finds the same py4cytoscape as this test, and return its output
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        return subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True,
+                              check=True).stdout.split()
+
+    @print_entry_exit
+    def test_import_time(self):
+        import_secs = min(float(self._run_fresh('import time; start = time.perf_counter(); import py4cytoscape; '
+                                                'print(time.perf_counter() - start)')[0])
+                          for attempt in range(3))
+        self.assertLess(import_secs, _MAX_IMPORT_SECS)
+
+    @print_entry_exit
+    def test_import_is_lazy(self):
+        heavy_modules = ['pandas', 'numpy', 'igraph', 'networkx', 'requests', 'backoff', 'py4cytoscape.networks']
+        check_loaded = f'import sys; print(*[m in sys.modules for m in {heavy_modules!r}])'
+
+        # Verify that importing the package loads none of the heavy modules
+        self.assertListEqual(self._run_fresh(f'import py4cytoscape; {check_loaded}'), ['False'] * len(heavy_modules))
+
+        # Verify that using a function loads only what that function needs
+        self.assertListEqual(self._run_fresh(f'import py4cytoscape; py4cytoscape.commands_post; {check_loaded}'),
+                             ['False', 'False', 'False', 'False', 'True', 'True', 'False'])
+
+        # Verify that the converters load igraph and networkx only when they're called
+        self.assertListEqual(self._run_fresh(f'import py4cytoscape; py4cytoscape.create_igraph_from_network; '
+                                             f'py4cytoscape.create_networkx_from_network; {check_loaded}'),
+                             ['True', 'True', 'False', 'False', 'True', 'True', 'True'])
+
+    @print_entry_exit
+    def test_flat_api(self):
+        import py4cytoscape
+
+        # Verify that functions, constants and submodules are all reachable as before
+        self.assertEqual(py4cytoscape.get_network_suid.__module__, 'py4cytoscape.networks')
+        self.assertEqual(py4cytoscape.clear_caches.__module__, 'py4cytoscape.py4cytoscape_cache')
+        self.assertIsInstance(py4cytoscape.DEFAULT_BASE_URL, str)
+        self.assertTrue(issubclass(py4cytoscape.CyError, Exception))
+        self.assertEqual(py4cytoscape.commands.__name__, 'py4cytoscape.commands')
+        self.assertIn('commands_post', dir(py4cytoscape))
+        self.assertIn('set_summary_logger', py4cytoscape.__all__)
+        self.assertRaises(AttributeError, getattr, py4cytoscape, 'totally_bogus')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -216,6 +216,13 @@ class LayoutsTests(unittest.TestCase):
         self.assertEqual(get_layout_property_value('force-directed', 'defaultSpringCoefficient'),
                          NEW_DEFAULT_SPRING_COEFFICIENT)
 
+        # Verify that both properties really were set in Cytoscape, and not just in the client's cache
+        clear_caches()
+        self.assertEqual(get_layout_property_value('force-directed', 'defaultSpringLength'),
+                         NEW_DEFAULT_SPRING_LENGTH)
+        self.assertEqual(get_layout_property_value('force-directed', 'defaultSpringCoefficient'),
+                         NEW_DEFAULT_SPRING_COEFFICIENT)
+
         self.assertEqual(set_layout_properties('force-directed',
                                                             {'defaultSpringLength': orig_default_spring_length,
                                                       'defaultSpringCoefficient': orig_default_spring_coefficient}), '')
@@ -336,6 +336,66 @@ class NetworkViewsTests(unittest.TestCase):
 
 
 
+    @print_entry_exit
+    def test_export_images(self):
+        # Initialization
+        load_test_session()
+        gal_filtered_view = get_network_view_suid()
+        gal_filtered_suid = get_network_suid()
+
+        # Verify that several sizes of the same view are exported, and that the manifest follows spec order
+        specs = [{'filename': f'output/test zoom-{zoom}', 'zoom': zoom} for zoom in (50, 100, 200)] + \
+                [{'filename': 'output/test batch', 'type': 'PDF', 'network': gal_filtered_suid},
+                 {'type': 'SVG', 'network': gal_filtered_view}]
+        manifest = export_images(specs, max_workers=2, fetch_to='output/fetched')
+        self.assertListEqual(list(manifest.columns), ['file', 'view', 'base_url', 'seconds', 'fetched', 'error'])
+        self.assertEqual(len(manifest.index), len(specs))
+        self.assertTrue(manifest['error'].isnull().all())
+        self.assertSetEqual(set(manifest['view']), {gal_filtered_view})
+        self.assertTrue(manifest['file'][0].endswith('test zoom-50.png'))
+        self.assertTrue(manifest['file'][3].endswith('test batch.pdf'))
+        self.assertTrue(manifest['file'][4].endswith('galFiltered.sif.svg'))
+        self.assertTrue((manifest['seconds'] > 0).all())
+        for fetched in manifest['fetched']:
+            self.assertTrue(os.path.isfile(fetched))
+        self.assertLess(os.stat(manifest['fetched'][0]).st_size, os.stat(manifest['fetched'][2]).st_size)
+
+        # Verify that existing files are replaced by default, and reported when they shouldn't be
+        manifest = export_images(specs[:1])
+        self.assertIsNone(manifest['error'][0])
+        manifest = export_images(specs[:1], overwrite_file=False)
+        self.assertIsNotNone(manifest['error'][0])
+
+        # Verify that bad specs are caught before anything is exported
+        self.assertRaises(CyError, export_images, [{'filename': 'output/test', 'bogus': 1}])
+        self.assertRaises(CyError, export_images, [{'filename': 'output/test'}, {'filename': 'output/test.png'}])
+        self.assertRaises(CyError, export_images, [{'filename': 'output/test', 'type': 'bogus'}])
+        self.assertRaises(CyError, export_images, [{'network': 'bogus'}])
+
+    @print_entry_exit
+    def test_get_network_view_image(self):
+        # Initialization
+        load_test_session()
+        clear_caches()
+
+        # Verify that each kind of image comes back as the bytes of that kind of file
+        png = get_network_view_image()
+        self.assertIsInstance(png, bytes)
+        self.assertTrue(png.startswith(b'\x89PNG'))
+        self.assertTrue(get_network_view_image(type='SVG').lstrip().startswith(b'<'))
+        self.assertTrue(get_network_view_image(type='PDF').startswith(b'%PDF'))
+        self.assertLess(len(get_network_view_image(height=100)), len(get_network_view_image(height=1000)))
+
+        # Verify that a cached image is reused until the view changes
+        thumbnail = get_network_view_image(height=100, use_cache=True)
+        self.assertIs(get_network_view_image(height=100, use_cache=True), thumbnail)
+        set_node_color_bypass(get_all_nodes()[0], '#FF0000')
+        self.assertIsNot(get_network_view_image(height=100, use_cache=True), thumbnail)
+
+        # Verify that bad types and networks are caught
+        self.assertRaises(CyError, get_network_view_image, type='bogus')
+        self.assertRaises(CyError, get_network_view_image, network='bogus')
+
     @unittest.skipIf(skip_for_ui(), 'Avoiding test that requires user response')
     @print_entry_exit
     def test_export_image(self):
@@ -792,6 +792,44 @@ class NetworkTests(unittest.TestCase):
         # Verify that when no edges or nodes are passed in, an error occurs
         self.assertRaises(CyError, create_network_from_data_frames)
 
+    @print_entry_exit
+    def test_create_network_from_data_frames_by_file(self):
+        node_data = {'id': ["node 0", "node 1", "node 2", "node 3", "node 4"],
+                     'group': ["A", "A", "B", "B", "C"],
+                     'score': [20, 10, 15, 5, 0]}
+        nodes = df.DataFrame(data=node_data, columns=['id', 'group', 'score'])
+        edge_data = {'source': ["node 0", "node 0", "node 0", "node 2"],
+                     'target': ["node 1", "node 2", "node 3", "node 3"],
+                     'interaction': ["inhibits", "interacts", "activates", "interacts"],
+                     'weight': [5.1, 3.0, 5.2, 9.9]}
+        edges = df.DataFrame(data=edge_data, columns=['source', 'target', 'interaction', 'weight'])
+
+        # Verify that a network sent as tabular files has the same nodes, edges and attribute types as one sent as JSON
+        suid = create_network_from_data_frames(nodes, edges, title='From node & edge files', transport='file')
+        self.assertEqual(get_network_name(suid), 'From node & edge files')
+        self.assertSetEqual(set(get_all_nodes(suid)), set(['node 0', 'node 1', 'node 2', 'node 3', 'node 4']))
+        self.assertSetEqual(set(get_all_edges(suid)), set(
+            ['node 0 (inhibits) node 1', 'node 0 (interacts) node 2', 'node 0 (activates) node 3',
+             'node 2 (interacts) node 3']))
+        node_types = get_table_column_types('node', network=suid)
+        self.assertEqual(node_types['score'], 'Integer')
+        self.assertEqual(node_types['group'], 'String')
+        self.assertEqual(get_table_column_types('edge', network=suid)['weight'], 'Double')
+        self.assertEqual(get_table_value('node', 'node 4', 'group', network=suid), 'C')
+        self.assertEqual(get_table_value('edge', 'node 2 (interacts) node 3', 'weight', network=suid), 9.9)
+
+        # Verify that a network is sent as JSON unless asked otherwise, that one big enough for an element count that
+        # has been set is sent as files, and that a bad transport is caught
+        suid = create_network_from_data_frames(nodes, edges.copy(), title='JSON by default')
+        self.assertIn('data.key.column', get_table_column_names('edge', network=suid))
+        set_file_transport_element_count(len(nodes.index) + len(edges.index))
+        try:
+            suid = create_network_from_data_frames(nodes, edges, title='Big enough for files')
+            self.assertNotIn('data.key.column', get_table_column_names('edge', network=suid))
+        finally:
+            set_file_transport_element_count(None)
+        self.assertRaises(CyError, create_network_from_data_frames, nodes, edges, transport='bogus')
+
     @print_entry_exit
     def test_import_network_from_tabular_file(self):
 
@@ -1036,9 +1074,105 @@ class NetworkTests(unittest.TestCase):
         for node_name, node_attrs in netx_nodes:
             self.assertEqual(normalize_dict(node_attrs), normalize_dict(dict(cynode_table.loc[node_name])))
 
+        # Verify that only the requested attribute columns are carried, and the graph is otherwise the same
+        netx_cols = create_networkx_from_network(node_columns='COMMON', edge_columns=['interaction'])
+        self.assertSetEqual(set(netx_cols.edges(keys=True)), set(netx.edges(keys=True)))
+        for node_name, node_attrs in netx_cols.nodes(data=True):
+            self.assertDictEqual(node_attrs, {'COMMON': cynode_table.loc[node_name]['COMMON']})
+        for src_node, targ_node, edge_suid, edge_attrs in netx_cols.edges(data=True, keys=True):
+            self.assertDictEqual(edge_attrs, {'interaction': cyedge_table.loc[edge_suid]['interaction']})
+
         # Verify that invalid network is caught
         self.assertRaises(CyError, create_networkx_from_network, network='BogusNetwork')
 
+    @print_entry_exit
+    def test_network_snapshot(self):
+        # Initialization
+        load_test_session()
+        node_count = get_node_count()
+        edge_count = get_edge_count()
+
+        # Verify that the snapshot holds the whole network, with topology consistent with the edge names
+        snap = NetworkSnapshot()
+        self.assertEqual(len(snap.node_suids), node_count)
+        self.assertEqual(len(snap.edge_suids), edge_count)
+        self.assertEqual(snap.csr_indptr[-1], edge_count)
+        names = snap.nodes['name'].to_numpy()
+        for edge_name, source, target in zip(snap.edges['name'], names[snap.edge_source], names[snap.edge_target]):
+            edge_parts = parse_edges([edge_name])[0]
+            self.assertEqual((edge_parts[0], edge_parts[2]), (source, target))
+
+        # Verify that the tables built from the network's Cytoscape JS form match the tables themselves
+        df.testing.assert_frame_equal(snap.nodes, get_table_columns('node'))
+        df.testing.assert_frame_equal(snap.edges, get_table_columns('edge'))
+
+        # Verify that exports match the existing conversions
+        netx = snap.to_networkx()
+        netx_direct = create_networkx_from_network()
+        self.assertEqual(netx.number_of_nodes(), netx_direct.number_of_nodes())
+        self.assertSetEqual(set(netx.edges(keys=True)), set(netx_direct.edges(keys=True)))
+        ig = snap.to_igraph()
+        ig_direct = create_igraph_from_network()
+        self.assertEqual((ig.vcount(), ig.ecount()), (ig_direct.vcount(), ig_direct.ecount()))
+        self.assertSetEqual(set(ig.vs.attributes()), set(ig_direct.vs.attributes()))
+        self.assertSetEqual(set(ig.es.attributes()), set(ig_direct.es.attributes()))
+        cyjs = snap.to_cytoscapejs()
+        self.assertEqual(len(cyjs['elements']['nodes']), node_count)
+        self.assertEqual(len(cyjs['elements']['edges']), edge_count)
+
+        # Verify that only requested columns are fetched, along with name
+        snap_cols = NetworkSnapshot(node_columns='COMMON', edge_columns=['interaction'])
+        self.assertSetEqual(set(snap_cols.nodes.columns), {'name', 'COMMON'})
+        self.assertSetEqual(set(snap_cols.edges.columns), {'interaction'})
+        self.assertEqual(len(snap_cols.to_networkx().edges), edge_count)
+
+        # Verify that a refresh picks up added and removed edges
+        added = add_cy_edges([['YLR075W', 'YKL028W']])
+        select_edges(snap.edge_suids[:2].tolist(), preserve_current_selection=False)
+        delete_selected_edges()
+        self.assertDictEqual(snap.refresh(), {'nodes_added': 0, 'nodes_removed': 0, 'edges_added': 1,
+                                              'edges_removed': 2})
+        self.assertEqual(len(snap.edge_suids), edge_count - 1)
+        self.assertIn(added[0]['SUID'], snap.edge_suids)
+
+    @print_entry_exit
+    def test_network_edge_list(self):
+        import pyarrow
+        import pyarrow.parquet as pq
+        # Initialization
+        load_test_session()
+        edge_count = get_edge_count()
+        if os.path.exists('test.parquet'): os.remove('test.parquet')
+
+        # Verify that the exported edge list has a row per edge, with source and target names and edge columns
+        res = export_network_edge_list('test', edge_columns='interaction, EdgeBetweenness')
+        self.assertTrue(res['file'].endswith('test.parquet'))
+        edge_list = pq.read_table('test.parquet')
+        self.assertListEqual(edge_list.column_names, ['source', 'target', 'interaction', 'EdgeBetweenness'])
+        self.assertEqual(edge_list.num_rows, edge_count)
+        self.assertRaises(CyError, export_network_edge_list, 'test')
+        export_network_edge_list('test', overwrite_file=True)
+        self.assertEqual(pq.read_table('test.parquet').num_rows, edge_count)
+
+        # Verify that the edge list imports as a copy of the network, with edge attribute types kept
+        new_suid = create_network_from_edge_list('test.parquet', title='Edge list copy')
+        self.assertEqual(get_network_name(new_suid), 'Edge list copy')
+        self.assertEqual(get_edge_count(network=new_suid), edge_count)
+        self.assertEqual(get_table_column_types('edge', network=new_suid)['EdgeBetweenness'], 'Double')
+        os.remove('test.parquet')
+
+        # Verify that an Arrow table imports, too, and that a row without a target makes a node with no edges
+        edges = edge_list.slice(0, 2).to_pydict()
+        edges['source'].append('lonely node')
+        edges['target'].append(None)
+        edges['interaction'].append(None)
+        edges['EdgeBetweenness'].append(None)
+        arrow_suid = create_network_from_edge_list(pyarrow.table(edges), title='Arrow copy')
+        self.assertEqual(get_edge_count(network=arrow_suid), 2)
+        self.assertIn('lonely node', get_all_nodes(network=arrow_suid))
+
+        self.assertRaises(CyError, create_network_from_edge_list, pyarrow.table({'from': ['a'], 'to': ['b']}))
+
     @print_entry_exit
     def test_create_network_from_networkx(self):
         # Initialization
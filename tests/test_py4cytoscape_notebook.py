@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+""" Test the Jupyter-bridge transport in py4cytoscape_notebook.py without a bridge, browser or Cytoscape.
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import gzip
+import json
+import unittest
+from unittest import mock
+
+import requests
+
+from test_utils import *
+from py4cytoscape import py4cytoscape_notebook as notebook
+
+
+class _FakeBridge:
+    # Stands in for the Jupyter-bridge server: remembers queued requests and answers each dequeue with whatever the
+    # browser function returns for the oldest request not yet answered
+
+    def __init__(self, browser, ping_content=b'pong', ping_headers=None):
+        self.browser = browser
+        self.ping_content = ping_content
+        self.ping_headers = ping_headers or {}
+        self.pings = 0
+        self.queued = []
+        self.bodies = []
+        self.answered = 0
+
+    def request(self, method, url, headers=None, data=None):
+        r = requests.models.Response()
+        r.status_code = 200
+        if url.endswith('/ping'):
+            self.pings += 1
+            r._content = self.ping_content
+            r.headers.update(self.ping_headers)
+        elif '/queue_request' in url:
+            self.bodies.append((headers, data))
+            if headers.get('Content-Encoding') == 'gzip':
+                data = gzip.decompress(data)
+            self.queued.append(json.loads(data))
+            r._content = b''
+        else:
+            reply = self.browser(self.queued[self.answered])
+            self.answered += 1
+            r._content = json.dumps(reply).encode('utf-8')
+            r.headers['Content-Type'] = 'application/json'
+        return r
+
+
+def _echo(request, tag=True):
+    # A browser client that answers each request with its URL, tagging the reply with the request's id
+    reply = {'status': 200, 'reason': 'OK', 'text': json.dumps({'url': request['url']})}
+    if tag and 'id' in request:
+        reply['id'] = request['id']
+    return reply
+
+
+class Py4cytoscapeNotebookTests(unittest.TestCase):
+
+    def setUp(self):
+        self._old_mode = notebook.set_jupyter_bridge_request_mode('auto', 4)
+        notebook._bridge_capabilities = None
+
+    def tearDown(self):
+        notebook.set_jupyter_bridge_request_mode(*self._old_mode)
+        notebook._bridge_capabilities = None
+
+    def _run(self, bridge, urls):
+        with mock.patch.object(notebook, '_bridge_session', bridge):
+            return [r.json()['url'] for r in notebook.do_requests_jupyter_bridge([('GET', url, {}) for url in urls])]
+
+    @print_entry_exit
+    def test_bridge_capabilities(self):
+        # Verify that capabilities come from the bridge's ping reply, as a header or a JSON field
+        bridge = _FakeBridge(_echo, ping_headers={'X-Jupyter-Bridge-Capabilities': 'pipeline, gzip'})
+        with mock.patch.object(notebook, '_bridge_session', bridge):
+            self.assertSetEqual(notebook._get_bridge_capabilities(), {'pipeline', 'gzip'})
+            self.assertSetEqual(notebook._get_bridge_capabilities(), {'pipeline', 'gzip'})
+        self.assertEqual(bridge.pings, 1)
+        self.assertListEqual(bridge.queued, [])
+
+        notebook._bridge_capabilities = None
+        bridge = _FakeBridge(_echo, ping_content=b'{"version": "0.0.3", "capabilities": ["batch"]}')
+        with mock.patch.object(notebook, '_bridge_session', bridge):
+            self.assertSetEqual(notebook._get_bridge_capabilities(), {'batch'})
+
+        # Verify that an older bridge that answers 'pong' supports nothing, and that nothing went to the browser
+        notebook._bridge_capabilities = None
+        bridge = _FakeBridge(_echo)
+        self.assertListEqual(self._run(bridge, ['a', 'b', 'c']), ['a', 'b', 'c'])
+        self.assertSetEqual(notebook._bridge_capabilities, set())
+        self.assertListEqual([request['url'] for request in bridge.queued], ['a', 'b', 'c'])
+
+    @print_entry_exit
+    def test_pipeline(self):
+        # Verify that tagged replies are matched to their requests
+        urls = [f'url{i}' for i in range(10)]
+        bridge = _FakeBridge(_echo, ping_headers={'X-Jupyter-Bridge-Capabilities': 'pipeline'})
+        self.assertListEqual(self._run(bridge, urls), urls)
+        self.assertSetEqual(notebook._bridge_capabilities, {'pipeline'})
+
+        # Verify that untagged replies answer the oldest outstanding request, and that the rest go one at a time
+        notebook._bridge_capabilities = None
+        bridge = _FakeBridge(lambda request: _echo(request, tag=False),
+                             ping_headers={'X-Jupyter-Bridge-Capabilities': 'pipeline'})
+        self.assertListEqual(self._run(bridge, urls), urls)
+        self.assertSetEqual(notebook._bridge_capabilities, set())
+
+    @print_entry_exit
+    def test_batch(self):
+        # Verify that a batch goes out as a single message and its replies are matched to their requests
+        def browser(request):
+            if request['command'] != 'batch':
+                return _echo(request)
+            return {'status': 200, 'reason': 'OK',
+                    'text': json.dumps([_echo(sub_request) for sub_request in reversed(request['data'])])}
+        bridge = _FakeBridge(browser, ping_headers={'X-Jupyter-Bridge-Capabilities': 'batch'})
+        self.assertListEqual(self._run(bridge, ['a', 'b', 'c']), ['a', 'b', 'c'])
+        self.assertEqual(len(bridge.queued), 1)
+
+        # Verify that a browser client that doesn't understand batches gets the requests one at a time
+        def old_browser(request):
+            if request['command'] == 'batch':
+                return {'status': 500, 'reason': 'Unknown command', 'text': ''}
+            return _echo(request, tag=False)
+        notebook._bridge_capabilities = None
+        bridge = _FakeBridge(old_browser, ping_headers={'X-Jupyter-Bridge-Capabilities': 'batch'})
+        self.assertListEqual(self._run(bridge, ['a', 'b', 'c']), ['a', 'b', 'c'])
+        self.assertListEqual([request['command'] for request in bridge.queued], ['batch', 'GET', 'GET', 'GET'])
+        self.assertSetEqual(notebook._bridge_capabilities, set())
+
+        # Verify that a batch whose reply can't be read isn't sent again, as it may already have been executed
+        for reply in [{'status': 200, 'reason': 'OK', 'text': json.dumps([{'status': 200, 'text': '{}'}])},
+                      {'status': 200, 'reason': 'OK', 'text': 'not JSON'},
+                      {'status': 500, 'reason': 'Internal Server Error', 'text': ''}]:
+            notebook._bridge_capabilities = None
+            bridge = _FakeBridge(lambda request, reply=reply: reply,
+                                 ping_headers={'X-Jupyter-Bridge-Capabilities': 'batch'})
+            self.assertRaises(requests.exceptions.HTTPError, self._run, bridge, ['a', 'b', 'c'])
+            self.assertListEqual([request['command'] for request in bridge.queued], ['batch'])
+            self.assertSetEqual(notebook._bridge_capabilities, set())
+
+    @print_entry_exit
+    def test_sequential_mode(self):
+        # Verify that sequential mode never probes the bridge
+        notebook.set_jupyter_bridge_request_mode('sequential')
+        bridge = _FakeBridge(_echo, ping_headers={'X-Jupyter-Bridge-Capabilities': 'batch'})
+        self.assertListEqual(self._run(bridge, ['a', 'b']), ['a', 'b'])
+        self.assertEqual(bridge.pings, 0)
+        self.assertIsNone(notebook._bridge_capabilities)
+
+    @print_entry_exit
+    def test_json_dumps(self):
+        # Verify that NaN and Infinity become null whether or not orjson is available
+        obj = {'name': 'x', 'values': [1.5, float('nan'), float('inf'), -float('inf')],
+               'nested': ({'v': float('nan')},)}
+        expected = {'name': 'x', 'values': [1.5, None, None, None], 'nested': [{'v': None}]}
+        with mock.patch.object(notebook, 'orjson', None):
+            self.assertDictEqual(json.loads(notebook._json_dumps(obj)), expected)
+        if notebook.orjson:
+            self.assertDictEqual(json.loads(notebook._json_dumps(obj)), expected)
+
+        # Verify that finite values round trip unchanged
+        obj = {'a': [1, 2.5, 'three', None, True], 'b': {'c': 'ü'}}
+        with mock.patch.object(notebook, 'orjson', None):
+            self.assertDictEqual(notebook._json_loads(notebook._json_dumps(obj)), obj)
+        self.assertDictEqual(notebook._json_loads(notebook._json_dumps(obj)), obj)
+
+    @print_entry_exit
+    def test_gzip(self):
+        # Verify that large bodies are compressed only if the bridge supports it and batching is enabled
+        big_body = {'data': 'x' * notebook._BRIDGE_GZIP_MIN_BYTES}
+        for mode, ping_headers, compressed in [('auto', {'X-Jupyter-Bridge-Capabilities': 'gzip'}, True),
+                                               ('auto', {}, False),
+                                               ('sequential', {'X-Jupyter-Bridge-Capabilities': 'gzip'}, False)]:
+            notebook.set_jupyter_bridge_request_mode(mode)
+            notebook._bridge_capabilities = None
+            bridge = _FakeBridge(_echo, ping_headers=ping_headers)
+            with mock.patch.object(notebook, '_bridge_session', bridge):
+                notebook._queue_bridge_request(big_body)
+                notebook._queue_bridge_request({'data': 'small'})
+            self.assertEqual(bridge.bodies[0][0].get('Content-Encoding'), 'gzip' if compressed else None)
+            self.assertIsNone(bridge.bodies[1][0].get('Content-Encoding'))
+            self.assertListEqual(bridge.queued, [big_body, {'data': 'small'}])
+            self.assertEqual(bridge.pings, 0 if mode == 'sequential' else 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
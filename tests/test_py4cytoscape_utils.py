@@ -21,6 +21,8 @@
 """
 
 import unittest
+import pandas as pd
+import numpy as np
 from test_utils import *
 
 class Py4cytoscapeUtilsTests(unittest.TestCase):
@@ -317,6 +319,39 @@ class Py4cytoscapeUtilsTests(unittest.TestCase):
         self.assertRaises(CyError, verify_hex_colors, ['red', '#00FF', '#FF00FF'])
         self.assertRaises(CyError, verify_hex_colors, ['red', None, '#FF00FF'])
 
+        # Verify that pandas and NumPy collections are accepted, and that repeated colors are translated consistently
+        self.assertListEqual(verify_hex_colors(pd.Series(['red', 'blue', 'red'])), ['#FF0000', '#0000FF', '#FF0000'])
+        self.assertListEqual(verify_hex_colors(np.array(['#ff0000', '#00FF00'])), ['#ff0000', '#00FF00'])
+        self.assertListEqual(verify_hex_colors(['red'] * 1000 + ['#123456']), ['#FF0000'] * 1000 + ['#123456'])
+        self.assertRaises(CyError, verify_hex_colors, pd.Series(['red', 'garbage']))
+        self.assertRaises(CyError, verify_hex_colors, ['red', ['blue']])
+
+    @print_entry_exit
+    def test_verify_values(self):
+        self.assertEqual(verify_opacities(100), 100)
+        self.assertListEqual(verify_opacities([0, 128.5, 255]), [0, 128.5, 255])
+        self.assertListEqual(verify_opacities(np.array([0, 255])), [0, 255])
+        self.assertEqual(verify_opacities(np.int64(7)), 7)
+        self.assertIsNone(verify_opacities(None))
+        self.assertRaises(CyError, verify_opacities, [0, 256])
+        self.assertRaises(CyError, verify_opacities, pd.Series([0, -1]))
+        self.assertRaises(CyError, verify_opacities, [0, '1'])
+
+        self.assertEqual(verify_dimensions('width', 50), 50)
+        self.assertListEqual(verify_dimensions('width', pd.Series([10, 20.5])), [10, 20.5])
+        self.assertRaises(CyError, verify_dimensions, 'width', [10, '20'])
+        self.assertRaises(CyError, verify_dimensions, 'width', 'bogus')
+
+        self.assertEqual(verify_bools('True'), 'True')
+        self.assertListEqual(verify_bools([True, 'false'] * 100), [True, 'false'] * 100)
+        self.assertListEqual(verify_bools(np.array([True, False])), [True, False])
+        self.assertRaises(CyError, verify_bools, [True, 1])
+        self.assertRaises(CyError, verify_bools, ['true', 'maybe'])
+
+        self.assertEqual(verify_strs('happy'), 'happy')
+        self.assertListEqual(verify_strs(pd.Series(['happy', 'sad'])), ['happy', 'sad'])
+        self.assertRaises(CyError, verify_strs, ['happy', 1])
+
     # This code isn't necessary for this package, but can be re-included if it's necessary to parse out
     # a file: URL
     # @print_entry_exit
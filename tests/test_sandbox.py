@@ -348,6 +348,36 @@ class SandboxTests(unittest.TestCase):
         self._verify_current_sandbox_is_preset()
         check_to_sandbox(default_sandbox_path, PREDEFINED_SANDBOX_NAME)
 
+    @print_entry_exit
+    def test_sandbox_round_trip(self):
+        # Verify that a file larger than a transfer block and not a multiple of 3 bytes survives a round trip intact
+        _LOCAL_FILE = 'round trip test.bin'
+        _RETURNED_FILE = 'round trip test returned.bin'
+        file_content = os.urandom(3 * 1024 * 1024 * 2 + 7)
+        with open(_LOCAL_FILE, mode='wb') as file:
+            file.write(file_content)
+
+        try:
+            sandbox_set(PREDEFINED_SANDBOX_NAME)
+            res = sandbox_send_to(_LOCAL_FILE, _TEST_FILE)
+            self.assertSetEqual(set(res.keys()), {'filePath'})
+            res = sandbox_get_from(_TEST_FILE, _RETURNED_FILE)
+            self.assertSetEqual(set(res.keys()), {'filePath', 'modifiedTime', 'fileByteCount'})
+            self.assertEqual(res['fileByteCount'], len(file_content))
+            with open(_RETURNED_FILE, mode='rb') as file:
+                self.assertEqual(file.read(), file_content)
+            self.assertFalse(os.path.exists(_RETURNED_FILE + '.part'))
+
+            # Verify that a failed transfer leaves nothing behind
+            os.remove(_RETURNED_FILE)
+            self.assertRaises(CyError, sandbox_get_from, 'totally bogus', _RETURNED_FILE)
+            self.assertFalse(os.path.exists(_RETURNED_FILE))
+            self.assertFalse(os.path.exists(_RETURNED_FILE + '.part'))
+        finally:
+            sandbox_remove_file(_TEST_FILE)
+            for file_name in [_LOCAL_FILE, _RETURNED_FILE]:
+                if os.path.exists(file_name): os.remove(file_name)
+
     @print_entry_exit
     def test_sandbox_url_to_remove(self):
         _FROM_URL = 'https://www.dropbox.com/s/r15azh0xb53smu1/GDS112_full.soft?dl=0'
@@ -721,6 +721,46 @@ class StyleAutoMappingsTests(unittest.TestCase):
         self.assertRaises(CyError, gen_node_size_map, 'newcol', network='bogus network')
         self.assertRaises(CyError, gen_edge_size_map, 'EdgeBetweenness', network='bogus network')
 
+    @print_entry_exit
+    def test_gen_breakpoints_map(self):
+        # Initialization
+        load_test_session()
+
+        # Create a skewed column with eight data values, and verify the breakpoints each descriptor chooses
+        eight_data = df.DataFrame(data={'id':['YDL194W', 'YDR277C', 'YBR043C', 'YKR026C', 'YGL122C', 'YGR218W', 'YGL097W', 'YOR204W'], 'newcol':[1, 1, 1, 1, 2, 3, 4, 100]})
+        load_table_data(eight_data, data_key_column='id')
+        range_map = gen_node_size_map('newcol', style_name='galFiltered Style', breakpoints=breakpoints_c_range(5))
+        self.assertDictEqual(range_map, {'table_column': 'newcol', 'table_column_values': [1.0, 25.75, 50.5, 75.25, 100.0], 'sizes': [10, 15.0, 20.0, 25.0, 30], 'mapping_type': 'c', 'default_size': None, 'style_name': 'galFiltered Style', 'network': None, 'base_url': 'http://127.0.0.1:1234/v1'})
+        quantile_map = gen_node_size_map('newcol', style_name='galFiltered Style', breakpoints=breakpoints_c_quantile([0, 0.5, 0.75, 1]))
+        self.assertDictEqual(quantile_map, {'table_column': 'newcol', 'table_column_values': [1.0, 1.5, 3.25, 100.0], 'sizes': [10, 16.666666666666668, 23.333333333333336, 30], 'mapping_type': 'c', 'default_size': None, 'style_name': 'galFiltered Style', 'network': None, 'base_url': 'http://127.0.0.1:1234/v1'})
+        rank_map = gen_node_color_map('newcol', style_name='galFiltered Style', breakpoints=breakpoints_c_rank(5))
+        self.assertDictEqual(rank_map, {'table_column': 'newcol', 'table_column_values': [1.0, 2.0, 3.0, 4.0, 100.0], 'colors': ['#F0F9E8', '#BAE4BC', '#7BCCC4', '#43A2CA', '#0868AC'], 'mapping_type': 'c', 'default_color': None, 'style_name': 'galFiltered Style', 'network': None, 'base_url': 'http://127.0.0.1:1234/v1'})
+
+        # Verify that a two-tailed color mapping keeps 0 as a point, and gives it the divergent palette's neutral color
+        signed_data = df.DataFrame(data={'id':['YDL194W', 'YDR277C', 'YBR043C', 'YKR026C', 'YGL122C', 'YGR218W', 'YGL097W', 'YOR204W'], 'signedcol':[-4.0, -1.0, 1.0, 2.0, 3.0, 4.0, 5.0, 100.0]})
+        load_table_data(signed_data, data_key_column='id')
+        signed_map = gen_node_color_map('signedcol', style_name='galFiltered Style', breakpoints=breakpoints_c_quantile([0, 0.25, 0.5, 0.75, 1]))
+        self.assertDictEqual(signed_map, {'table_column': 'signedcol', 'table_column_values': [-4.0, 0.0, 0.5, 2.5, 4.25, 100.0], 'colors': ['#91BFDB', '#FFFFBF', '#FEE090', '#FDAE61', '#F46D43', '#D73027'], 'mapping_type': 'c', 'default_color': None, 'style_name': 'galFiltered Style', 'network': None, 'base_url': 'http://127.0.0.1:1234/v1'})
+
+        # Verify that quantiles that land on the same value are merged, and that too few points falls back to min, mid, max
+        merged_map = gen_node_opacity_map('newcol', style_name='galFiltered Style', breakpoints=breakpoints_c_quantile([0, 0.25, 0.5, 1]))
+        self.assertEqual(merged_map['table_column_values'], [1.0, 1.5, 100.0])
+        fallback_map = gen_node_opacity_map('newcol', style_name='galFiltered Style', breakpoints=breakpoints_c_quantile([0, 0.25]))
+        self.assertEqual(fallback_map['table_column_values'], [1.0, 50.5, 100.0])
+
+        # Verify that a generated mapping with more than three points can be set
+        set_node_size_mapping(**range_map)
+        self.assertEqual(len(get_style_mapping(style_name='galFiltered Style', visual_prop='NODE_SIZE')['points']), 5)
+
+        # Verify that reloading the column is noticed by the next generator
+        eight_data['newcol'] = [1, 2, 3, 4, 5, 6, 7, 8]
+        load_table_data(eight_data, data_key_column='id')
+        self.assertEqual(gen_node_size_map('newcol', style_name='galFiltered Style')['table_column_values'], [1.0, 4.5, 8.0])
+
+        # Verify that breakpoints require a breakpoints descriptor and a numeric column
+        self.assertRaises(CyError, gen_node_size_map, 'newcol', breakpoints=scheme_c_number_continuous())
+        self.assertRaises(CyError, gen_node_size_map, 'name', breakpoints=breakpoints_c_rank())
+
     @print_entry_exit
     def test_gen_shapes_map(self):
         # Initialization
@@ -107,6 +107,33 @@ class TablesTests(unittest.TestCase):
         self.assertRaises(CyError, get_table_columns, network='bogus')
 
     
+    @print_entry_exit
+    def test_table_cache(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as cache_dir:
+            try:
+                # Verify that columns read after opening a session file are kept on disk, and are read back the same
+                set_table_cache_dir(cache_dir)
+                clear_caches()
+                load_test_session()
+                first_df = get_table_columns()
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+                cached_df = get_table_columns()
+                df.testing.assert_frame_equal(cached_df, first_df)
+                df.testing.assert_frame_equal(get_table_columns(columns='gal1RGexp, name'), first_df[['gal1RGexp', 'name']])
+
+                # Verify that a write through py4cytoscape is seen by the next read, and isn't kept for the file
+                load_table_data(df.DataFrame(data={'id': ['YDL194W'], 'gal1RGexp': [1000.0]}), data_key_column='id')
+                self.assertIn(1000.0, list(get_table_columns(columns='gal1RGexp')['gal1RGexp']))
+                load_test_session()
+                df.testing.assert_frame_equal(get_table_columns(columns='gal1RGexp'), first_df[['gal1RGexp']])
+
+                # Verify that discarding caches discards the files, too
+                clear_caches()
+                self.assertListEqual(os.listdir(cache_dir), [])
+            finally:
+                set_table_cache_dir(None)
+
     @print_entry_exit
     def test_get_table_value(self):
         # Initialization
@@ -356,7 +383,69 @@ class TablesTests(unittest.TestCase):
         self.assertRaises(CyError, load_table_data, data, namespace='bogus')
         self.assertRaises(CyError, load_table_data, data, network='bogus')
 
+    @print_entry_exit
+    def test_load_table_data_no_prefilter(self):
+        # Initialization
+        load_test_session()
+
+        # Verify that rows with unmatched keys are sent to Cytoscape and ignored there, and matched rows are loaded
+        column_names = get_table_column_names()
+        test_data = df.DataFrame(data={'id': ['YDL194W', 'YDR277C', 'YBR043C', 'New1'], 'newcol': [1, 2, 3, 4]})
+        res = load_table_data(test_data, data_key_column='id', table='node', table_key_column='name', prefilter=False)
+        self.assertEqual(res, 'Success: Data loaded in defaultnode table')
+        self.assertListEqual(list(test_data.columns), ['id', 'newcol'])
+        data = get_table_columns(columns=['name', 'newcol'])
+        self.assertEqual(len(column_names) + 2, len(get_table_column_names()))
+        added_data = data[data['newcol'].notnull()]
+        self.assertDictEqual(dict(zip(added_data['name'], added_data['newcol'])), {'YDL194W': 1, 'YDR277C': 2, 'YBR043C': 3})
+
+        # Verify that a key column cached by a prefiltered load is refreshed after the key column is loaded
+        test_data = df.DataFrame(data={'newcol_val': [1, 2, 3], 'derived': [100, 200, 300]})
+        self.assertEqual(load_table_data(test_data, data_key_column='newcol_val', table_key_column='newcol'), 'Success: Data loaded in defaultnode table')
+        test_data = df.DataFrame(data={'id': ['YBR043C'], 'newcol': [10]})
+        self.assertEqual(load_table_data(test_data, data_key_column='id', table_key_column='name'), 'Success: Data loaded in defaultnode table')
+        test_data = df.DataFrame(data={'newcol_val': [10], 'derived': [1000]})
+        self.assertEqual(load_table_data(test_data, data_key_column='newcol_val', table_key_column='newcol'), 'Success: Data loaded in defaultnode table')
+        self.assertEqual(get_table_value('node', 'YBR043C', 'derived'), 1000)
+
+        self.assertRaises(CyError, load_table_data, df.DataFrame(data={'id': [], 'newcol': []}), data_key_column='id', prefilter=False)
+
     
+    @print_entry_exit
+    def test_load_table_arrow(self):
+        import pyarrow as pa
+        # Initialization
+        load_test_session()
+
+        # Verify that adding into rows that don't exist fails
+        self.assertRaises(CyError, load_table_arrow, pa.table({'id': ['New1', 'New2'], 'newcol': [1, 2]}), data_key_column='id')
+
+        # Verify that matching rows are loaded, with integer, list and missing values stored as Cytoscape expects
+        test_data = pa.table({'id': ['YDL194W', 'YDR277C', 'YBR043C', 'New1'],
+                              'newint': pa.array([1, 2, 3, 4], type=pa.int32()),
+                              'newlong': pa.array([1, 2, 3, 2**40], type=pa.int64()),
+                              'newdouble': [1.5, float('nan'), None, 4.5],
+                              'newlist': [['a', 'b'], ['c', None], None, []]})
+        res = load_table_arrow(test_data, data_key_column='id')
+        self.assertEqual(res, 'Success: Data loaded in defaultnode table')
+        col_types = get_table_column_types()
+        self.assertEqual(col_types['newint'], 'Integer')
+        self.assertEqual(col_types['newlong'], 'Long')
+        self.assertEqual(get_table_value('node', 'YDL194W', 'newint'), 1)
+        self.assertEqual(get_table_value('node', 'YDL194W', 'newlist'), 'a,b')
+        self.assertEqual(get_table_value('node', 'YDR277C', 'newlist'), 'c')
+        self.assertEqual(get_table_value('node', 'YDL194W', 'newdouble'), 1.5)
+        self.assertRaises(CyError, get_table_value, 'node', 'YDR277C', 'newdouble')
+
+        # Verify that a dataframe is accepted, too, and that its index isn't loaded
+        test_df = df.DataFrame(data={'id': ['YBR043C'], 'newint': [10]}, index=['x'])
+        self.assertEqual(load_table_arrow(test_df, data_key_column='id'), 'Success: Data loaded in defaultnode table')
+        self.assertEqual(get_table_value('node', 'YBR043C', 'newint'), 10)
+        self.assertNotIn('__index_level_0__', get_table_column_names())
+
+        self.assertRaises(CyError, load_table_arrow, test_data, data_key_column='bogus')
+        self.assertRaises(CyError, load_table_arrow, test_data, data_key_column='id', table_key_column=None)
+
     @print_entry_exit
     def test_map_table_column(self):
         # Initialization